@@ -43,6 +43,13 @@ setup(
     extras_require={  # Optional
         'dev': ['pandas'],
         'test': ['pandas', 'pytest'],
+        'arrow': ['pyarrow'],
+        'store': ['numpy'],
+        'stream': ['ijson'],
+    },
+
+    entry_points={  # Optional
+        'console_scripts': ['aioyfinance=aioyfinance.cli:main'],
     },
 
     project_urls={  # Optional
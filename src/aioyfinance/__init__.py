@@ -1,3 +1,35 @@
 """__init__"""
-from aioyfinance.tickers import Ticker, Tickers
-from aioyfinance.base_requests import Config
+from importlib import import_module
+
+# submodules are imported on first access, import aioyfinance stays cheap
+_LAZY = {
+    'Ticker': 'aioyfinance.tickers',
+    'Tickers': 'aioyfinance.tickers',
+    'Config': 'aioyfinance.base_requests',
+    'download_universe': 'aioyfinance.bulk',
+    'Job': 'aioyfinance.jobs',
+    'Scheduler': 'aioyfinance.scheduler',
+    'BarStore': 'aioyfinance.store',
+    'request_priority': 'aioyfinance.priority',
+    'request_flow': 'aioyfinance.priority',
+    'SyncClient': 'aioyfinance.sync',
+    'warmup': 'aioyfinance.sessions',
+}
+
+# exports that need optional extras, star import must not fail without them
+_OPTIONAL = {'BarStore'}
+
+__all__ = [name for name in _LAZY if name not in _OPTIONAL]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f'module {__name__} has no attribute {name}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,5 @@
+"""python -m aioyfinance"""
+import sys
+from aioyfinance.cli import main
+
+sys.exit(main())
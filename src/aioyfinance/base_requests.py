@@ -3,14 +3,95 @@ Config and requests implementation
 """
 # pylint: disable=line-too-long
 from __future__ import annotations
+import json
 import logging
 import asyncio
 
-from asyncio import Semaphore, Lock
-from random import uniform, choice
+from asyncio import Lock
+from collections import deque
+from contextlib import nullcontext
+from inspect import signature
+from time import monotonic
+from random import uniform
 from typing import Union, Dict, AnyStr, List, Optional
 import aiohttp
-import aiohttp.web as aioweb
+from .proxies import ProxyPool
+from .breaker import CircuitBreaker, CircuitOpenError, endpoint_family
+from .urldict import ENDPOINTS
+from .sessions import shared_session
+from .negative import NegativeCache
+from .streaming import LimitedStream, check_ijson, parse_stream, read_body
+from .priority import PrioritySemaphore, PriorityWaiters, current_priority
+
+class LatencyStats:
+    """
+    recent latencies of successful requests and count of hedged requests
+    """
+    def __init__(self, size: int = 200, min_samples: int = 20):
+        self._latencies = deque(maxlen=size)
+        self.min_samples = min_samples
+        self.requests = 0
+        self.hedged = 0
+
+    def add(self, latency: float):
+        self._latencies.append(latency)
+
+    def percentile(self, share: float) -> Optional[float]:
+        """
+        :param share: from 0 to 1
+        :return: latency or None if there are not enough samples yet
+        """
+        if len(self._latencies) < self.min_samples:
+            return None
+
+        ordered = sorted(self._latencies)
+        return ordered[min(int(share * len(ordered)), len(ordered) - 1)]
+
+    def allow_hedge(self, fraction: float) -> bool:
+        """
+        counts hedge if it fits into fraction of all requests
+        """
+        if self.hedged + 1 > fraction * self.requests:
+            return False
+
+        self.hedged += 1
+        return True
+
+
+class RateLimiter:
+    """
+    spaces requests evenly, rate is requests per second
+    waiting requests get the next slot by priority, then in order of arrival
+    """
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._next = 0.
+        self._waiters = PriorityWaiters()
+        self._pacer: Optional[asyncio.Task] = None
+
+    async def wait(self):
+        now = monotonic()
+        if self._waiters.peek() is None and now >= self._next:
+            self._next = now + 1 / self.rate
+            return
+
+        future = self._waiters.add(current_priority())
+        if self._pacer is None or self._pacer.done() or self._pacer.get_loop().is_closed():
+            self._pacer = asyncio.ensure_future(self._pace())
+        await future
+
+    async def _pace(self):
+        """
+        wakes one waiter per slot until nobody waits
+        """
+        while self._waiters.peek() is not None:
+            delay = self._next - monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if self._waiters.peek() is not None:  # waiters may be cancelled while sleeping
+                self._next = max(monotonic(), self._next) + 1 / self.rate
+                self._waiters.wake()
+
 
 class Config:
     """
@@ -19,42 +100,133 @@ class Config:
     internal: Optional[Config] = None
     def __init__(self, parallel: bool = True, max_batch: int = 5, proxy_url: Union[AnyStr, List[AnyStr]] = None,
                  max_retries: int = 3, retry_delay: int = 1, max_rand_delay: float = 0.5, min_rand_delay: float = 0.01,
-                 handle_exceptions: bool = True):
+                 handle_exceptions: bool = True, connect_timeout: Optional[float] = 10,
+                 read_timeout: Optional[float] = 30, total_timeout: Optional[float] = 60,
+                 hedge_percentile: Optional[float] = None, hedge_fraction: float = 0.05,
+                 proxy_max_active: Optional[int] = None, proxy_rate: Optional[float] = None,
+                 proxy_eject_after: int = 3, proxy_eject_backoff: float = 30,
+                 breaker_threshold: Optional[int] = 5, breaker_reset: float = 30, rate: Optional[float] = None,
+                 reserved_slots: int = 0, max_body_size: Optional[int] = None, stream_json: bool = False,
+                 error_history: int = 1000, debug: bool = False, negative_ttl: Optional[float] = None,
+                 negative_path: Optional[AnyStr] = None, route_types: bool = False):
         """
         Do not use init directly, use create method
         """
         self.parallel = parallel
+        self.reserved_slots = reserved_slots
         self.max_batch = max_batch
+        self.max_body_size = max_body_size
+        if stream_json:
+            check_ijson()
+        self.stream_json = stream_json
+        self.error_history = error_history
+        self.debug = debug
+        self.negative_ttl = negative_ttl
+        self.negative_path = negative_path
+        self._negative_cache = None if negative_ttl is None else NegativeCache(negative_ttl, negative_path)
+        self.route_types = route_types
+        self.proxy_max_active = proxy_max_active
+        self.proxy_rate = proxy_rate
+        self.proxy_eject_after = proxy_eject_after
+        self.proxy_eject_backoff = proxy_eject_backoff
         self.proxy_url = proxy_url
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.max_rand_delay = max_rand_delay
         self.min_rand_delay = min_rand_delay
         self.handle_exceptions = handle_exceptions
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.total_timeout = total_timeout
+        self.hedge_percentile = hedge_percentile
+        self.hedge_fraction = hedge_fraction
+        self._latency = LatencyStats()
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset = breaker_reset
+        self._breakers: Dict[AnyStr, CircuitBreaker] = {}
+        self.rate = rate
 
     @classmethod
     def create(cls, *, parallel: bool = True, max_batch: int = 5, proxy_url: Union[AnyStr, List[AnyStr]] = None,
                max_retries: int = 3, retry_delay: int = 1, max_rand_delay: float = 0.5,
-               min_rand_delay: float = 0.01, handle_exceptions: bool = True) -> Config:
+               min_rand_delay: float = 0.01, handle_exceptions: bool = True, connect_timeout: Optional[float] = 10,
+               read_timeout: Optional[float] = 30, total_timeout: Optional[float] = 60,
+               hedge_percentile: Optional[float] = None, hedge_fraction: float = 0.05,
+               proxy_max_active: Optional[int] = None, proxy_rate: Optional[float] = None,
+               proxy_eject_after: int = 3, proxy_eject_backoff: float = 30,
+               breaker_threshold: Optional[int] = 5, breaker_reset: float = 30,
+               rate: Optional[float] = None, reserved_slots: int = 0, max_body_size: Optional[int] = None,
+               stream_json: bool = False, error_history: int = 1000, debug: bool = False,
+               negative_ttl: Optional[float] = None, negative_path: Optional[AnyStr] = None,
+               route_types: bool = False) -> Config:
         """
         Sets global settings variable, keywords only
         :param parallel: Controls overlapping of requests
         :param max_batch: Maximum requests active
         :param proxy_url: Set strings according to aiohttp docs
-        String or array of strings for random choice of proxy
+        String or array of strings, proxy is picked by its latency and error rate
         :param max_retries: Amount of retries if request fails
         :param retry_delay: Delay between retries
         :param max_rand_delay: Maximum random delay between requests
         :param min_rand_delay: Minimum random delay between requests
         :param handle_exceptions: Tickers returns tuple(list of results, list of tickers names that caught
             exceptions) if True or list of results with exceptions if False
+        :param connect_timeout: Seconds to connect, None for no limit
+        :param read_timeout: Seconds between reads of response, None for no limit
+        :param total_timeout: Seconds for a single attempt of request, None for no limit
+        :param hedge_percentile: Percentile of recent latencies, e.g. 0.95. If request is not finished by then
+            a duplicate is sent through another proxy if possible and the first response wins. None disables hedging
+        :param hedge_fraction: Maximum share of requests that can be hedged
+        :param proxy_max_active: Maximum requests active through one proxy, None for no limit
+        :param proxy_rate: Maximum requests per second through one proxy, None for no limit
+        :param proxy_eject_after: Failures in a row before proxy is ejected from the pool
+        :param proxy_eject_backoff: Seconds of the first ejection, doubles for every next one
+        :param breaker_threshold: Failed attempts in a row after which requests to the same endpoint family
+            (quote pages, chart, fundamentals) fail fast with CircuitOpenError, None disables breakers
+        :param breaker_reset: Seconds before a probe request is let through an open breaker
+        :param rate: Maximum requests per second, retries and hedges included, None for no limit
+        :param reserved_slots: Slots of max_batch that bulk priority requests can not take, kept free
+            for interactive and normal ones. Waiting requests get free slots and rate by priority anyway
+        :param max_body_size: Maximum bytes of response body, bigger ones raise streaming.BodyTooLarge
+            without retries. None for no limit
+        :param stream_json: Parse json while it arrives without keeping the whole body, chart columns
+            are built directly, fundamentals series without data are dropped as they arrive. Needs ijson
+        :param error_history: Error records kept by every Tickers, older ones are only counted
+        :param debug: Keep exceptions with tracebacks in error records
+        :param negative_ttl: Seconds symbols that failed with NameError (misspelled, delisted, ETF for
+            statistics, no data) are not requested again for the same kind, None disables negative cache
+        :param negative_path: SQLite file to keep negative cache between runs, in memory if None
+        :param route_types: Look up instrument type of symbol by a one day chart before requesting data
+            that only equities have (statements, html pages). Types learned from other requests are always used
         :return: global Config.internal class
         """
 
         Config.internal = cls(parallel=parallel, max_batch=max_batch, proxy_url=proxy_url, max_retries=max_retries,
                      retry_delay=retry_delay, max_rand_delay=max_rand_delay, min_rand_delay=min_rand_delay,
-                     handle_exceptions=handle_exceptions)
+                     handle_exceptions=handle_exceptions, connect_timeout=connect_timeout,
+                     read_timeout=read_timeout, total_timeout=total_timeout, hedge_percentile=hedge_percentile,
+                     hedge_fraction=hedge_fraction, proxy_max_active=proxy_max_active, proxy_rate=proxy_rate,
+                     proxy_eject_after=proxy_eject_after, proxy_eject_backoff=proxy_eject_backoff,
+                     breaker_threshold=breaker_threshold, breaker_reset=breaker_reset, rate=rate,
+                     reserved_slots=reserved_slots, max_body_size=max_body_size, stream_json=stream_json,
+                     error_history=error_history, debug=debug, negative_ttl=negative_ttl,
+                     negative_path=negative_path, route_types=route_types)
+
+        return Config.internal
 
+    def as_kwargs(self) -> Dict:
+        """
+        settings as keywords of create method, e.g. to make the same config in another process
+        """
+        return {name: getattr(self, name) for name in signature(self.create).parameters}
+
+    @classmethod
+    def get(cls) -> Config:
+        """
+        global config, default one is created on first use
+        """
+        if Config.internal is None:
+            cls.create()
         return Config.internal
 
     @property
@@ -67,19 +239,85 @@ class Config:
 
     @proxy_url.setter
     def proxy_url(self, proxy: Union[AnyStr, List[AnyStr]]):
-        if isinstance(proxy, List):
-            self._proxy_rand = True
+        if proxy is None:
+            self._proxy_pool = None
         else:
-            self._proxy_rand = False
+            self._proxy_pool = ProxyPool(proxy if isinstance(proxy, List) else [proxy],
+                                         max_active=self.proxy_max_active, rate=self.proxy_rate,
+                                         eject_after=self.proxy_eject_after, eject_backoff=self.proxy_eject_backoff)
 
         self._proxy_url = proxy
 
     @property
     def proxy(self):
-        if self._proxy_rand:
-            return choice(self._proxy_url)
+        if self._proxy_pool is None:
+            return None
 
-        return self._proxy_url
+        return self._proxy_pool.pick()
+
+    @property
+    def proxy_pool(self) -> Optional[ProxyPool]:
+        return self._proxy_pool
+
+    def proxy_stats(self) -> Dict[AnyStr, Dict]:
+        """
+        :return: dict proxy -> requests, errors, error_rate, latency, active, ejected
+        """
+        if self._proxy_pool is None:
+            return {}
+
+        return self._proxy_pool.stats()
+
+    def breaker(self, url: AnyStr) -> Optional[CircuitBreaker]:
+        """
+        breaker of url endpoint family, None if breakers are disabled or url is unknown
+        """
+        if self.breaker_threshold is None:
+            return None
+
+        family = endpoint_family(url, ENDPOINTS)
+        if family is None:
+            return None
+
+        if family not in self._breakers:
+            self._breakers[family] = CircuitBreaker(family, self.breaker_threshold, self.breaker_reset)
+        return self._breakers[family]
+
+    def breaker_states(self) -> Dict[AnyStr, Dict]:
+        """
+        :return: dict endpoint family -> state and failures
+        """
+        return {family: breaker.as_dict() for family, breaker in self._breakers.items()}
+
+    @property
+    def negative_cache(self) -> Optional[NegativeCache]:
+        return self._negative_cache
+
+    @property
+    def rate(self):
+        return self._rate
+
+    @rate.setter
+    def rate(self, value: Optional[float]):
+        self._rate = value
+        self._rate_limiter = None if value is None else RateLimiter(value)
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        return self._rate_limiter
+
+    @property
+    def latency(self) -> LatencyStats:
+        return self._latency
+
+    def hedge_delay(self) -> Optional[float]:
+        """
+        seconds to wait before sending a duplicate request, None if request should not be hedged
+        """
+        if self.hedge_percentile is None:
+            return None
+
+        return self._latency.percentile(self.hedge_percentile)
 
     @property
     def parallel(self):
@@ -101,7 +339,12 @@ class Config:
     @max_batch.setter
     def max_batch(self, value: int):
         self._max_batch = value
-        self._semaphore_batch = Semaphore(self._max_batch)
+        self._semaphore_batch = PrioritySemaphore(self._max_batch, self.reserved_slots)
+
+    @property
+    def timeout(self) -> aiohttp.ClientTimeout:
+        return aiohttp.ClientTimeout(total=self.total_timeout, sock_connect=self.connect_timeout,
+                                     sock_read=self.read_timeout)
 
     @property
     def lock(self):
@@ -112,48 +355,167 @@ class Config:
         return self._semaphore_batch
 
 
-Config.create()
-
-
 class BaseRequest:
     @staticmethod
     async def get(url: AnyStr, is_json=False) -> Union[Dict, AnyStr]:
+        config = Config.get()  # same config for acquire and release even if global one is replaced
+
+        breaker = config.breaker(url)
+        if breaker is not None and breaker.is_open():  # fail fast without waiting for a slot
+            breaker.check()
+
+        # slots are released even if request is cancelled or times out
+        async with config.semaphore_batch:
+            if not config.parallel:
+                await config.lock.acquire()
+            try:
+                result = await BaseRequest._retry(config, url, is_json)
+            finally:
+                if not config.parallel:
+                    config.lock.release()
+
+        await asyncio.sleep(0)  # next code is computational, let other requests finish
+
+        if isinstance(result, Exception):  # ensure that everything is released, then raise
+            raise result
 
-        await Config.internal.semaphore_batch.acquire()
-        if not Config.internal.parallel:
-            await Config.internal.lock.acquire()
+        return result
 
-        await asyncio.sleep(Config.internal.pick_rand_delay)
+    @staticmethod
+    async def _retry(config: Config, url: AnyStr, is_json: bool) -> Union[Dict, AnyStr, Exception]:
+        """
+        makes request until it succeeds or retries run out
+        :return: result or last exception
+        """
+        await asyncio.sleep(config.pick_rand_delay)
 
-        async with aiohttp.ClientSession() as session:
+        session = shared_session()
+        # persistent session of the loop is kept open, otherwise request has its own
+        async with nullcontext(session) if session is not None else aiohttp.ClientSession() as session:
 
-            retries = Config.internal.max_retries
+            retries = config.max_retries
 
             while retries > 0:
-                async with session.get(url, proxy=Config.internal.proxy) as resp:
-                    try:
-                        if not is_json:
-                            result = await resp.text()
-                        else:
-                            result = await resp.json()
-
-                    except aioweb.HTTPError as e:
-                        logging.error(url + ' ' + repr(e))
-                        retries -= 1
-                        if retries:  # if > 0
-                            await asyncio.sleep(Config.internal.retry_delay)
-                        else:
-                            result = e
+                try:
+                    result = await BaseRequest._hedged(config, session, url, is_json)
+
+                except CircuitOpenError as e:  # retrying would not help
+                    result = e
+                    break
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logging.error(url + ' ' + repr(e))
+                    retries -= 1
+                    if retries:  # if > 0
+                        await asyncio.sleep(config.retry_delay)
                     else:
-                        break
+                        result = e
+                else:
+                    break
 
-            Config.internal.semaphore_batch.release()
-            if not Config.internal.parallel:
-                Config.internal.lock.release()
+        if isinstance(result, Exception):
+            result.attempts = config.max_retries - retries  # failed attempts, for error records
+        return result
 
-            await asyncio.sleep(0)  # next code is computational, let other requests finish
+    @staticmethod
+    async def _hedged(config: Config, session: aiohttp.ClientSession, url: AnyStr,
+                      is_json: bool) -> Union[Dict, AnyStr]:
+        """
+        single attempt, duplicate is sent if response is slower than hedge percentile
+        first successful response wins, the other one is cancelled
+        """
+        config.latency.requests += 1
+        delay = config.hedge_delay()
+        if delay is None:
+            return await BaseRequest._attempt(config, session, url, is_json)
+
+        used = []  # proxies taken by attempts
+        tasks = [asyncio.ensure_future(BaseRequest._attempt(config, session, url, is_json, used=used))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and config.latency.allow_hedge(config.hedge_fraction):
+                logging.debug('hedging ' + url)
+                tasks.append(asyncio.ensure_future(
+                    BaseRequest._attempt(config, session, url, is_json, exclude=used[0] if used else None)))
+
+            error = None
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    return await next_done
+                except (aiohttp.ClientError, asyncio.TimeoutError, CircuitOpenError) as e:
+                    error = error or e
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    async def _attempt(config: Config, session: aiohttp.ClientSession, url: AnyStr, is_json: bool,
+                       exclude: Optional[AnyStr] = None, used: Optional[List] = None) -> Union[Dict, AnyStr]:
+        """
+        single request, latency of successful one is saved
+        proxy is taken from the pool and scored by the result, so is the endpoint breaker
+        raises CircuitOpenError without request if breaker is open
+        :param exclude: proxy to avoid if possible
+        :param used: list to append picked proxy to
+        """
+        breaker = config.breaker(url)
+        if breaker is not None:
+            breaker.check()
+
+        if config.rate_limiter is not None:
+            await config.rate_limiter.wait()
+
+        try:
+            result = await BaseRequest._proxied(config, session, url, is_json, exclude, used)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if breaker is not None:
+                breaker.failure()
+            raise
+        except BaseException:
+            if breaker is not None:
+                breaker.abort()
+            raise
+
+        if breaker is not None:
+            breaker.success()
+        return result
 
-            if isinstance(result, Exception):  # ensure that everything is released, then raise
-                raise result
+    @staticmethod
+    async def _proxied(config: Config, session: aiohttp.ClientSession, url: AnyStr, is_json: bool,
+                       exclude: Optional[AnyStr] = None, used: Optional[List] = None) -> Union[Dict, AnyStr]:
+        """
+        request through proxy from the pool
+        throttling and server errors are raised as aiohttp.ClientResponseError to be retried
+        """
+        pool = config.proxy_pool
+        proxy = None if pool is None else await pool.acquire(exclude)
+        if used is not None:
+            used.append(proxy)
+
+        latency = None
+        failed = False
+        start = asyncio.get_running_loop().time()
+        try:
+            async with session.get(url, proxy=proxy, timeout=config.timeout) as resp:
+                if resp.status == 429 or resp.status >= 500:
+                    resp.raise_for_status()
+                if is_json and config.stream_json:
+                    result = await parse_stream(url, LimitedStream(resp, config.max_body_size))
+                elif config.max_body_size is not None:
+                    body = await read_body(LimitedStream(resp, config.max_body_size))
+                    result = json.loads(body) if is_json else body.decode(resp.get_encoding())
+                elif not is_json:
+                    result = await resp.text()
+                else:
+                    result = await resp.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            failed = True
+            raise
+        else:
+            latency = asyncio.get_running_loop().time() - start
+            config.latency.add(latency)
+        finally:
+            if pool is not None:
+                pool.release(proxy, latency, failed)
 
-            return result
+        return result
@@ -0,0 +1,95 @@
+"""
+Circuit breakers for endpoint families
+"""
+from time import monotonic
+from typing import AnyStr, Optional
+
+
+class CircuitOpenError(Exception):
+    """
+    raised instead of request when endpoint family is failing
+    """
+
+
+class CircuitBreaker:
+    """
+    opens after threshold failures in a row, then after reset_timeout
+    lets a single probe through and closes again if it succeeds
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: AnyStr, threshold: int = 5, reset_timeout: float = 30):
+        """
+        :param name: endpoint family
+        :param threshold: failures in a row that open circuit
+        :param reset_timeout: seconds before probe request is allowed
+        """
+        self.name = name
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.
+        self._probing = False
+
+    def is_open(self) -> bool:
+        """
+        True if requests are refused and it is not time to probe yet
+        """
+        return self.state == self.OPEN and monotonic() - self._opened_at < self.reset_timeout
+
+    def check(self):
+        """
+        raises CircuitOpenError if request is not allowed now,
+        every allowed request has to be finished with success, failure or abort
+        """
+        if self.state == self.OPEN:
+            if monotonic() - self._opened_at < self.reset_timeout:
+                raise CircuitOpenError(f'{self.name} endpoints are failing, retry in '
+                                       f'{self.reset_timeout - (monotonic() - self._opened_at):.0f}s')
+            self.state = self.HALF_OPEN
+
+        if self.state == self.HALF_OPEN:
+            if self._probing:
+                raise CircuitOpenError(f'{self.name} endpoints are being probed')
+            self._probing = True
+
+    def success(self):
+        self._probing = False
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def failure(self):
+        self._probing = False
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+            self.state = self.OPEN
+            self._opened_at = monotonic()
+
+    def abort(self):
+        """
+        request ended without result, e.g. was cancelled
+        """
+        self._probing = False
+        if self.state == self.HALF_OPEN:
+            self.state = self.OPEN  # probe again when the next request comes
+
+    def as_dict(self) -> dict:
+        return {
+            'state': self.state,
+            'failures': self.failures,
+        }
+
+
+def endpoint_family(url: AnyStr, families: dict) -> Optional[AnyStr]:
+    """
+    :param url: requested url
+    :param families: dict url prefix -> family name
+    :return: family name or None for unknown urls
+    """
+    for prefix, family in families.items():
+        if url.startswith(prefix):
+            return family
+    return None
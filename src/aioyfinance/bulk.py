@@ -0,0 +1,140 @@
+"""
+Bulk downloader sharding big universes between processes
+"""
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import AnyStr, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from .base_requests import Config
+from .tickers import Tickers
+from .priority import request_priority
+from .sessions import open_session, close_session
+
+# kind -> Tickers method and its default keywords
+KINDS = {
+    'timeseries': ('get_timeseries', {'interval': '1d', 'range_': '1y'}),
+    'statistics': ('get_statistics', {}),
+    'profile': ('get_profiles', {}),
+    'analysis': ('get_analysis', {}),
+    'holders': ('get_holders', {}),
+    'income': ('get_income', {}),
+    'balance': ('get_balance', {}),
+    'cashflow': ('get_cashflow', {}),
+    'fundamentals': ('get_fundamentals', {}),
+}
+
+
+def parse_kinds(kinds: Union[Iterable[AnyStr], Dict[AnyStr, Dict]]) -> Dict[AnyStr, Dict]:
+    """
+    :param kinds: names from KINDS or dict name -> keywords of Tickers method
+    :return: dict name -> full keywords
+    """
+    if not isinstance(kinds, dict):
+        kinds = {kind: {} for kind in kinds}
+
+    parsed = {}
+    for kind, kwargs in kinds.items():
+        if kind not in KINDS:
+            raise ValueError(f'unknown kind {kind}, use any of {tuple(KINDS)}')
+        parsed[kind] = {**KINDS[kind][1], **(kwargs or {})}
+    return parsed
+
+
+def shard_config(settings: Dict, workers: int) -> Dict:
+    """
+    splits concurrency and rates between workers
+    :param settings: keywords of Config.create
+    :return: keywords of a single worker config
+    """
+    shard = dict(settings, handle_exceptions=True)
+    shard['max_batch'] = max(1, settings['max_batch'] // workers)
+    if settings.get('rate'):
+        shard['rate'] = settings['rate'] / workers
+    if settings.get('proxy_rate'):
+        shard['proxy_rate'] = settings['proxy_rate'] / workers
+    if settings.get('proxy_max_active'):
+        shard['proxy_max_active'] = max(1, settings['proxy_max_active'] // workers)
+    return shard
+
+
+async def download(symbols: List[AnyStr], kinds: Dict[AnyStr, Dict]) -> Tuple[Dict, Dict]:
+    """
+    downloads every kind for symbols on the running loop, kinds are requested concurrently
+    with bulk priority, interactive and normal requests of the same process go first
+    :return: dict kind -> symbol -> value and dict kind -> symbol -> repr(exception)
+    """
+    async def one(kind, kwargs):
+        method, _ = KINDS[kind]
+        return await getattr(Tickers(symbols), method)(**kwargs)
+
+    with request_priority('bulk'):
+        completed = await asyncio.gather(*[one(kind, kwargs) for kind, kwargs in kinds.items()])
+    results = {}
+    errors = {}
+    for kind, value in zip(kinds, completed):
+        if isinstance(value, tuple):
+            results[kind], errors[kind] = value
+        else:  # handle_exceptions is off, exceptions are mixed with results
+            results[kind] = {symbol: data for symbol, data in value.items() if not isinstance(data, Exception)}
+            errors[kind] = {symbol: repr(data) for symbol, data in value.items() if isinstance(data, Exception)}
+    return results, errors
+
+
+def _run_shard(symbols: List[AnyStr], kinds: Dict[AnyStr, Dict], settings: Dict) -> Tuple[Dict, Dict]:
+    """
+    entry point of worker process, every shard runs on its own loop
+    with its own session, requests of the shard reuse its connections
+    """
+    async def run():
+        Config.create(**settings)
+        await open_session()
+        try:
+            return await download(symbols, kinds)
+        finally:
+            await close_session()
+
+    return asyncio.run(run())
+
+
+def download_universe(symbols: Iterable[AnyStr], kinds: Union[Iterable[AnyStr], Dict[AnyStr, Dict]],
+                      workers: int = 4, chunk_size: int = 200, config: Optional[Config] = None,
+                      sink: Optional[Callable[[AnyStr, AnyStr, object], None]] = None) -> Tuple[Dict, Dict]:
+    """
+    shards symbols between worker processes, each has its own event loop
+    and its share of concurrency and rates from config
+    :param symbols: symbols to download
+    :param kinds: names from KINDS or dict name -> keywords of Tickers method,
+        e.g. {'timeseries': {'interval': '1wk', 'range_': '5y'}, 'statistics': {}}
+    :param workers: amount of processes
+    :param chunk_size: symbols in a single shard, results arrive shard by shard
+    :param config: settings for workers, global config if None
+    :param sink: called with (kind, symbol, value) for every result as shards finish,
+        results are not kept in memory then
+    :return: dict kind -> symbol -> value (empty if sink is used) and
+        dict kind -> symbol -> repr(exception), failed shard reports its error for all of its symbols
+    """
+    kinds = parse_kinds(kinds)
+    symbols = list(dict.fromkeys(symbols))
+    settings = shard_config((config or Config.get()).as_kwargs(), workers)
+    shards = [symbols[i:i + chunk_size] for i in range(0, len(symbols), chunk_size)]
+
+    results = {kind: {} for kind in kinds}
+    errors = {kind: {} for kind in kinds}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_run_shard, shard, kinds, settings): shard for shard in shards}
+        for future in as_completed(futures):
+            try:
+                shard_results, shard_errors = future.result()
+            except Exception as e:  # worker died or shard failed as a whole
+                for kind in kinds:
+                    errors[kind].update({symbol: repr(e) for symbol in futures[future]})
+                continue
+
+            for kind in kinds:
+                errors[kind].update(shard_errors[kind])
+                if sink is None:
+                    results[kind].update(shard_results[kind])
+                else:
+                    for symbol, value in shard_results[kind].items():
+                        sink(kind, symbol, value)
+
+    return results, errors
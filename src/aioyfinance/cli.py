@@ -0,0 +1,141 @@
+"""
+Command line bulk downloader
+
+python -m aioyfinance symbols.txt --kinds timeseries,statistics --output data.ndjson
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from typing import AnyStr, Dict, List, Optional, Set
+from .base_requests import Config
+from .bulk import KINDS, parse_kinds, download, download_universe
+from .fundamentals import STATEMENTS, statement_series
+from .sessions import open_session, close_session
+from .writers import make_writer
+
+
+def read_symbols(path: AnyStr) -> List[AnyStr]:
+    """
+    symbols separated by whitespace or commas, - for stdin
+    """
+    if path == '-':
+        text = sys.stdin.read()
+    else:
+        with open(path, encoding='utf-8') as file:
+            text = file.read()
+    return list(dict.fromkeys(text.replace(',', ' ').split()))
+
+
+def kinds_from_args(args) -> Dict[AnyStr, Dict]:
+    fields = args.fields.split(',') if args.fields else None
+    kinds = {}
+    for kind in args.kinds.split(','):
+        if kind == 'timeseries':
+            kinds[kind] = {'interval': args.interval, 'range_': args.range}
+        elif kind in STATEMENTS:
+            # --fields is shared by all statements, every one gets its own series
+            own = None if fields is None else [field for field in fields if field in statement_series(kind)]
+            if own == []:
+                raise ValueError(f'none of --fields are {kind} series')
+            kinds[kind] = {'annual': not args.quarterly, 'fields': own}
+        elif kind == 'fundamentals':
+            kinds[kind] = {'frequencies': ('quarterly',) if args.quarterly else ('annual',), 'fields': fields}
+        else:
+            kinds[kind] = {}
+    return parse_kinds(kinds)
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='aioyfinance', description='Yahoo Finance bulk downloader')
+    parser.add_argument('symbols', help='file with symbols separated by whitespace or commas, - for stdin')
+    parser.add_argument('-o', '--output', required=True,
+                        help='ndjson file or directory for parquet and arrow parts')
+    parser.add_argument('-f', '--format', choices=('ndjson', 'parquet', 'arrow'), default='ndjson')
+    parser.add_argument('-k', '--kinds', default='timeseries', help=f'comma separated, any of {",".join(KINDS)}')
+    parser.add_argument('--interval', default='1d', help='timeseries granularity')
+    parser.add_argument('--range', default='1y', help='timeseries range')
+    parser.add_argument('--quarterly', action='store_true', help='quarterly statements instead of annual')
+    parser.add_argument('--fields', help='comma separated statement series, every series if not set')
+    parser.add_argument('--max-batch', type=int, default=5, help='maximum requests active')
+    parser.add_argument('--rate', type=float, help='maximum requests per second')
+    parser.add_argument('--proxy', action='append', help='proxy url, can be repeated')
+    parser.add_argument('--retries', type=int, default=3)
+    parser.add_argument('--timeout', type=float, default=60, help='seconds for a single attempt of request')
+    parser.add_argument('--workers', type=int, default=1, help='processes, more than 1 shards symbols')
+    parser.add_argument('--chunk-size', type=int, default=200, help='symbols downloaded and written together')
+    parser.add_argument('--negative-ttl', type=float,
+                        help='seconds symbols that failed with no data are not requested again, off if not set')
+    parser.add_argument('--negative-path', help='SQLite file to keep failed symbols between runs, needs --negative-ttl')
+    parser.add_argument('--no-resume', action='store_true', help='start over, output of previous run is removed')
+    return parser
+
+
+async def _run_chunks(symbols: List[AnyStr], kinds: Dict[AnyStr, Dict], settings: Dict, writer,
+                      chunk_size: int, done: Set) -> Dict[AnyStr, Dict]:
+    """
+    downloads chunk by chunk on this loop, every chunk is written before the next one starts
+    :param done: (kind, symbol) written by previous run, they are not written again
+    """
+    Config.create(**settings)
+    await open_session()  # chunks reuse connections of the run
+    errors = {kind: {} for kind in kinds}
+    try:
+        for i in range(0, len(symbols), chunk_size):
+            results, chunk_errors = await download(symbols[i:i + chunk_size], kinds)
+            for kind in kinds:
+                for symbol, value in results[kind].items():
+                    if (kind, symbol) not in done:
+                        writer.write(kind, symbol, value)
+                errors[kind].update(chunk_errors[kind])
+            writer.flush()
+            logging.info('%d of %d symbols done', min(i + chunk_size, len(symbols)), len(symbols))
+    finally:
+        await close_session()
+    return errors
+
+
+def main(argv: Optional[List[AnyStr]] = None) -> int:
+    parser = make_parser()
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    try:
+        kinds = kinds_from_args(args)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.negative_path and args.negative_ttl is None:
+        parser.error('--negative-path needs --negative-ttl')
+    writer = make_writer(args.output, args.format, args.chunk_size)
+    symbols = read_symbols(args.symbols)
+
+    if args.no_resume:  # rows of previous run would be written twice
+        writer.clear()
+    done = writer.done()
+    # every kind of symbol has to be done to skip it
+    symbols = [symbol for symbol in symbols if any((kind, symbol) not in done for kind in kinds)]
+    if done:
+        logging.info('resuming, %d symbols left', len(symbols))
+
+    settings = dict(Config.get().as_kwargs(), max_batch=args.max_batch, rate=args.rate,
+                    proxy_url=args.proxy, max_retries=args.retries, total_timeout=args.timeout,
+                    negative_ttl=args.negative_ttl, negative_path=args.negative_path, handle_exceptions=True)
+    try:
+        if args.workers > 1:
+            def sink(kind, symbol, value):
+                if (kind, symbol) not in done:
+                    writer.write(kind, symbol, value)
+
+            _, errors = download_universe(symbols, kinds, workers=args.workers, chunk_size=args.chunk_size,
+                                          config=Config(**settings), sink=sink)
+        else:
+            errors = asyncio.run(_run_chunks(symbols, kinds, settings, writer, args.chunk_size, done))
+    finally:
+        writer.close()
+
+    failed = 0
+    for kind, excepted in errors.items():
+        for symbol, error in excepted.items():
+            failed += 1
+            print(f'{kind} {symbol} {error}', file=sys.stderr)
+    return 1 if failed else 0
@@ -0,0 +1,63 @@
+"""
+Compact records of failed requests, full exceptions are kept only for debugging
+"""
+from collections import Counter, deque
+from time import time
+from typing import AnyStr, Dict, Iterator, NamedTuple, Optional
+
+
+class ErrorRecord(NamedTuple):
+    symbol: AnyStr
+    operation: AnyStr  # getter name
+    error: AnyStr  # exception class name
+    message: AnyStr
+    status: Optional[int]  # HTTP status if response failed
+    attempts: Optional[int]  # failed attempts of request, None if it failed without retries
+    time: float
+    exception: Optional[BaseException] = None  # only in debug mode
+
+
+class ErrorLog:
+    """
+    ring buffer of the last error records and counters of all errors
+    """
+    MAX_MESSAGE = 200
+
+    def __init__(self, size: int = 1000, debug: bool = False):
+        """
+        :param size: records kept, older ones are dropped but stay counted
+        :param debug: keep exceptions with their tracebacks in records
+        """
+        self.records = deque(maxlen=size)
+        self.debug = debug
+        self.total = 0
+        self.by_error = Counter()
+        self.by_operation = Counter()
+
+    def add(self, symbol: AnyStr, operation: AnyStr, exception: BaseException) -> ErrorRecord:
+        record = ErrorRecord(symbol, operation, type(exception).__name__, str(exception)[:self.MAX_MESSAGE],
+                             getattr(exception, 'status', None), getattr(exception, 'attempts', None), time(),
+                             exception if self.debug else None)
+        self.records.append(record)
+        self.total += 1
+        self.by_error[record.error] += 1
+        self.by_operation[operation] += 1
+        return record
+
+    def summary(self) -> Dict:
+        """
+        :return: total and counts by error class and by operation
+        """
+        return {'total': self.total, 'errors': dict(self.by_error), 'operations': dict(self.by_operation)}
+
+    def clear(self):
+        self.records.clear()
+        self.total = 0
+        self.by_error.clear()
+        self.by_operation.clear()
+
+    def __iter__(self) -> Iterator[ErrorRecord]:
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self.records)
@@ -0,0 +1,218 @@
+"""
+fundamentals-timeseries request planning
+
+urls are built from the series registry, statements type lists are merged
+into as few requests as url length allows, responses are split back into per statement jsons
+"""
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, Dict, Tuple, Iterable, AnyStr, Optional
+from .urldict import FUNDAMENTALS_URL, FUNDAMENTAL_FORMATTER
+from .series import SERIES, PREFIXES
+
+STATEMENTS = tuple(SERIES)
+FREQUENCIES = tuple(PREFIXES)
+
+FUND_QUERY = '?lang={lang}&region={region}&padTimeSeries=true&type='
+FUND_QUERY_END = '&merge=false&corsDomain=finance.yahoo.com'
+TYPE_SEPARATOR = '%2C'
+
+# longest url of the single statement queries (quarterly balance, 9858 characters) is served fine,
+# longer urls are not known to be, so merged urls are kept under the same length.
+# A single statement already takes 6.5k-9.9k characters, so merging saves requests only where
+# statements fit together: both frequencies of one statement go in 1 url instead of 2, all six
+# statement and frequency pairs in 4 instead of 6, but three annual statements still need 3.
+# Requesting fields instead of whole statements makes urls much shorter, see select_fields
+MAX_URL_LENGTH = 10240
+
+# how far back data is requested for each frequency
+PERIODS = {
+    'annual': timedelta(days=5 * 444),
+    'quarterly': timedelta(days=2 * 444)
+}
+
+
+def statement_pairs(statements: Iterable[AnyStr], frequencies: Iterable[AnyStr]) -> List[Tuple[AnyStr, AnyStr]]:
+    """
+    validates arguments and makes (statement, frequency) pairs
+    :param statements: any of STATEMENTS
+    :param frequencies: any of FREQUENCIES
+    :return: list of pairs without duplicates
+    """
+    if isinstance(statements, str):
+        statements = (statements,)
+    if isinstance(frequencies, str):
+        frequencies = (frequencies,)
+
+    pairs = []
+    for statement in statements:
+        if statement not in STATEMENTS:
+            raise ValueError(f'unknown statement {statement}, use any of {STATEMENTS}')
+        for frequency in frequencies:
+            if frequency not in FREQUENCIES:
+                raise ValueError(f'unknown frequency {frequency}, use any of {FREQUENCIES}')
+            if (statement, frequency) not in pairs:
+                pairs.append((statement, frequency))
+    return pairs
+
+
+def statement_series(statement: AnyStr) -> Tuple[AnyStr, ...]:
+    """
+    series names known for a statement, e.g. NetIncome, TotalRevenue
+    """
+    return SERIES[statement]
+
+
+def select_fields(statements: Iterable[AnyStr], fields: Optional[Iterable[AnyStr]]
+                  ) -> Dict[AnyStr, Optional[Tuple[AnyStr, ...]]]:
+    """
+    distributes requested fields between statements
+    :param statements: any of STATEMENTS
+    :param fields: series names or None for every series
+    :return: dict statement -> sorted tuple of its fields or None if every series is needed,
+        statements without any of the fields are left out
+    """
+    if fields is None:
+        return {statement: None for statement in statements}
+    if isinstance(fields, str):
+        fields = (fields,)
+
+    fields = set(fields)
+    selected = {}
+    known = set()
+    for statement in statements:
+        series = fields.intersection(statement_series(statement))
+        known.update(series)
+        if series:
+            selected[statement] = tuple(sorted(series))
+
+    if unknown := fields - known:
+        raise ValueError(f'unknown series {", ".join(sorted(unknown))} for {", ".join(statements)}')
+    return selected
+
+
+@lru_cache(maxsize=256)
+def statement_types(statement: AnyStr, frequency: AnyStr, fields: Optional[Tuple[AnyStr, ...]] = None
+                    ) -> Tuple[AnyStr, ...]:
+    """
+    type names requested for a statement, e.g. annualNetIncome, trailingNetIncome
+    :param fields: subset of statement_series or None for every series
+    """
+    names = statement_series(statement) if fields is None else fields
+    return tuple(prefix + name for name in names for prefix in PREFIXES[frequency])
+
+
+@lru_cache(maxsize=256)
+def build_query(types: Tuple[AnyStr, ...], region: AnyStr = 'US', lang: AnyStr = 'en-US') -> AnyStr:
+    """
+    query part of the url without period and symbol, see FUNDAMENTAL_FORMATTER
+    :param types: full type names, e.g. made by statement_types
+    :return: query string starting with ?
+    """
+    return FUND_QUERY.format(lang=lang, region=region) + TYPE_SEPARATOR.join(types) + FUND_QUERY_END
+
+
+@lru_cache(maxsize=256)
+def _plan_queries(types: Tuple[AnyStr, ...], room: int, region: AnyStr, lang: AnyStr) -> Tuple[AnyStr, ...]:
+    """
+    splits types into queries not longer than room
+    """
+    fixed = len(build_query((), region, lang))
+    queries = []
+    chunk = []
+    length = fixed
+    for type_ in types:
+        added = len(type_) + (len(TYPE_SEPARATOR) if chunk else 0)
+        if chunk and length + added > room:
+            queries.append(build_query(tuple(chunk), region, lang))
+            chunk = []
+            added = len(type_)
+            length = fixed
+        chunk.append(type_)
+        length += added
+
+    if chunk:
+        queries.append(build_query(tuple(chunk), region, lang))
+    return tuple(queries)
+
+
+def project(stripped: Dict, fields: Tuple[AnyStr, ...]) -> Dict:
+    """
+    leaves only fields in dictionary made by strip_old_json
+    """
+    return {mod: {name: value for name, value in series.items() if name in fields}
+            for mod, series in stripped.items()}
+
+
+def plan_urls(symbol: AnyStr, pairs: List[Tuple[AnyStr, AnyStr]], now: datetime,
+              fields: Optional[Dict[AnyStr, Optional[Tuple[AnyStr, ...]]]] = None,
+              max_length: int = MAX_URL_LENGTH, region: AnyStr = 'US', lang: AnyStr = 'en-US') -> List[AnyStr]:
+    """
+    merges type lists of all pairs and splits them into urls not longer than max_length
+    period covers the longest frequency requested, see MAX_URL_LENGTH for how many urls that takes
+    :param symbol: ticker name
+    :param pairs: (statement, frequency) pairs
+    :param now: end of the period
+    :param fields: dict statement -> fields as made by select_fields, None for every series
+    :param max_length: maximum length of a single url
+    :param region: region query parameter
+    :param lang: lang query parameter
+    :return: list of urls
+    """
+    types = []
+    seen = set()
+    for pair in pairs:
+        for type_ in statement_types(*pair, (fields or {}).get(pair[0])):
+            if type_ not in seen:  # trailing types are shared between frequencies
+                seen.add(type_)
+                types.append(type_)
+
+    delta = max(PERIODS[frequency] for _, frequency in pairs)
+    head = FUNDAMENTALS_URL + symbol
+    tail = FUNDAMENTAL_FORMATTER.format(period1=round((now - delta).timestamp()), period2=round(now.timestamp()),
+                                        symbol=symbol)
+    queries = _plan_queries(tuple(types), max_length - len(head) - len(tail), region, lang)
+    return [head + query + tail for query in queries]
+
+
+def _trim_result(result: Dict, since: float) -> Dict:
+    """
+    drops values older than since from a single timeseries result
+    """
+    if 'timestamp' not in result:
+        return result
+
+    full_name = result['meta']['type'][0]
+    keep = [i for i, stamp in enumerate(result['timestamp']) if stamp >= since]
+    trimmed = dict(result)
+    trimmed['timestamp'] = [result['timestamp'][i] for i in keep]
+    if full_name in result:
+        values = result[full_name]
+        trimmed[full_name] = [values[i] for i in keep if i < len(values)]
+    return trimmed
+
+
+def split_results(fund_jsons: List[Dict], pairs: List[Tuple[AnyStr, AnyStr]], now: datetime,
+                  fields: Optional[Dict[AnyStr, Optional[Tuple[AnyStr, ...]]]] = None
+                  ) -> Dict[Tuple[AnyStr, AnyStr], Dict]:
+    """
+    splits merged responses back into jsons of single statements
+    each of them is shaped like a response of a single statement request and can be passed to strip_old_json
+    :param fund_jsons: responses from urls made by plan_urls
+    :param pairs: (statement, frequency) pairs
+    :param now: end of the period used in plan_urls
+    :param fields: fields used in plan_urls
+    :return: dict (statement, frequency) -> fundamentals json
+    """
+    results = {}
+    for fund_json in fund_jsons:
+        for result in fund_json['timeseries']['result'] or []:
+            results[result['meta']['type'][0]] = result
+
+    split = {}
+    for statement, frequency in pairs:
+        since = (now - PERIODS[frequency]).timestamp()
+        types = statement_types(statement, frequency, (fields or {}).get(statement))
+        inside = [_trim_result(results[type_], since) for type_ in types if type_ in results]
+        split[(statement, frequency)] = {'timeseries': {'result': inside}}
+    return split
@@ -0,0 +1,137 @@
+"""
+Resumable jobs with a SQLite journal of per symbol progress
+"""
+import asyncio
+import json
+import sqlite3
+from time import time
+from typing import AnyStr, Dict, Iterable, List, Optional, Tuple, Union
+from .bulk import parse_kinds, download
+
+PENDING = 'pending'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class Journal:
+    """
+    SQLite file with status, error and result of every (kind, symbol)
+    """
+    def __init__(self, path: AnyStr):
+        self._db = sqlite3.connect(path)
+        self._db.executescript('''
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS tasks (
+                kind TEXT, symbol TEXT, status TEXT, error TEXT, attempts INTEGER DEFAULT 0,
+                updated REAL, result TEXT, PRIMARY KEY (kind, symbol)
+            );
+        ''')
+
+    def close(self):
+        self._db.close()
+
+    def check_kinds(self, kinds: Dict[AnyStr, Dict]):
+        """
+        saves keywords of kinds, journal of another job is refused
+        """
+        saved = json.dumps(kinds, sort_keys=True, default=str)
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'kinds'").fetchone()
+        if row is None:
+            self._db.execute("INSERT INTO meta VALUES ('kinds', ?)", (saved,))
+            self._db.commit()
+        elif row[0] != saved:
+            raise ValueError(f'journal was made for other kinds {row[0]}')
+
+    def add(self, kind: AnyStr, symbols: Iterable[AnyStr]):
+        self._db.executemany('INSERT OR IGNORE INTO tasks (kind, symbol, status) VALUES (?, ?, ?)',
+                             [(kind, symbol, PENDING) for symbol in symbols])
+        self._db.commit()
+
+    def queued(self, kind: AnyStr, max_attempts: Optional[int] = None) -> List[AnyStr]:
+        """
+        pending symbols and failed ones that have attempts left
+        """
+        rows = self._db.execute('SELECT symbol, status, attempts FROM tasks WHERE kind = ? AND status != ?',
+                                (kind, DONE))
+        return [symbol for symbol, status, attempts in rows
+                if status == PENDING or max_attempts is None or attempts < max_attempts]
+
+    def save(self, kind: AnyStr, results: Dict, errors: Dict):
+        now = time()
+        self._db.executemany('UPDATE tasks SET status = ?, error = NULL, attempts = attempts + 1, updated = ?, '
+                             'result = ? WHERE kind = ? AND symbol = ?',
+                             [(DONE, now, json.dumps(value, default=str), kind, symbol)
+                              for symbol, value in results.items()])
+        self._db.executemany('UPDATE tasks SET status = ?, error = ?, attempts = attempts + 1, updated = ? '
+                             'WHERE kind = ? AND symbol = ?',
+                             [(FAILED, error, now, kind, symbol) for symbol, error in errors.items()])
+        self._db.commit()
+
+    def results(self, kind: AnyStr) -> Dict:
+        rows = self._db.execute('SELECT symbol, result FROM tasks WHERE kind = ? AND status = ?', (kind, DONE))
+        return {symbol: json.loads(result) for symbol, result in rows}
+
+    def failures(self, kind: AnyStr) -> Dict[AnyStr, Tuple[AnyStr, int]]:
+        rows = self._db.execute('SELECT symbol, error, attempts FROM tasks WHERE kind = ? AND status = ?',
+                                (kind, FAILED))
+        return {symbol: (error, attempts) for symbol, error, attempts in rows}
+
+    def counts(self) -> Dict[AnyStr, Dict[AnyStr, int]]:
+        counts = {}
+        for kind, status, count in self._db.execute('SELECT kind, status, COUNT(*) FROM tasks GROUP BY kind, status'):
+            counts.setdefault(kind, {})[status] = count
+        return counts
+
+
+class Job:
+    """
+    downloads kinds for symbols chunk by chunk and records every result in a journal,
+    when run again completed work is skipped and failed symbols are retried
+    """
+    def __init__(self, path: AnyStr, symbols: Iterable[AnyStr], kinds: Union[Iterable[AnyStr], Dict[AnyStr, Dict]],
+                 chunk_size: int = 200, max_attempts: Optional[int] = 3):
+        """
+        :param path: journal file, created if missing
+        :param symbols: symbols to download
+        :param kinds: names from bulk.KINDS or dict name -> keywords of Tickers method
+        :param chunk_size: symbols requested and recorded together
+        :param max_attempts: failed symbols are not retried after that many attempts, None to always retry
+        """
+        self.kinds = parse_kinds(kinds)
+        self.chunk_size = chunk_size
+        self.max_attempts = max_attempts
+        self.journal = Journal(path)
+        self.journal.check_kinds(self.kinds)
+        symbols = list(dict.fromkeys(symbols))
+        for kind in self.kinds:
+            self.journal.add(kind, symbols)
+
+    async def run(self) -> Tuple[Dict, Dict]:
+        """
+        downloads queued work, kinds go concurrently
+        :return: dict kind -> symbol -> value and dict kind -> symbol -> repr(exception) of the whole job
+        """
+        await asyncio.gather(*[self._run_kind(kind, kwargs) for kind, kwargs in self.kinds.items()])
+        return self.results(), self.errors()
+
+    async def _run_kind(self, kind: AnyStr, kwargs: Dict):
+        queued = self.journal.queued(kind, self.max_attempts)
+        for i in range(0, len(queued), self.chunk_size):
+            results, errors = await download(queued[i:i + self.chunk_size], {kind: kwargs})
+            self.journal.save(kind, results[kind], errors[kind])
+
+    def results(self) -> Dict[AnyStr, Dict]:
+        return {kind: self.journal.results(kind) for kind in self.kinds}
+
+    def errors(self) -> Dict[AnyStr, Dict]:
+        return {kind: {symbol: error for symbol, (error, _) in self.journal.failures(kind).items()}
+                for kind in self.kinds}
+
+    def status(self) -> Dict[AnyStr, Dict[AnyStr, int]]:
+        """
+        :return: dict kind -> status (pending, done, failed) -> amount of symbols
+        """
+        return self.journal.counts()
+
+    def close(self):
+        self.journal.close()
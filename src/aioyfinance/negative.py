@@ -0,0 +1,78 @@
+"""
+Negative cache of symbols known to fail, e.g. misspelled, delisted or ETF for statistics
+"""
+import sqlite3
+from time import time
+from typing import AnyStr, Dict, Iterable, Optional, Tuple
+
+
+class NegativeCache:
+    """
+    (symbol, kind) -> reason of failure, entries expire after ttl seconds,
+    optionally kept in SQLite file between runs
+    """
+    def __init__(self, ttl: float = 24 * 3600, path: Optional[AnyStr] = None):
+        """
+        :param ttl: seconds symbol is not requested again
+        :param path: SQLite file, in memory only if None
+        """
+        self.ttl = ttl
+        self._entries: Dict[Tuple[AnyStr, AnyStr], Tuple[float, AnyStr]] = {}  # -> (expires, reason)
+        self._db = None
+        if path is not None:
+            # config can be made in one thread and used on the loop of another
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute('CREATE TABLE IF NOT EXISTS negative (symbol TEXT, kind TEXT, expires REAL, '
+                             'reason TEXT, PRIMARY KEY (symbol, kind))')
+            self._db.execute('DELETE FROM negative WHERE expires <= ?', (time(),))
+            self._db.commit()
+            for symbol, kind, expires, reason in self._db.execute('SELECT * FROM negative'):
+                self._entries[(symbol, kind)] = (expires, reason)
+
+    def get(self, symbol: AnyStr, kind: AnyStr) -> Optional[AnyStr]:
+        """
+        :return: reason of failure or None if symbol is not known to fail for kind
+        """
+        entry = self._entries.get((symbol, kind))
+        if entry is None:
+            return None
+        if entry[0] <= time():
+            self.discard(symbol, kind)
+            return None
+        return entry[1]
+
+    def add(self, symbol: AnyStr, kinds: Iterable[AnyStr], reason: AnyStr):
+        expires = time() + self.ttl
+        rows = [(symbol, kind, expires, reason) for kind in kinds]
+        for row in rows:
+            self._entries[row[:2]] = row[2:]
+        if self._db is not None:
+            self._db.executemany('INSERT OR REPLACE INTO negative VALUES (?, ?, ?, ?)', rows)
+            self._db.commit()
+
+    def discard(self, symbol: AnyStr, kind: Optional[AnyStr] = None):
+        """
+        :param kind: kind to forget, every kind of symbol if None
+        """
+        for key in [key for key in self._entries if key[0] == symbol and kind in (None, key[1])]:
+            del self._entries[key]
+        if self._db is not None:
+            if kind is None:
+                self._db.execute('DELETE FROM negative WHERE symbol = ?', (symbol,))
+            else:
+                self._db.execute('DELETE FROM negative WHERE symbol = ? AND kind = ?', (symbol, kind))
+            self._db.commit()
+
+    def clear(self):
+        self._entries.clear()
+        if self._db is not None:
+            self._db.execute('DELETE FROM negative')
+            self._db.commit()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
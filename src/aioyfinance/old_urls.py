@@ -1,662 +1,28 @@
 """
 
-file with long ass urls for fundamental jsons
-why the hell would they do them so long....
+pre-built queries for fundamental jsons, kept for compatibility
+queries are built from the registry in series.py on first access
 
 """
-# pylint: disable=line-too-long
-FUNDAMETALS_URL = 'https://query1.finance.yahoo.com/ws/fundamentals-timeseries/v1/finance/timeseries/'
+from .urldict import FUNDAMENTALS_URL as FUNDAMETALS_URL, FUNDAMENTAL_FORMATTER
 
-# dont forget
-# period1 and period2 and symbol
-INCOME_STATEMENT_ANNUAL = '?lang=en-US&region=US&padTimeSeries=true&type=annualTaxEffectOfUnusualItems' \
-                          '%2CtrailingTaxEffectOfUnusualItems%2CannualTaxRateForCalcs%2CtrailingTaxRateForCalcs' \
-                          '%2CannualNormalizedEBITDA%2CtrailingNormalizedEBITDA%2CannualNormalizedDilutedEPS' \
-                          '%2CtrailingNormalizedDilutedEPS%2CannualNormalizedBasicEPS%2CtrailingNormalizedBasicEPS' \
-                          '%2CannualTotalUnusualItems%2CtrailingTotalUnusualItems' \
-                          '%2CannualTotalUnusualItemsExcludingGoodwill%2CtrailingTotalUnusualItemsExcludingGoodwill' \
-                          '%2CannualNetIncomeFromContinuingOperationNetMinorityInterest' \
-                          '%2CtrailingNetIncomeFromContinuingOperationNetMinorityInterest' \
-                          '%2CannualReconciledDepreciation%2CtrailingReconciledDepreciation' \
-                          '%2CannualReconciledCostOfRevenue%2CtrailingReconciledCostOfRevenue%2CannualEBITDA' \
-                          '%2CtrailingEBITDA%2CannualEBIT%2CtrailingEBIT%2CannualNetInterestIncome' \
-                          '%2CtrailingNetInterestIncome%2CannualInterestExpense%2CtrailingInterestExpense' \
-                          '%2CannualInterestIncome%2CtrailingInterestIncome' \
-                          '%2CannualContinuingAndDiscontinuedDilutedEPS%2CtrailingContinuingAndDiscontinuedDilutedEPS' \
-                          '%2CannualContinuingAndDiscontinuedBasicEPS%2CtrailingContinuingAndDiscontinuedBasicEPS' \
-                          '%2CannualNormalizedIncome%2CtrailingNormalizedIncome' \
-                          '%2CannualNetIncomeFromContinuingAndDiscontinuedOperation' \
-                          '%2CtrailingNetIncomeFromContinuingAndDiscontinuedOperation%2CannualTotalExpenses' \
-                          '%2CtrailingTotalExpenses%2CannualRentExpenseSupplemental%2CtrailingRentExpenseSupplemental' \
-                          '%2CannualReportedNormalizedDilutedEPS%2CtrailingReportedNormalizedDilutedEPS' \
-                          '%2CannualReportedNormalizedBasicEPS%2CtrailingReportedNormalizedBasicEPS' \
-                          '%2CannualTotalOperatingIncomeAsReported%2CtrailingTotalOperatingIncomeAsReported' \
-                          '%2CannualDividendPerShare%2CtrailingDividendPerShare%2CannualDilutedAverageShares' \
-                          '%2CtrailingDilutedAverageShares%2CannualBasicAverageShares%2CtrailingBasicAverageShares' \
-                          '%2CannualDilutedEPS%2CtrailingDilutedEPS%2CannualDilutedEPSOtherGainsLosses' \
-                          '%2CtrailingDilutedEPSOtherGainsLosses%2CannualTaxLossCarryforwardDilutedEPS' \
-                          '%2CtrailingTaxLossCarryforwardDilutedEPS%2CannualDilutedAccountingChange' \
-                          '%2CtrailingDilutedAccountingChange%2CannualDilutedExtraordinary' \
-                          '%2CtrailingDilutedExtraordinary%2CannualDilutedDiscontinuousOperations' \
-                          '%2CtrailingDilutedDiscontinuousOperations%2CannualDilutedContinuousOperations' \
-                          '%2CtrailingDilutedContinuousOperations%2CannualBasicEPS%2CtrailingBasicEPS' \
-                          '%2CannualBasicEPSOtherGainsLosses%2CtrailingBasicEPSOtherGainsLosses' \
-                          '%2CannualTaxLossCarryforwardBasicEPS%2CtrailingTaxLossCarryforwardBasicEPS' \
-                          '%2CannualBasicAccountingChange%2CtrailingBasicAccountingChange%2CannualBasicExtraordinary' \
-                          '%2CtrailingBasicExtraordinary%2CannualBasicDiscontinuousOperations' \
-                          '%2CtrailingBasicDiscontinuousOperations%2CannualBasicContinuousOperations' \
-                          '%2CtrailingBasicContinuousOperations%2CannualDilutedNIAvailtoComStockholders' \
-                          '%2CtrailingDilutedNIAvailtoComStockholders%2CannualAverageDilutionEarnings' \
-                          '%2CtrailingAverageDilutionEarnings%2CannualNetIncomeCommonStockholders' \
-                          '%2CtrailingNetIncomeCommonStockholders%2CannualOtherunderPreferredStockDividend' \
-                          '%2CtrailingOtherunderPreferredStockDividend%2CannualPreferredStockDividends' \
-                          '%2CtrailingPreferredStockDividends%2CannualNetIncome%2CtrailingNetIncome' \
-                          '%2CannualMinorityInterests%2CtrailingMinorityInterests' \
-                          '%2CannualNetIncomeIncludingNoncontrollingInterests' \
-                          '%2CtrailingNetIncomeIncludingNoncontrollingInterests' \
-                          '%2CannualNetIncomeFromTaxLossCarryforward%2CtrailingNetIncomeFromTaxLossCarryforward' \
-                          '%2CannualNetIncomeExtraordinary%2CtrailingNetIncomeExtraordinary' \
-                          '%2CannualNetIncomeDiscontinuousOperations%2CtrailingNetIncomeDiscontinuousOperations' \
-                          '%2CannualNetIncomeContinuousOperations%2CtrailingNetIncomeContinuousOperations' \
-                          '%2CannualEarningsFromEquityInterestNetOfTax%2CtrailingEarningsFromEquityInterestNetOfTax' \
-                          '%2CannualTaxProvision%2CtrailingTaxProvision%2CannualPretaxIncome%2CtrailingPretaxIncome' \
-                          '%2CannualOtherIncomeExpense%2CtrailingOtherIncomeExpense' \
-                          '%2CannualOtherNonOperatingIncomeExpenses%2CtrailingOtherNonOperatingIncomeExpenses' \
-                          '%2CannualSpecialIncomeCharges%2CtrailingSpecialIncomeCharges%2CannualGainOnSaleOfPPE' \
-                          '%2CtrailingGainOnSaleOfPPE%2CannualGainOnSaleOfBusiness%2CtrailingGainOnSaleOfBusiness' \
-                          '%2CannualOtherSpecialCharges%2CtrailingOtherSpecialCharges%2CannualWriteOff' \
-                          '%2CtrailingWriteOff%2CannualImpairmentOfCapitalAssets%2CtrailingImpairmentOfCapitalAssets' \
-                          '%2CannualRestructuringAndMergernAcquisition%2CtrailingRestructuringAndMergernAcquisition' \
-                          '%2CannualSecuritiesAmortization%2CtrailingSecuritiesAmortization' \
-                          '%2CannualEarningsFromEquityInterest%2CtrailingEarningsFromEquityInterest' \
-                          '%2CannualGainOnSaleOfSecurity%2CtrailingGainOnSaleOfSecurity' \
-                          '%2CannualNetNonOperatingInterestIncomeExpense' \
-                          '%2CtrailingNetNonOperatingInterestIncomeExpense%2CannualTotalOtherFinanceCost' \
-                          '%2CtrailingTotalOtherFinanceCost%2CannualInterestExpenseNonOperating' \
-                          '%2CtrailingInterestExpenseNonOperating%2CannualInterestIncomeNonOperating' \
-                          '%2CtrailingInterestIncomeNonOperating%2CannualOperatingIncome%2CtrailingOperatingIncome' \
-                          '%2CannualOperatingExpense%2CtrailingOperatingExpense%2CannualOtherOperatingExpenses' \
-                          '%2CtrailingOtherOperatingExpenses%2CannualOtherTaxes%2CtrailingOtherTaxes' \
-                          '%2CannualProvisionForDoubtfulAccounts%2CtrailingProvisionForDoubtfulAccounts' \
-                          '%2CannualDepreciationAmortizationDepletionIncomeStatement' \
-                          '%2CtrailingDepreciationAmortizationDepletionIncomeStatement' \
-                          '%2CannualDepletionIncomeStatement%2CtrailingDepletionIncomeStatement' \
-                          '%2CannualDepreciationAndAmortizationInIncomeStatement' \
-                          '%2CtrailingDepreciationAndAmortizationInIncomeStatement%2CannualAmortization' \
-                          '%2CtrailingAmortization%2CannualAmortizationOfIntangiblesIncomeStatement' \
-                          '%2CtrailingAmortizationOfIntangiblesIncomeStatement%2CannualDepreciationIncomeStatement' \
-                          '%2CtrailingDepreciationIncomeStatement%2CannualResearchAndDevelopment' \
-                          '%2CtrailingResearchAndDevelopment%2CannualSellingGeneralAndAdministration' \
-                          '%2CtrailingSellingGeneralAndAdministration%2CannualSellingAndMarketingExpense' \
-                          '%2CtrailingSellingAndMarketingExpense%2CannualGeneralAndAdministrativeExpense' \
-                          '%2CtrailingGeneralAndAdministrativeExpense%2CannualOtherGandA%2CtrailingOtherGandA' \
-                          '%2CannualInsuranceAndClaims%2CtrailingInsuranceAndClaims%2CannualRentAndLandingFees' \
-                          '%2CtrailingRentAndLandingFees%2CannualSalariesAndWages%2CtrailingSalariesAndWages' \
-                          '%2CannualGrossProfit%2CtrailingGrossProfit%2CannualCostOfRevenue%2CtrailingCostOfRevenue' \
-                          '%2CannualTotalRevenue%2CtrailingTotalRevenue%2CannualExciseTaxes%2CtrailingExciseTaxes' \
-                          '%2CannualOperatingRevenue%2CtrailingOperatingRevenue&merge=false&corsDomain=finance.yahoo' \
-                          '.com '
+_STATEMENTS = {
+    'INCOME_STATEMENT_ANNUAL': ('income', 'annual'),
+    'INCOME_STATEMENT_QUARTER': ('income', 'quarterly'),
+    'BALANCE_ANNUAL': ('balance', 'annual'),
+    'BALANCE_QUARTER': ('balance', 'quarterly'),
+    'CASH_FLOW_ANNUAL': ('cashflow', 'annual'),
+    'CASH_FLOW_QUARTER': ('cashflow', 'quarterly'),
+}
 
-INCOME_STATEMENT_QUARTER = '?lang=en-US&region=US&padTimeSeries=true&type=quarterlyTaxEffectOfUnusualItems' \
-                           '%2CtrailingTaxEffectOfUnusualItems%2CquarterlyTaxRateForCalcs%2CtrailingTaxRateForCalcs' \
-                           '%2CquarterlyNormalizedEBITDA%2CtrailingNormalizedEBITDA%2CquarterlyNormalizedDilutedEPS' \
-                           '%2CtrailingNormalizedDilutedEPS%2CquarterlyNormalizedBasicEPS' \
-                           '%2CtrailingNormalizedBasicEPS%2CquarterlyTotalUnusualItems%2CtrailingTotalUnusualItems' \
-                           '%2CquarterlyTotalUnusualItemsExcludingGoodwill' \
-                           '%2CtrailingTotalUnusualItemsExcludingGoodwill' \
-                           '%2CquarterlyNetIncomeFromContinuingOperationNetMinorityInterest' \
-                           '%2CtrailingNetIncomeFromContinuingOperationNetMinorityInterest' \
-                           '%2CquarterlyReconciledDepreciation%2CtrailingReconciledDepreciation' \
-                           '%2CquarterlyReconciledCostOfRevenue%2CtrailingReconciledCostOfRevenue%2CquarterlyEBITDA' \
-                           '%2CtrailingEBITDA%2CquarterlyEBIT%2CtrailingEBIT%2CquarterlyNetInterestIncome' \
-                           '%2CtrailingNetInterestIncome%2CquarterlyInterestExpense%2CtrailingInterestExpense' \
-                           '%2CquarterlyInterestIncome%2CtrailingInterestIncome' \
-                           '%2CquarterlyContinuingAndDiscontinuedDilutedEPS' \
-                           '%2CtrailingContinuingAndDiscontinuedDilutedEPS' \
-                           '%2CquarterlyContinuingAndDiscontinuedBasicEPS%2CtrailingContinuingAndDiscontinuedBasicEPS' \
-                           '%2CquarterlyNormalizedIncome%2CtrailingNormalizedIncome' \
-                           '%2CquarterlyNetIncomeFromContinuingAndDiscontinuedOperation' \
-                           '%2CtrailingNetIncomeFromContinuingAndDiscontinuedOperation%2CquarterlyTotalExpenses' \
-                           '%2CtrailingTotalExpenses%2CquarterlyRentExpenseSupplemental' \
-                           '%2CtrailingRentExpenseSupplemental%2CquarterlyReportedNormalizedDilutedEPS' \
-                           '%2CtrailingReportedNormalizedDilutedEPS%2CquarterlyReportedNormalizedBasicEPS' \
-                           '%2CtrailingReportedNormalizedBasicEPS%2CquarterlyTotalOperatingIncomeAsReported' \
-                           '%2CtrailingTotalOperatingIncomeAsReported%2CquarterlyDividendPerShare' \
-                           '%2CtrailingDividendPerShare%2CquarterlyDilutedAverageShares' \
-                           '%2CtrailingDilutedAverageShares%2CquarterlyBasicAverageShares' \
-                           '%2CtrailingBasicAverageShares%2CquarterlyDilutedEPS%2CtrailingDilutedEPS' \
-                           '%2CquarterlyDilutedEPSOtherGainsLosses%2CtrailingDilutedEPSOtherGainsLosses' \
-                           '%2CquarterlyTaxLossCarryforwardDilutedEPS%2CtrailingTaxLossCarryforwardDilutedEPS' \
-                           '%2CquarterlyDilutedAccountingChange%2CtrailingDilutedAccountingChange' \
-                           '%2CquarterlyDilutedExtraordinary%2CtrailingDilutedExtraordinary' \
-                           '%2CquarterlyDilutedDiscontinuousOperations%2CtrailingDilutedDiscontinuousOperations' \
-                           '%2CquarterlyDilutedContinuousOperations%2CtrailingDilutedContinuousOperations' \
-                           '%2CquarterlyBasicEPS%2CtrailingBasicEPS%2CquarterlyBasicEPSOtherGainsLosses' \
-                           '%2CtrailingBasicEPSOtherGainsLosses%2CquarterlyTaxLossCarryforwardBasicEPS' \
-                           '%2CtrailingTaxLossCarryforwardBasicEPS%2CquarterlyBasicAccountingChange' \
-                           '%2CtrailingBasicAccountingChange%2CquarterlyBasicExtraordinary' \
-                           '%2CtrailingBasicExtraordinary%2CquarterlyBasicDiscontinuousOperations' \
-                           '%2CtrailingBasicDiscontinuousOperations%2CquarterlyBasicContinuousOperations' \
-                           '%2CtrailingBasicContinuousOperations%2CquarterlyDilutedNIAvailtoComStockholders' \
-                           '%2CtrailingDilutedNIAvailtoComStockholders%2CquarterlyAverageDilutionEarnings' \
-                           '%2CtrailingAverageDilutionEarnings%2CquarterlyNetIncomeCommonStockholders' \
-                           '%2CtrailingNetIncomeCommonStockholders%2CquarterlyOtherunderPreferredStockDividend' \
-                           '%2CtrailingOtherunderPreferredStockDividend%2CquarterlyPreferredStockDividends' \
-                           '%2CtrailingPreferredStockDividends%2CquarterlyNetIncome%2CtrailingNetIncome' \
-                           '%2CquarterlyMinorityInterests%2CtrailingMinorityInterests' \
-                           '%2CquarterlyNetIncomeIncludingNoncontrollingInterests' \
-                           '%2CtrailingNetIncomeIncludingNoncontrollingInterests' \
-                           '%2CquarterlyNetIncomeFromTaxLossCarryforward%2CtrailingNetIncomeFromTaxLossCarryforward' \
-                           '%2CquarterlyNetIncomeExtraordinary%2CtrailingNetIncomeExtraordinary' \
-                           '%2CquarterlyNetIncomeDiscontinuousOperations%2CtrailingNetIncomeDiscontinuousOperations' \
-                           '%2CquarterlyNetIncomeContinuousOperations%2CtrailingNetIncomeContinuousOperations' \
-                           '%2CquarterlyEarningsFromEquityInterestNetOfTax' \
-                           '%2CtrailingEarningsFromEquityInterestNetOfTax%2CquarterlyTaxProvision' \
-                           '%2CtrailingTaxProvision%2CquarterlyPretaxIncome%2CtrailingPretaxIncome' \
-                           '%2CquarterlyOtherIncomeExpense%2CtrailingOtherIncomeExpense' \
-                           '%2CquarterlyOtherNonOperatingIncomeExpenses%2CtrailingOtherNonOperatingIncomeExpenses' \
-                           '%2CquarterlySpecialIncomeCharges%2CtrailingSpecialIncomeCharges' \
-                           '%2CquarterlyGainOnSaleOfPPE%2CtrailingGainOnSaleOfPPE%2CquarterlyGainOnSaleOfBusiness' \
-                           '%2CtrailingGainOnSaleOfBusiness%2CquarterlyOtherSpecialCharges' \
-                           '%2CtrailingOtherSpecialCharges%2CquarterlyWriteOff%2CtrailingWriteOff' \
-                           '%2CquarterlyImpairmentOfCapitalAssets%2CtrailingImpairmentOfCapitalAssets' \
-                           '%2CquarterlyRestructuringAndMergernAcquisition' \
-                           '%2CtrailingRestructuringAndMergernAcquisition%2CquarterlySecuritiesAmortization' \
-                           '%2CtrailingSecuritiesAmortization%2CquarterlyEarningsFromEquityInterest' \
-                           '%2CtrailingEarningsFromEquityInterest%2CquarterlyGainOnSaleOfSecurity' \
-                           '%2CtrailingGainOnSaleOfSecurity%2CquarterlyNetNonOperatingInterestIncomeExpense' \
-                           '%2CtrailingNetNonOperatingInterestIncomeExpense%2CquarterlyTotalOtherFinanceCost' \
-                           '%2CtrailingTotalOtherFinanceCost%2CquarterlyInterestExpenseNonOperating' \
-                           '%2CtrailingInterestExpenseNonOperating%2CquarterlyInterestIncomeNonOperating' \
-                           '%2CtrailingInterestIncomeNonOperating%2CquarterlyOperatingIncome' \
-                           '%2CtrailingOperatingIncome%2CquarterlyOperatingExpense%2CtrailingOperatingExpense' \
-                           '%2CquarterlyOtherOperatingExpenses%2CtrailingOtherOperatingExpenses%2CquarterlyOtherTaxes' \
-                           '%2CtrailingOtherTaxes%2CquarterlyProvisionForDoubtfulAccounts' \
-                           '%2CtrailingProvisionForDoubtfulAccounts' \
-                           '%2CquarterlyDepreciationAmortizationDepletionIncomeStatement' \
-                           '%2CtrailingDepreciationAmortizationDepletionIncomeStatement' \
-                           '%2CquarterlyDepletionIncomeStatement%2CtrailingDepletionIncomeStatement' \
-                           '%2CquarterlyDepreciationAndAmortizationInIncomeStatement' \
-                           '%2CtrailingDepreciationAndAmortizationInIncomeStatement%2CquarterlyAmortization' \
-                           '%2CtrailingAmortization%2CquarterlyAmortizationOfIntangiblesIncomeStatement' \
-                           '%2CtrailingAmortizationOfIntangiblesIncomeStatement' \
-                           '%2CquarterlyDepreciationIncomeStatement%2CtrailingDepreciationIncomeStatement' \
-                           '%2CquarterlyResearchAndDevelopment%2CtrailingResearchAndDevelopment' \
-                           '%2CquarterlySellingGeneralAndAdministration%2CtrailingSellingGeneralAndAdministration' \
-                           '%2CquarterlySellingAndMarketingExpense%2CtrailingSellingAndMarketingExpense' \
-                           '%2CquarterlyGeneralAndAdministrativeExpense%2CtrailingGeneralAndAdministrativeExpense' \
-                           '%2CquarterlyOtherGandA%2CtrailingOtherGandA%2CquarterlyInsuranceAndClaims' \
-                           '%2CtrailingInsuranceAndClaims%2CquarterlyRentAndLandingFees%2CtrailingRentAndLandingFees' \
-                           '%2CquarterlySalariesAndWages%2CtrailingSalariesAndWages%2CquarterlyGrossProfit' \
-                           '%2CtrailingGrossProfit%2CquarterlyCostOfRevenue%2CtrailingCostOfRevenue' \
-                           '%2CquarterlyTotalRevenue%2CtrailingTotalRevenue%2CquarterlyExciseTaxes' \
-                           '%2CtrailingExciseTaxes%2CquarterlyOperatingRevenue%2CtrailingOperatingRevenue&merge=false' \
-                           '&corsDomain=finance.yahoo.com '
+__all__ = ['FUNDAMETALS_URL', 'FUNDAMENTAL_FORMATTER', *_STATEMENTS]
 
-BALANCE_ANNUAL = '?lang=en-US&region=US&padTimeSeries=true&type=annualTreasurySharesNumber' \
-                 '%2CtrailingTreasurySharesNumber%2CannualPreferredSharesNumber%2CtrailingPreferredSharesNumber' \
-                 '%2CannualOrdinarySharesNumber%2CtrailingOrdinarySharesNumber%2CannualShareIssued' \
-                 '%2CtrailingShareIssued%2CannualNetDebt%2CtrailingNetDebt%2CannualTotalDebt%2CtrailingTotalDebt' \
-                 '%2CannualTangibleBookValue%2CtrailingTangibleBookValue%2CannualInvestedCapital' \
-                 '%2CtrailingInvestedCapital%2CannualWorkingCapital%2CtrailingWorkingCapital' \
-                 '%2CannualNetTangibleAssets%2CtrailingNetTangibleAssets%2CannualCapitalLeaseObligations' \
-                 '%2CtrailingCapitalLeaseObligations%2CannualCommonStockEquity%2CtrailingCommonStockEquity' \
-                 '%2CannualPreferredStockEquity%2CtrailingPreferredStockEquity%2CannualTotalCapitalization' \
-                 '%2CtrailingTotalCapitalization%2CannualTotalEquityGrossMinorityInterest' \
-                 '%2CtrailingTotalEquityGrossMinorityInterest%2CannualMinorityInterest%2CtrailingMinorityInterest' \
-                 '%2CannualStockholdersEquity%2CtrailingStockholdersEquity%2CannualOtherEquityInterest' \
-                 '%2CtrailingOtherEquityInterest%2CannualGainsLossesNotAffectingRetainedEarnings' \
-                 '%2CtrailingGainsLossesNotAffectingRetainedEarnings%2CannualOtherEquityAdjustments' \
-                 '%2CtrailingOtherEquityAdjustments%2CannualFixedAssetsRevaluationReserve' \
-                 '%2CtrailingFixedAssetsRevaluationReserve%2CannualForeignCurrencyTranslationAdjustments' \
-                 '%2CtrailingForeignCurrencyTranslationAdjustments%2CannualMinimumPensionLiabilities' \
-                 '%2CtrailingMinimumPensionLiabilities%2CannualUnrealizedGainLoss%2CtrailingUnrealizedGainLoss' \
-                 '%2CannualTreasuryStock%2CtrailingTreasuryStock%2CannualRetainedEarnings%2CtrailingRetainedEarnings' \
-                 '%2CannualAdditionalPaidInCapital%2CtrailingAdditionalPaidInCapital%2CannualCapitalStock' \
-                 '%2CtrailingCapitalStock%2CannualOtherCapitalStock%2CtrailingOtherCapitalStock%2CannualCommonStock' \
-                 '%2CtrailingCommonStock%2CannualPreferredStock%2CtrailingPreferredStock' \
-                 '%2CannualTotalPartnershipCapital%2CtrailingTotalPartnershipCapital' \
-                 '%2CannualGeneralPartnershipCapital%2CtrailingGeneralPartnershipCapital' \
-                 '%2CannualLimitedPartnershipCapital%2CtrailingLimitedPartnershipCapital' \
-                 '%2CannualTotalLiabilitiesNetMinorityInterest%2CtrailingTotalLiabilitiesNetMinorityInterest' \
-                 '%2CannualTotalNonCurrentLiabilitiesNetMinorityInterest' \
-                 '%2CtrailingTotalNonCurrentLiabilitiesNetMinorityInterest%2CannualOtherNonCurrentLiabilities' \
-                 '%2CtrailingOtherNonCurrentLiabilities%2CannualLiabilitiesHeldforSaleNonCurrent' \
-                 '%2CtrailingLiabilitiesHeldforSaleNonCurrent%2CannualRestrictedCommonStock' \
-                 '%2CtrailingRestrictedCommonStock%2CannualPreferredSecuritiesOutsideStockEquity' \
-                 '%2CtrailingPreferredSecuritiesOutsideStockEquity%2CannualDerivativeProductLiabilities' \
-                 '%2CtrailingDerivativeProductLiabilities%2CannualEmployeeBenefits%2CtrailingEmployeeBenefits' \
-                 '%2CannualNonCurrentPensionAndOtherPostretirementBenefitPlans' \
-                 '%2CtrailingNonCurrentPensionAndOtherPostretirementBenefitPlans%2CannualNonCurrentAccruedExpenses' \
-                 '%2CtrailingNonCurrentAccruedExpenses%2CannualDuetoRelatedPartiesNonCurrent' \
-                 '%2CtrailingDuetoRelatedPartiesNonCurrent%2CannualTradeandOtherPayablesNonCurrent' \
-                 '%2CtrailingTradeandOtherPayablesNonCurrent%2CannualNonCurrentDeferredLiabilities' \
-                 '%2CtrailingNonCurrentDeferredLiabilities%2CannualNonCurrentDeferredRevenue' \
-                 '%2CtrailingNonCurrentDeferredRevenue%2CannualNonCurrentDeferredTaxesLiabilities' \
-                 '%2CtrailingNonCurrentDeferredTaxesLiabilities%2CannualLongTermDebtAndCapitalLeaseObligation' \
-                 '%2CtrailingLongTermDebtAndCapitalLeaseObligation%2CannualLongTermCapitalLeaseObligation' \
-                 '%2CtrailingLongTermCapitalLeaseObligation%2CannualLongTermDebt%2CtrailingLongTermDebt' \
-                 '%2CannualLongTermProvisions%2CtrailingLongTermProvisions%2CannualCurrentLiabilities' \
-                 '%2CtrailingCurrentLiabilities%2CannualOtherCurrentLiabilities%2CtrailingOtherCurrentLiabilities' \
-                 '%2CannualCurrentDeferredLiabilities%2CtrailingCurrentDeferredLiabilities' \
-                 '%2CannualCurrentDeferredRevenue%2CtrailingCurrentDeferredRevenue' \
-                 '%2CannualCurrentDeferredTaxesLiabilities%2CtrailingCurrentDeferredTaxesLiabilities' \
-                 '%2CannualCurrentDebtAndCapitalLeaseObligation%2CtrailingCurrentDebtAndCapitalLeaseObligation' \
-                 '%2CannualCurrentCapitalLeaseObligation%2CtrailingCurrentCapitalLeaseObligation%2CannualCurrentDebt' \
-                 '%2CtrailingCurrentDebt%2CannualOtherCurrentBorrowings%2CtrailingOtherCurrentBorrowings' \
-                 '%2CannualLineOfCredit%2CtrailingLineOfCredit%2CannualCommercialPaper%2CtrailingCommercialPaper' \
-                 '%2CannualCurrentNotesPayable%2CtrailingCurrentNotesPayable' \
-                 '%2CannualPensionandOtherPostRetirementBenefitPlansCurrent' \
-                 '%2CtrailingPensionandOtherPostRetirementBenefitPlansCurrent%2CannualCurrentProvisions' \
-                 '%2CtrailingCurrentProvisions%2CannualPayablesAndAccruedExpenses' \
-                 '%2CtrailingPayablesAndAccruedExpenses%2CannualCurrentAccruedExpenses' \
-                 '%2CtrailingCurrentAccruedExpenses%2CannualInterestPayable%2CtrailingInterestPayable' \
-                 '%2CannualPayables%2CtrailingPayables%2CannualOtherPayable%2CtrailingOtherPayable' \
-                 '%2CannualDuetoRelatedPartiesCurrent%2CtrailingDuetoRelatedPartiesCurrent%2CannualDividendsPayable' \
-                 '%2CtrailingDividendsPayable%2CannualTotalTaxPayable%2CtrailingTotalTaxPayable' \
-                 '%2CannualIncomeTaxPayable%2CtrailingIncomeTaxPayable%2CannualAccountsPayable' \
-                 '%2CtrailingAccountsPayable%2CannualTotalAssets%2CtrailingTotalAssets%2CannualTotalNonCurrentAssets' \
-                 '%2CtrailingTotalNonCurrentAssets%2CannualOtherNonCurrentAssets%2CtrailingOtherNonCurrentAssets' \
-                 '%2CannualDefinedPensionBenefit%2CtrailingDefinedPensionBenefit%2CannualNonCurrentPrepaidAssets' \
-                 '%2CtrailingNonCurrentPrepaidAssets%2CannualNonCurrentDeferredAssets' \
-                 '%2CtrailingNonCurrentDeferredAssets%2CannualNonCurrentDeferredTaxesAssets' \
-                 '%2CtrailingNonCurrentDeferredTaxesAssets%2CannualDuefromRelatedPartiesNonCurrent' \
-                 '%2CtrailingDuefromRelatedPartiesNonCurrent%2CannualNonCurrentNoteReceivables' \
-                 '%2CtrailingNonCurrentNoteReceivables%2CannualNonCurrentAccountsReceivable' \
-                 '%2CtrailingNonCurrentAccountsReceivable%2CannualFinancialAssets%2CtrailingFinancialAssets' \
-                 '%2CannualInvestmentsAndAdvances%2CtrailingInvestmentsAndAdvances%2CannualOtherInvestments' \
-                 '%2CtrailingOtherInvestments%2CannualInvestmentinFinancialAssets' \
-                 '%2CtrailingInvestmentinFinancialAssets%2CannualHeldToMaturitySecurities' \
-                 '%2CtrailingHeldToMaturitySecurities%2CannualAvailableForSaleSecurities' \
-                 '%2CtrailingAvailableForSaleSecurities' \
-                 '%2CannualFinancialAssetsDesignatedasFairValueThroughProfitorLossTotal' \
-                 '%2CtrailingFinancialAssetsDesignatedasFairValueThroughProfitorLossTotal%2CannualTradingSecurities' \
-                 '%2CtrailingTradingSecurities%2CannualLongTermEquityInvestment%2CtrailingLongTermEquityInvestment' \
-                 '%2CannualInvestmentsinJointVenturesatCost%2CtrailingInvestmentsinJointVenturesatCost' \
-                 '%2CannualInvestmentsInOtherVenturesUnderEquityMethod' \
-                 '%2CtrailingInvestmentsInOtherVenturesUnderEquityMethod%2CannualInvestmentsinAssociatesatCost' \
-                 '%2CtrailingInvestmentsinAssociatesatCost%2CannualInvestmentsinSubsidiariesatCost' \
-                 '%2CtrailingInvestmentsinSubsidiariesatCost%2CannualInvestmentProperties' \
-                 '%2CtrailingInvestmentProperties%2CannualGoodwillAndOtherIntangibleAssets' \
-                 '%2CtrailingGoodwillAndOtherIntangibleAssets%2CannualOtherIntangibleAssets' \
-                 '%2CtrailingOtherIntangibleAssets%2CannualGoodwill%2CtrailingGoodwill%2CannualNetPPE' \
-                 '%2CtrailingNetPPE%2CannualAccumulatedDepreciation%2CtrailingAccumulatedDepreciation' \
-                 '%2CannualGrossPPE%2CtrailingGrossPPE%2CannualLeases%2CtrailingLeases%2CannualConstructionInProgress' \
-                 '%2CtrailingConstructionInProgress%2CannualOtherProperties%2CtrailingOtherProperties' \
-                 '%2CannualMachineryFurnitureEquipment%2CtrailingMachineryFurnitureEquipment' \
-                 '%2CannualBuildingsAndImprovements%2CtrailingBuildingsAndImprovements%2CannualLandAndImprovements' \
-                 '%2CtrailingLandAndImprovements%2CannualProperties%2CtrailingProperties%2CannualCurrentAssets' \
-                 '%2CtrailingCurrentAssets%2CannualOtherCurrentAssets%2CtrailingOtherCurrentAssets' \
-                 '%2CannualHedgingAssetsCurrent%2CtrailingHedgingAssetsCurrent%2CannualAssetsHeldForSaleCurrent' \
-                 '%2CtrailingAssetsHeldForSaleCurrent%2CannualCurrentDeferredAssets%2CtrailingCurrentDeferredAssets' \
-                 '%2CannualCurrentDeferredTaxesAssets%2CtrailingCurrentDeferredTaxesAssets%2CannualRestrictedCash' \
-                 '%2CtrailingRestrictedCash%2CannualPrepaidAssets%2CtrailingPrepaidAssets%2CannualInventory' \
-                 '%2CtrailingInventory%2CannualInventoriesAdjustmentsAllowances' \
-                 '%2CtrailingInventoriesAdjustmentsAllowances%2CannualOtherInventories%2CtrailingOtherInventories' \
-                 '%2CannualFinishedGoods%2CtrailingFinishedGoods%2CannualWorkInProcess%2CtrailingWorkInProcess' \
-                 '%2CannualRawMaterials%2CtrailingRawMaterials%2CannualReceivables%2CtrailingReceivables' \
-                 '%2CannualReceivablesAdjustmentsAllowances%2CtrailingReceivablesAdjustmentsAllowances' \
-                 '%2CannualOtherReceivables%2CtrailingOtherReceivables%2CannualDuefromRelatedPartiesCurrent' \
-                 '%2CtrailingDuefromRelatedPartiesCurrent%2CannualTaxesReceivable%2CtrailingTaxesReceivable' \
-                 '%2CannualAccruedInterestReceivable%2CtrailingAccruedInterestReceivable%2CannualNotesReceivable' \
-                 '%2CtrailingNotesReceivable%2CannualLoansReceivable%2CtrailingLoansReceivable' \
-                 '%2CannualAccountsReceivable%2CtrailingAccountsReceivable' \
-                 '%2CannualAllowanceForDoubtfulAccountsReceivable%2CtrailingAllowanceForDoubtfulAccountsReceivable' \
-                 '%2CannualGrossAccountsReceivable%2CtrailingGrossAccountsReceivable' \
-                 '%2CannualCashCashEquivalentsAndShortTermInvestments' \
-                 '%2CtrailingCashCashEquivalentsAndShortTermInvestments%2CannualOtherShortTermInvestments' \
-                 '%2CtrailingOtherShortTermInvestments%2CannualCashAndCashEquivalents' \
-                 '%2CtrailingCashAndCashEquivalents%2CannualCashEquivalents%2CtrailingCashEquivalents' \
-                 '%2CannualCashFinancial%2CtrailingCashFinancial&merge=false&corsDomain=finance.yahoo.com '
 
-BALANCE_QUARTER = '?lang=en-US&region=USpadTimeSeries=true&type=quarterlyTreasurySharesNumber' \
-                  '%2CtrailingTreasurySharesNumber%2CquarterlyPreferredSharesNumber%2CtrailingPreferredSharesNumber' \
-                  '%2CquarterlyOrdinarySharesNumber%2CtrailingOrdinarySharesNumber%2CquarterlyShareIssued' \
-                  '%2CtrailingShareIssued%2CquarterlyNetDebt%2CtrailingNetDebt%2CquarterlyTotalDebt' \
-                  '%2CtrailingTotalDebt%2CquarterlyTangibleBookValue%2CtrailingTangibleBookValue' \
-                  '%2CquarterlyInvestedCapital%2CtrailingInvestedCapital%2CquarterlyWorkingCapital' \
-                  '%2CtrailingWorkingCapital%2CquarterlyNetTangibleAssets%2CtrailingNetTangibleAssets' \
-                  '%2CquarterlyCapitalLeaseObligations%2CtrailingCapitalLeaseObligations%2CquarterlyCommonStockEquity' \
-                  '%2CtrailingCommonStockEquity%2CquarterlyPreferredStockEquity%2CtrailingPreferredStockEquity' \
-                  '%2CquarterlyTotalCapitalization%2CtrailingTotalCapitalization' \
-                  '%2CquarterlyTotalEquityGrossMinorityInterest%2CtrailingTotalEquityGrossMinorityInterest' \
-                  '%2CquarterlyMinorityInterest%2CtrailingMinorityInterest%2CquarterlyStockholdersEquity' \
-                  '%2CtrailingStockholdersEquity%2CquarterlyOtherEquityInterest%2CtrailingOtherEquityInterest' \
-                  '%2CquarterlyGainsLossesNotAffectingRetainedEarnings' \
-                  '%2CtrailingGainsLossesNotAffectingRetainedEarnings%2CquarterlyOtherEquityAdjustments' \
-                  '%2CtrailingOtherEquityAdjustments%2CquarterlyFixedAssetsRevaluationReserve' \
-                  '%2CtrailingFixedAssetsRevaluationReserve%2CquarterlyForeignCurrencyTranslationAdjustments' \
-                  '%2CtrailingForeignCurrencyTranslationAdjustments%2CquarterlyMinimumPensionLiabilities' \
-                  '%2CtrailingMinimumPensionLiabilities%2CquarterlyUnrealizedGainLoss%2CtrailingUnrealizedGainLoss' \
-                  '%2CquarterlyTreasuryStock%2CtrailingTreasuryStock%2CquarterlyRetainedEarnings' \
-                  '%2CtrailingRetainedEarnings%2CquarterlyAdditionalPaidInCapital%2CtrailingAdditionalPaidInCapital' \
-                  '%2CquarterlyCapitalStock%2CtrailingCapitalStock%2CquarterlyOtherCapitalStock' \
-                  '%2CtrailingOtherCapitalStock%2CquarterlyCommonStock%2CtrailingCommonStock' \
-                  '%2CquarterlyPreferredStock%2CtrailingPreferredStock%2CquarterlyTotalPartnershipCapital' \
-                  '%2CtrailingTotalPartnershipCapital%2CquarterlyGeneralPartnershipCapital' \
-                  '%2CtrailingGeneralPartnershipCapital%2CquarterlyLimitedPartnershipCapital' \
-                  '%2CtrailingLimitedPartnershipCapital%2CquarterlyTotalLiabilitiesNetMinorityInterest' \
-                  '%2CtrailingTotalLiabilitiesNetMinorityInterest' \
-                  '%2CquarterlyTotalNonCurrentLiabilitiesNetMinorityInterest' \
-                  '%2CtrailingTotalNonCurrentLiabilitiesNetMinorityInterest%2CquarterlyOtherNonCurrentLiabilities' \
-                  '%2CtrailingOtherNonCurrentLiabilities%2CquarterlyLiabilitiesHeldforSaleNonCurrent' \
-                  '%2CtrailingLiabilitiesHeldforSaleNonCurrent%2CquarterlyRestrictedCommonStock' \
-                  '%2CtrailingRestrictedCommonStock%2CquarterlyPreferredSecuritiesOutsideStockEquity' \
-                  '%2CtrailingPreferredSecuritiesOutsideStockEquity%2CquarterlyDerivativeProductLiabilities' \
-                  '%2CtrailingDerivativeProductLiabilities%2CquarterlyEmployeeBenefits%2CtrailingEmployeeBenefits' \
-                  '%2CquarterlyNonCurrentPensionAndOtherPostretirementBenefitPlans' \
-                  '%2CtrailingNonCurrentPensionAndOtherPostretirementBenefitPlans' \
-                  '%2CquarterlyNonCurrentAccruedExpenses%2CtrailingNonCurrentAccruedExpenses' \
-                  '%2CquarterlyDuetoRelatedPartiesNonCurrent%2CtrailingDuetoRelatedPartiesNonCurrent' \
-                  '%2CquarterlyTradeandOtherPayablesNonCurrent%2CtrailingTradeandOtherPayablesNonCurrent' \
-                  '%2CquarterlyNonCurrentDeferredLiabilities%2CtrailingNonCurrentDeferredLiabilities' \
-                  '%2CquarterlyNonCurrentDeferredRevenue%2CtrailingNonCurrentDeferredRevenue' \
-                  '%2CquarterlyNonCurrentDeferredTaxesLiabilities%2CtrailingNonCurrentDeferredTaxesLiabilities' \
-                  '%2CquarterlyLongTermDebtAndCapitalLeaseObligation%2CtrailingLongTermDebtAndCapitalLeaseObligation' \
-                  '%2CquarterlyLongTermCapitalLeaseObligation%2CtrailingLongTermCapitalLeaseObligation' \
-                  '%2CquarterlyLongTermDebt%2CtrailingLongTermDebt%2CquarterlyLongTermProvisions' \
-                  '%2CtrailingLongTermProvisions%2CquarterlyCurrentLiabilities%2CtrailingCurrentLiabilities' \
-                  '%2CquarterlyOtherCurrentLiabilities%2CtrailingOtherCurrentLiabilities' \
-                  '%2CquarterlyCurrentDeferredLiabilities%2CtrailingCurrentDeferredLiabilities' \
-                  '%2CquarterlyCurrentDeferredRevenue%2CtrailingCurrentDeferredRevenue' \
-                  '%2CquarterlyCurrentDeferredTaxesLiabilities%2CtrailingCurrentDeferredTaxesLiabilities' \
-                  '%2CquarterlyCurrentDebtAndCapitalLeaseObligation%2CtrailingCurrentDebtAndCapitalLeaseObligation' \
-                  '%2CquarterlyCurrentCapitalLeaseObligation%2CtrailingCurrentCapitalLeaseObligation' \
-                  '%2CquarterlyCurrentDebt%2CtrailingCurrentDebt%2CquarterlyOtherCurrentBorrowings' \
-                  '%2CtrailingOtherCurrentBorrowings%2CquarterlyLineOfCredit%2CtrailingLineOfCredit' \
-                  '%2CquarterlyCommercialPaper%2CtrailingCommercialPaper%2CquarterlyCurrentNotesPayable' \
-                  '%2CtrailingCurrentNotesPayable%2CquarterlyPensionandOtherPostRetirementBenefitPlansCurrent' \
-                  '%2CtrailingPensionandOtherPostRetirementBenefitPlansCurrent%2CquarterlyCurrentProvisions' \
-                  '%2CtrailingCurrentProvisions%2CquarterlyPayablesAndAccruedExpenses' \
-                  '%2CtrailingPayablesAndAccruedExpenses%2CquarterlyCurrentAccruedExpenses' \
-                  '%2CtrailingCurrentAccruedExpenses%2CquarterlyInterestPayable%2CtrailingInterestPayable' \
-                  '%2CquarterlyPayables%2CtrailingPayables%2CquarterlyOtherPayable%2CtrailingOtherPayable' \
-                  '%2CquarterlyDuetoRelatedPartiesCurrent%2CtrailingDuetoRelatedPartiesCurrent' \
-                  '%2CquarterlyDividendsPayable%2CtrailingDividendsPayable%2CquarterlyTotalTaxPayable' \
-                  '%2CtrailingTotalTaxPayable%2CquarterlyIncomeTaxPayable%2CtrailingIncomeTaxPayable' \
-                  '%2CquarterlyAccountsPayable%2CtrailingAccountsPayable%2CquarterlyTotalAssets%2CtrailingTotalAssets' \
-                  '%2CquarterlyTotalNonCurrentAssets%2CtrailingTotalNonCurrentAssets%2CquarterlyOtherNonCurrentAssets' \
-                  '%2CtrailingOtherNonCurrentAssets%2CquarterlyDefinedPensionBenefit%2CtrailingDefinedPensionBenefit' \
-                  '%2CquarterlyNonCurrentPrepaidAssets%2CtrailingNonCurrentPrepaidAssets' \
-                  '%2CquarterlyNonCurrentDeferredAssets%2CtrailingNonCurrentDeferredAssets' \
-                  '%2CquarterlyNonCurrentDeferredTaxesAssets%2CtrailingNonCurrentDeferredTaxesAssets' \
-                  '%2CquarterlyDuefromRelatedPartiesNonCurrent%2CtrailingDuefromRelatedPartiesNonCurrent' \
-                  '%2CquarterlyNonCurrentNoteReceivables%2CtrailingNonCurrentNoteReceivables' \
-                  '%2CquarterlyNonCurrentAccountsReceivable%2CtrailingNonCurrentAccountsReceivable' \
-                  '%2CquarterlyFinancialAssets%2CtrailingFinancialAssets%2CquarterlyInvestmentsAndAdvances' \
-                  '%2CtrailingInvestmentsAndAdvances%2CquarterlyOtherInvestments%2CtrailingOtherInvestments' \
-                  '%2CquarterlyInvestmentinFinancialAssets%2CtrailingInvestmentinFinancialAssets' \
-                  '%2CquarterlyHeldToMaturitySecurities%2CtrailingHeldToMaturitySecurities' \
-                  '%2CquarterlyAvailableForSaleSecurities%2CtrailingAvailableForSaleSecurities' \
-                  '%2CquarterlyFinancialAssetsDesignatedasFairValueThroughProfitorLossTotal' \
-                  '%2CtrailingFinancialAssetsDesignatedasFairValueThroughProfitorLossTotal' \
-                  '%2CquarterlyTradingSecurities%2CtrailingTradingSecurities%2CquarterlyLongTermEquityInvestment' \
-                  '%2CtrailingLongTermEquityInvestment%2CquarterlyInvestmentsinJointVenturesatCost' \
-                  '%2CtrailingInvestmentsinJointVenturesatCost%2CquarterlyInvestmentsInOtherVenturesUnderEquityMethod' \
-                  '%2CtrailingInvestmentsInOtherVenturesUnderEquityMethod%2CquarterlyInvestmentsinAssociatesatCost' \
-                  '%2CtrailingInvestmentsinAssociatesatCost%2CquarterlyInvestmentsinSubsidiariesatCost' \
-                  '%2CtrailingInvestmentsinSubsidiariesatCost%2CquarterlyInvestmentProperties' \
-                  '%2CtrailingInvestmentProperties%2CquarterlyGoodwillAndOtherIntangibleAssets' \
-                  '%2CtrailingGoodwillAndOtherIntangibleAssets%2CquarterlyOtherIntangibleAssets' \
-                  '%2CtrailingOtherIntangibleAssets%2CquarterlyGoodwill%2CtrailingGoodwill%2CquarterlyNetPPE' \
-                  '%2CtrailingNetPPE%2CquarterlyAccumulatedDepreciation%2CtrailingAccumulatedDepreciation' \
-                  '%2CquarterlyGrossPPE%2CtrailingGrossPPE%2CquarterlyLeases%2CtrailingLeases' \
-                  '%2CquarterlyConstructionInProgress%2CtrailingConstructionInProgress%2CquarterlyOtherProperties' \
-                  '%2CtrailingOtherProperties%2CquarterlyMachineryFurnitureEquipment' \
-                  '%2CtrailingMachineryFurnitureEquipment%2CquarterlyBuildingsAndImprovements' \
-                  '%2CtrailingBuildingsAndImprovements%2CquarterlyLandAndImprovements%2CtrailingLandAndImprovements' \
-                  '%2CquarterlyProperties%2CtrailingProperties%2CquarterlyCurrentAssets%2CtrailingCurrentAssets' \
-                  '%2CquarterlyOtherCurrentAssets%2CtrailingOtherCurrentAssets%2CquarterlyHedgingAssetsCurrent' \
-                  '%2CtrailingHedgingAssetsCurrent%2CquarterlyAssetsHeldForSaleCurrent' \
-                  '%2CtrailingAssetsHeldForSaleCurrent%2CquarterlyCurrentDeferredAssets' \
-                  '%2CtrailingCurrentDeferredAssets%2CquarterlyCurrentDeferredTaxesAssets' \
-                  '%2CtrailingCurrentDeferredTaxesAssets%2CquarterlyRestrictedCash%2CtrailingRestrictedCash' \
-                  '%2CquarterlyPrepaidAssets%2CtrailingPrepaidAssets%2CquarterlyInventory%2CtrailingInventory' \
-                  '%2CquarterlyInventoriesAdjustmentsAllowances%2CtrailingInventoriesAdjustmentsAllowances' \
-                  '%2CquarterlyOtherInventories%2CtrailingOtherInventories%2CquarterlyFinishedGoods' \
-                  '%2CtrailingFinishedGoods%2CquarterlyWorkInProcess%2CtrailingWorkInProcess%2CquarterlyRawMaterials' \
-                  '%2CtrailingRawMaterials%2CquarterlyReceivables%2CtrailingReceivables' \
-                  '%2CquarterlyReceivablesAdjustmentsAllowances%2CtrailingReceivablesAdjustmentsAllowances' \
-                  '%2CquarterlyOtherReceivables%2CtrailingOtherReceivables%2CquarterlyDuefromRelatedPartiesCurrent' \
-                  '%2CtrailingDuefromRelatedPartiesCurrent%2CquarterlyTaxesReceivable%2CtrailingTaxesReceivable' \
-                  '%2CquarterlyAccruedInterestReceivable%2CtrailingAccruedInterestReceivable' \
-                  '%2CquarterlyNotesReceivable%2CtrailingNotesReceivable%2CquarterlyLoansReceivable' \
-                  '%2CtrailingLoansReceivable%2CquarterlyAccountsReceivable%2CtrailingAccountsReceivable' \
-                  '%2CquarterlyAllowanceForDoubtfulAccountsReceivable' \
-                  '%2CtrailingAllowanceForDoubtfulAccountsReceivable%2CquarterlyGrossAccountsReceivable' \
-                  '%2CtrailingGrossAccountsReceivable%2CquarterlyCashCashEquivalentsAndShortTermInvestments' \
-                  '%2CtrailingCashCashEquivalentsAndShortTermInvestments%2CquarterlyOtherShortTermInvestments' \
-                  '%2CtrailingOtherShortTermInvestments%2CquarterlyCashAndCashEquivalents' \
-                  '%2CtrailingCashAndCashEquivalents%2CquarterlyCashEquivalents%2CtrailingCashEquivalents' \
-                  '%2CquarterlyCashFinancial%2CtrailingCashFinancial&merge=false&corsDomain=finance.yahoo.com '
+def __getattr__(name):
+    if name in _STATEMENTS:
+        from .fundamentals import build_query, statement_types
+        query = build_query(statement_types(*_STATEMENTS[name]))
+        globals()[name] = query
+        return query
 
-CASH_FLOW_ANNUAL = '?lang=en-US&region=US&padTimeSeries=true&type=annualForeignSales%2CtrailingForeignSales' \
-                   '%2CannualDomesticSales%2CtrailingDomesticSales%2CannualAdjustedGeographySegmentData' \
-                   '%2CtrailingAdjustedGeographySegmentData%2CannualFreeCashFlow%2CtrailingFreeCashFlow' \
-                   '%2CannualRepurchaseOfCapitalStock%2CtrailingRepurchaseOfCapitalStock%2CannualRepaymentOfDebt' \
-                   '%2CtrailingRepaymentOfDebt%2CannualIssuanceOfDebt%2CtrailingIssuanceOfDebt' \
-                   '%2CannualIssuanceOfCapitalStock%2CtrailingIssuanceOfCapitalStock%2CannualCapitalExpenditure' \
-                   '%2CtrailingCapitalExpenditure%2CannualInterestPaidSupplementalData' \
-                   '%2CtrailingInterestPaidSupplementalData%2CannualIncomeTaxPaidSupplementalData' \
-                   '%2CtrailingIncomeTaxPaidSupplementalData%2CannualEndCashPosition%2CtrailingEndCashPosition' \
-                   '%2CannualOtherCashAdjustmentOutsideChangeinCash%2CtrailingOtherCashAdjustmentOutsideChangeinCash' \
-                   '%2CannualBeginningCashPosition%2CtrailingBeginningCashPosition' \
-                   '%2CannualEffectOfExchangeRateChanges%2CtrailingEffectOfExchangeRateChanges%2CannualChangesInCash' \
-                   '%2CtrailingChangesInCash%2CannualOtherCashAdjustmentInsideChangeinCash' \
-                   '%2CtrailingOtherCashAdjustmentInsideChangeinCash%2CannualCashFlowFromDiscontinuedOperation' \
-                   '%2CtrailingCashFlowFromDiscontinuedOperation%2CannualFinancingCashFlow' \
-                   '%2CtrailingFinancingCashFlow%2CannualCashFromDiscontinuedFinancingActivities' \
-                   '%2CtrailingCashFromDiscontinuedFinancingActivities' \
-                   '%2CannualCashFlowFromContinuingFinancingActivities' \
-                   '%2CtrailingCashFlowFromContinuingFinancingActivities%2CannualNetOtherFinancingCharges' \
-                   '%2CtrailingNetOtherFinancingCharges%2CannualInterestPaidCFF%2CtrailingInterestPaidCFF' \
-                   '%2CannualProceedsFromStockOptionExercised%2CtrailingProceedsFromStockOptionExercised' \
-                   '%2CannualCashDividendsPaid%2CtrailingCashDividendsPaid%2CannualPreferredStockDividendPaid' \
-                   '%2CtrailingPreferredStockDividendPaid%2CannualCommonStockDividendPaid' \
-                   '%2CtrailingCommonStockDividendPaid%2CannualNetPreferredStockIssuance' \
-                   '%2CtrailingNetPreferredStockIssuance%2CannualPreferredStockPayments' \
-                   '%2CtrailingPreferredStockPayments%2CannualPreferredStockIssuance%2CtrailingPreferredStockIssuance' \
-                   '%2CannualNetCommonStockIssuance%2CtrailingNetCommonStockIssuance%2CannualCommonStockPayments' \
-                   '%2CtrailingCommonStockPayments%2CannualCommonStockIssuance%2CtrailingCommonStockIssuance' \
-                   '%2CannualNetIssuancePaymentsOfDebt%2CtrailingNetIssuancePaymentsOfDebt' \
-                   '%2CannualNetShortTermDebtIssuance%2CtrailingNetShortTermDebtIssuance' \
-                   '%2CannualShortTermDebtPayments%2CtrailingShortTermDebtPayments%2CannualShortTermDebtIssuance' \
-                   '%2CtrailingShortTermDebtIssuance%2CannualNetLongTermDebtIssuance' \
-                   '%2CtrailingNetLongTermDebtIssuance%2CannualLongTermDebtPayments%2CtrailingLongTermDebtPayments' \
-                   '%2CannualLongTermDebtIssuance%2CtrailingLongTermDebtIssuance%2CannualInvestingCashFlow' \
-                   '%2CtrailingInvestingCashFlow%2CannualCashFromDiscontinuedInvestingActivities' \
-                   '%2CtrailingCashFromDiscontinuedInvestingActivities' \
-                   '%2CannualCashFlowFromContinuingInvestingActivities' \
-                   '%2CtrailingCashFlowFromContinuingInvestingActivities%2CannualNetOtherInvestingChanges' \
-                   '%2CtrailingNetOtherInvestingChanges%2CannualInterestReceivedCFI%2CtrailingInterestReceivedCFI' \
-                   '%2CannualDividendsReceivedCFI%2CtrailingDividendsReceivedCFI%2CannualNetInvestmentPurchaseAndSale' \
-                   '%2CtrailingNetInvestmentPurchaseAndSale%2CannualSaleOfInvestment%2CtrailingSaleOfInvestment' \
-                   '%2CannualPurchaseOfInvestment%2CtrailingPurchaseOfInvestment' \
-                   '%2CannualNetInvestmentPropertiesPurchaseAndSale%2CtrailingNetInvestmentPropertiesPurchaseAndSale' \
-                   '%2CannualSaleOfInvestmentProperties%2CtrailingSaleOfInvestmentProperties' \
-                   '%2CannualPurchaseOfInvestmentProperties%2CtrailingPurchaseOfInvestmentProperties' \
-                   '%2CannualNetBusinessPurchaseAndSale%2CtrailingNetBusinessPurchaseAndSale%2CannualSaleOfBusiness' \
-                   '%2CtrailingSaleOfBusiness%2CannualPurchaseOfBusiness%2CtrailingPurchaseOfBusiness' \
-                   '%2CannualNetIntangiblesPurchaseAndSale%2CtrailingNetIntangiblesPurchaseAndSale' \
-                   '%2CannualSaleOfIntangibles%2CtrailingSaleOfIntangibles%2CannualPurchaseOfIntangibles' \
-                   '%2CtrailingPurchaseOfIntangibles%2CannualNetPPEPurchaseAndSale%2CtrailingNetPPEPurchaseAndSale' \
-                   '%2CannualSaleOfPPE%2CtrailingSaleOfPPE%2CannualPurchaseOfPPE%2CtrailingPurchaseOfPPE' \
-                   '%2CannualCapitalExpenditureReported%2CtrailingCapitalExpenditureReported' \
-                   '%2CannualOperatingCashFlow%2CtrailingOperatingCashFlow' \
-                   '%2CannualCashFromDiscontinuedOperatingActivities' \
-                   '%2CtrailingCashFromDiscontinuedOperatingActivities' \
-                   '%2CannualCashFlowFromContinuingOperatingActivities' \
-                   '%2CtrailingCashFlowFromContinuingOperatingActivities%2CannualTaxesRefundPaid' \
-                   '%2CtrailingTaxesRefundPaid%2CannualInterestReceivedCFO%2CtrailingInterestReceivedCFO' \
-                   '%2CannualInterestPaidCFO%2CtrailingInterestPaidCFO%2CannualDividendReceivedCFO' \
-                   '%2CtrailingDividendReceivedCFO%2CannualDividendPaidCFO%2CtrailingDividendPaidCFO' \
-                   '%2CannualChangeInWorkingCapital%2CtrailingChangeInWorkingCapital' \
-                   '%2CannualChangeInOtherWorkingCapital%2CtrailingChangeInOtherWorkingCapital' \
-                   '%2CannualChangeInOtherCurrentLiabilities%2CtrailingChangeInOtherCurrentLiabilities' \
-                   '%2CannualChangeInOtherCurrentAssets%2CtrailingChangeInOtherCurrentAssets' \
-                   '%2CannualChangeInPayablesAndAccruedExpense%2CtrailingChangeInPayablesAndAccruedExpense' \
-                   '%2CannualChangeInAccruedExpense%2CtrailingChangeInAccruedExpense%2CannualChangeInInterestPayable' \
-                   '%2CtrailingChangeInInterestPayable%2CannualChangeInPayable%2CtrailingChangeInPayable' \
-                   '%2CannualChangeInDividendPayable%2CtrailingChangeInDividendPayable%2CannualChangeInAccountPayable' \
-                   '%2CtrailingChangeInAccountPayable%2CannualChangeInTaxPayable%2CtrailingChangeInTaxPayable' \
-                   '%2CannualChangeInIncomeTaxPayable%2CtrailingChangeInIncomeTaxPayable' \
-                   '%2CannualChangeInPrepaidAssets%2CtrailingChangeInPrepaidAssets%2CannualChangeInInventory' \
-                   '%2CtrailingChangeInInventory%2CannualChangeInReceivables%2CtrailingChangeInReceivables' \
-                   '%2CannualChangesInAccountReceivables%2CtrailingChangesInAccountReceivables' \
-                   '%2CannualOtherNonCashItems%2CtrailingOtherNonCashItems' \
-                   '%2CannualExcessTaxBenefitFromStockBasedCompensation' \
-                   '%2CtrailingExcessTaxBenefitFromStockBasedCompensation%2CannualStockBasedCompensation' \
-                   '%2CtrailingStockBasedCompensation%2CannualUnrealizedGainLossOnInvestmentSecurities' \
-                   '%2CtrailingUnrealizedGainLossOnInvestmentSecurities%2CannualProvisionandWriteOffofAssets' \
-                   '%2CtrailingProvisionandWriteOffofAssets%2CannualAssetImpairmentCharge' \
-                   '%2CtrailingAssetImpairmentCharge%2CannualAmortizationOfSecurities' \
-                   '%2CtrailingAmortizationOfSecurities%2CannualDeferredTax%2CtrailingDeferredTax' \
-                   '%2CannualDeferredIncomeTax%2CtrailingDeferredIncomeTax%2CannualDepreciationAmortizationDepletion' \
-                   '%2CtrailingDepreciationAmortizationDepletion%2CannualDepletion%2CtrailingDepletion' \
-                   '%2CannualDepreciationAndAmortization%2CtrailingDepreciationAndAmortization' \
-                   '%2CannualAmortizationCashFlow%2CtrailingAmortizationCashFlow%2CannualAmortizationOfIntangibles' \
-                   '%2CtrailingAmortizationOfIntangibles%2CannualDepreciation%2CtrailingDepreciation' \
-                   '%2CannualOperatingGainsLosses%2CtrailingOperatingGainsLosses' \
-                   '%2CannualPensionAndEmployeeBenefitExpense%2CtrailingPensionAndEmployeeBenefitExpense' \
-                   '%2CannualEarningsLossesFromEquityInvestments%2CtrailingEarningsLossesFromEquityInvestments' \
-                   '%2CannualGainLossOnInvestmentSecurities%2CtrailingGainLossOnInvestmentSecurities' \
-                   '%2CannualNetForeignCurrencyExchangeGainLoss%2CtrailingNetForeignCurrencyExchangeGainLoss' \
-                   '%2CannualGainLossOnSaleOfPPE%2CtrailingGainLossOnSaleOfPPE%2CannualGainLossOnSaleOfBusiness' \
-                   '%2CtrailingGainLossOnSaleOfBusiness%2CannualNetIncomeFromContinuingOperations' \
-                   '%2CtrailingNetIncomeFromContinuingOperations%2CannualCashFlowsfromusedinOperatingActivitiesDirect' \
-                   '%2CtrailingCashFlowsfromusedinOperatingActivitiesDirect%2CannualTaxesRefundPaidDirect' \
-                   '%2CtrailingTaxesRefundPaidDirect%2CannualInterestReceivedDirect%2CtrailingInterestReceivedDirect' \
-                   '%2CannualInterestPaidDirect%2CtrailingInterestPaidDirect%2CannualDividendsReceivedDirect' \
-                   '%2CtrailingDividendsReceivedDirect%2CannualDividendsPaidDirect%2CtrailingDividendsPaidDirect' \
-                   '%2CannualClassesofCashPayments%2CtrailingClassesofCashPayments' \
-                   '%2CannualOtherCashPaymentsfromOperatingActivities' \
-                   '%2CtrailingOtherCashPaymentsfromOperatingActivities%2CannualPaymentsonBehalfofEmployees' \
-                   '%2CtrailingPaymentsonBehalfofEmployees%2CannualPaymentstoSuppliersforGoodsandServices' \
-                   '%2CtrailingPaymentstoSuppliersforGoodsandServices' \
-                   '%2CannualClassesofCashReceiptsfromOperatingActivities' \
-                   '%2CtrailingClassesofCashReceiptsfromOperatingActivities' \
-                   '%2CannualOtherCashReceiptsfromOperatingActivities' \
-                   '%2CtrailingOtherCashReceiptsfromOperatingActivities%2CannualReceiptsfromGovernmentGrants' \
-                   '%2CtrailingReceiptsfromGovernmentGrants%2CannualReceiptsfromCustomers' \
-                   '%2CtrailingReceiptsfromCustomers&merge=false&corsDomain=finance.yahoo.com '
-
-CASH_FLOW_QUARTER = '?lang=en-US&region=US&padTimeSeries=true&type=quarterlyForeignSales%2CtrailingForeignSales' \
-                    '%2CquarterlyDomesticSales%2CtrailingDomesticSales%2CquarterlyAdjustedGeographySegmentData' \
-                    '%2CtrailingAdjustedGeographySegmentData%2CquarterlyFreeCashFlow%2CtrailingFreeCashFlow' \
-                    '%2CquarterlyRepurchaseOfCapitalStock%2CtrailingRepurchaseOfCapitalStock' \
-                    '%2CquarterlyRepaymentOfDebt%2CtrailingRepaymentOfDebt%2CquarterlyIssuanceOfDebt' \
-                    '%2CtrailingIssuanceOfDebt%2CquarterlyIssuanceOfCapitalStock%2CtrailingIssuanceOfCapitalStock' \
-                    '%2CquarterlyCapitalExpenditure%2CtrailingCapitalExpenditure' \
-                    '%2CquarterlyInterestPaidSupplementalData%2CtrailingInterestPaidSupplementalData' \
-                    '%2CquarterlyIncomeTaxPaidSupplementalData%2CtrailingIncomeTaxPaidSupplementalData' \
-                    '%2CquarterlyEndCashPosition%2CtrailingEndCashPosition' \
-                    '%2CquarterlyOtherCashAdjustmentOutsideChangeinCash' \
-                    '%2CtrailingOtherCashAdjustmentOutsideChangeinCash%2CquarterlyBeginningCashPosition' \
-                    '%2CtrailingBeginningCashPosition%2CquarterlyEffectOfExchangeRateChanges' \
-                    '%2CtrailingEffectOfExchangeRateChanges%2CquarterlyChangesInCash%2CtrailingChangesInCash' \
-                    '%2CquarterlyOtherCashAdjustmentInsideChangeinCash' \
-                    '%2CtrailingOtherCashAdjustmentInsideChangeinCash%2CquarterlyCashFlowFromDiscontinuedOperation' \
-                    '%2CtrailingCashFlowFromDiscontinuedOperation%2CquarterlyFinancingCashFlow' \
-                    '%2CtrailingFinancingCashFlow%2CquarterlyCashFromDiscontinuedFinancingActivities' \
-                    '%2CtrailingCashFromDiscontinuedFinancingActivities' \
-                    '%2CquarterlyCashFlowFromContinuingFinancingActivities' \
-                    '%2CtrailingCashFlowFromContinuingFinancingActivities%2CquarterlyNetOtherFinancingCharges' \
-                    '%2CtrailingNetOtherFinancingCharges%2CquarterlyInterestPaidCFF%2CtrailingInterestPaidCFF' \
-                    '%2CquarterlyProceedsFromStockOptionExercised%2CtrailingProceedsFromStockOptionExercised' \
-                    '%2CquarterlyCashDividendsPaid%2CtrailingCashDividendsPaid%2CquarterlyPreferredStockDividendPaid' \
-                    '%2CtrailingPreferredStockDividendPaid%2CquarterlyCommonStockDividendPaid' \
-                    '%2CtrailingCommonStockDividendPaid%2CquarterlyNetPreferredStockIssuance' \
-                    '%2CtrailingNetPreferredStockIssuance%2CquarterlyPreferredStockPayments' \
-                    '%2CtrailingPreferredStockPayments%2CquarterlyPreferredStockIssuance' \
-                    '%2CtrailingPreferredStockIssuance%2CquarterlyNetCommonStockIssuance' \
-                    '%2CtrailingNetCommonStockIssuance%2CquarterlyCommonStockPayments%2CtrailingCommonStockPayments' \
-                    '%2CquarterlyCommonStockIssuance%2CtrailingCommonStockIssuance' \
-                    '%2CquarterlyNetIssuancePaymentsOfDebt%2CtrailingNetIssuancePaymentsOfDebt' \
-                    '%2CquarterlyNetShortTermDebtIssuance%2CtrailingNetShortTermDebtIssuance' \
-                    '%2CquarterlyShortTermDebtPayments%2CtrailingShortTermDebtPayments' \
-                    '%2CquarterlyShortTermDebtIssuance%2CtrailingShortTermDebtIssuance' \
-                    '%2CquarterlyNetLongTermDebtIssuance%2CtrailingNetLongTermDebtIssuance' \
-                    '%2CquarterlyLongTermDebtPayments%2CtrailingLongTermDebtPayments%2CquarterlyLongTermDebtIssuance' \
-                    '%2CtrailingLongTermDebtIssuance%2CquarterlyInvestingCashFlow%2CtrailingInvestingCashFlow' \
-                    '%2CquarterlyCashFromDiscontinuedInvestingActivities' \
-                    '%2CtrailingCashFromDiscontinuedInvestingActivities' \
-                    '%2CquarterlyCashFlowFromContinuingInvestingActivities' \
-                    '%2CtrailingCashFlowFromContinuingInvestingActivities%2CquarterlyNetOtherInvestingChanges' \
-                    '%2CtrailingNetOtherInvestingChanges%2CquarterlyInterestReceivedCFI%2CtrailingInterestReceivedCFI' \
-                    '%2CquarterlyDividendsReceivedCFI%2CtrailingDividendsReceivedCFI' \
-                    '%2CquarterlyNetInvestmentPurchaseAndSale%2CtrailingNetInvestmentPurchaseAndSale' \
-                    '%2CquarterlySaleOfInvestment%2CtrailingSaleOfInvestment%2CquarterlyPurchaseOfInvestment' \
-                    '%2CtrailingPurchaseOfInvestment%2CquarterlyNetInvestmentPropertiesPurchaseAndSale' \
-                    '%2CtrailingNetInvestmentPropertiesPurchaseAndSale%2CquarterlySaleOfInvestmentProperties' \
-                    '%2CtrailingSaleOfInvestmentProperties%2CquarterlyPurchaseOfInvestmentProperties' \
-                    '%2CtrailingPurchaseOfInvestmentProperties%2CquarterlyNetBusinessPurchaseAndSale' \
-                    '%2CtrailingNetBusinessPurchaseAndSale%2CquarterlySaleOfBusiness%2CtrailingSaleOfBusiness' \
-                    '%2CquarterlyPurchaseOfBusiness%2CtrailingPurchaseOfBusiness' \
-                    '%2CquarterlyNetIntangiblesPurchaseAndSale%2CtrailingNetIntangiblesPurchaseAndSale' \
-                    '%2CquarterlySaleOfIntangibles%2CtrailingSaleOfIntangibles%2CquarterlyPurchaseOfIntangibles' \
-                    '%2CtrailingPurchaseOfIntangibles%2CquarterlyNetPPEPurchaseAndSale' \
-                    '%2CtrailingNetPPEPurchaseAndSale%2CquarterlySaleOfPPE%2CtrailingSaleOfPPE' \
-                    '%2CquarterlyPurchaseOfPPE%2CtrailingPurchaseOfPPE%2CquarterlyCapitalExpenditureReported' \
-                    '%2CtrailingCapitalExpenditureReported%2CquarterlyOperatingCashFlow%2CtrailingOperatingCashFlow' \
-                    '%2CquarterlyCashFromDiscontinuedOperatingActivities' \
-                    '%2CtrailingCashFromDiscontinuedOperatingActivities' \
-                    '%2CquarterlyCashFlowFromContinuingOperatingActivities' \
-                    '%2CtrailingCashFlowFromContinuingOperatingActivities%2CquarterlyTaxesRefundPaid' \
-                    '%2CtrailingTaxesRefundPaid%2CquarterlyInterestReceivedCFO%2CtrailingInterestReceivedCFO' \
-                    '%2CquarterlyInterestPaidCFO%2CtrailingInterestPaidCFO%2CquarterlyDividendReceivedCFO' \
-                    '%2CtrailingDividendReceivedCFO%2CquarterlyDividendPaidCFO%2CtrailingDividendPaidCFO' \
-                    '%2CquarterlyChangeInWorkingCapital%2CtrailingChangeInWorkingCapital' \
-                    '%2CquarterlyChangeInOtherWorkingCapital%2CtrailingChangeInOtherWorkingCapital' \
-                    '%2CquarterlyChangeInOtherCurrentLiabilities%2CtrailingChangeInOtherCurrentLiabilities' \
-                    '%2CquarterlyChangeInOtherCurrentAssets%2CtrailingChangeInOtherCurrentAssets' \
-                    '%2CquarterlyChangeInPayablesAndAccruedExpense%2CtrailingChangeInPayablesAndAccruedExpense' \
-                    '%2CquarterlyChangeInAccruedExpense%2CtrailingChangeInAccruedExpense' \
-                    '%2CquarterlyChangeInInterestPayable%2CtrailingChangeInInterestPayable%2CquarterlyChangeInPayable' \
-                    '%2CtrailingChangeInPayable%2CquarterlyChangeInDividendPayable%2CtrailingChangeInDividendPayable' \
-                    '%2CquarterlyChangeInAccountPayable%2CtrailingChangeInAccountPayable' \
-                    '%2CquarterlyChangeInTaxPayable%2CtrailingChangeInTaxPayable%2CquarterlyChangeInIncomeTaxPayable' \
-                    '%2CtrailingChangeInIncomeTaxPayable%2CquarterlyChangeInPrepaidAssets' \
-                    '%2CtrailingChangeInPrepaidAssets%2CquarterlyChangeInInventory%2CtrailingChangeInInventory' \
-                    '%2CquarterlyChangeInReceivables%2CtrailingChangeInReceivables' \
-                    '%2CquarterlyChangesInAccountReceivables%2CtrailingChangesInAccountReceivables' \
-                    '%2CquarterlyOtherNonCashItems%2CtrailingOtherNonCashItems' \
-                    '%2CquarterlyExcessTaxBenefitFromStockBasedCompensation' \
-                    '%2CtrailingExcessTaxBenefitFromStockBasedCompensation%2CquarterlyStockBasedCompensation' \
-                    '%2CtrailingStockBasedCompensation%2CquarterlyUnrealizedGainLossOnInvestmentSecurities' \
-                    '%2CtrailingUnrealizedGainLossOnInvestmentSecurities%2CquarterlyProvisionandWriteOffofAssets' \
-                    '%2CtrailingProvisionandWriteOffofAssets%2CquarterlyAssetImpairmentCharge' \
-                    '%2CtrailingAssetImpairmentCharge%2CquarterlyAmortizationOfSecurities' \
-                    '%2CtrailingAmortizationOfSecurities%2CquarterlyDeferredTax%2CtrailingDeferredTax' \
-                    '%2CquarterlyDeferredIncomeTax%2CtrailingDeferredIncomeTax' \
-                    '%2CquarterlyDepreciationAmortizationDepletion%2CtrailingDepreciationAmortizationDepletion' \
-                    '%2CquarterlyDepletion%2CtrailingDepletion%2CquarterlyDepreciationAndAmortization' \
-                    '%2CtrailingDepreciationAndAmortization%2CquarterlyAmortizationCashFlow' \
-                    '%2CtrailingAmortizationCashFlow%2CquarterlyAmortizationOfIntangibles' \
-                    '%2CtrailingAmortizationOfIntangibles%2CquarterlyDepreciation%2CtrailingDepreciation' \
-                    '%2CquarterlyOperatingGainsLosses%2CtrailingOperatingGainsLosses' \
-                    '%2CquarterlyPensionAndEmployeeBenefitExpense%2CtrailingPensionAndEmployeeBenefitExpense' \
-                    '%2CquarterlyEarningsLossesFromEquityInvestments%2CtrailingEarningsLossesFromEquityInvestments' \
-                    '%2CquarterlyGainLossOnInvestmentSecurities%2CtrailingGainLossOnInvestmentSecurities' \
-                    '%2CquarterlyNetForeignCurrencyExchangeGainLoss%2CtrailingNetForeignCurrencyExchangeGainLoss' \
-                    '%2CquarterlyGainLossOnSaleOfPPE%2CtrailingGainLossOnSaleOfPPE' \
-                    '%2CquarterlyGainLossOnSaleOfBusiness%2CtrailingGainLossOnSaleOfBusiness' \
-                    '%2CquarterlyNetIncomeFromContinuingOperations%2CtrailingNetIncomeFromContinuingOperations' \
-                    '%2CquarterlyCashFlowsfromusedinOperatingActivitiesDirect' \
-                    '%2CtrailingCashFlowsfromusedinOperatingActivitiesDirect%2CquarterlyTaxesRefundPaidDirect' \
-                    '%2CtrailingTaxesRefundPaidDirect%2CquarterlyInterestReceivedDirect' \
-                    '%2CtrailingInterestReceivedDirect%2CquarterlyInterestPaidDirect%2CtrailingInterestPaidDirect' \
-                    '%2CquarterlyDividendsReceivedDirect%2CtrailingDividendsReceivedDirect' \
-                    '%2CquarterlyDividendsPaidDirect%2CtrailingDividendsPaidDirect%2CquarterlyClassesofCashPayments' \
-                    '%2CtrailingClassesofCashPayments%2CquarterlyOtherCashPaymentsfromOperatingActivities' \
-                    '%2CtrailingOtherCashPaymentsfromOperatingActivities%2CquarterlyPaymentsonBehalfofEmployees' \
-                    '%2CtrailingPaymentsonBehalfofEmployees%2CquarterlyPaymentstoSuppliersforGoodsandServices' \
-                    '%2CtrailingPaymentstoSuppliersforGoodsandServices' \
-                    '%2CquarterlyClassesofCashReceiptsfromOperatingActivities' \
-                    '%2CtrailingClassesofCashReceiptsfromOperatingActivities' \
-                    '%2CquarterlyOtherCashReceiptsfromOperatingActivities' \
-                    '%2CtrailingOtherCashReceiptsfromOperatingActivities%2CquarterlyReceiptsfromGovernmentGrants' \
-                    '%2CtrailingReceiptsfromGovernmentGrants%2CquarterlyReceiptsfromCustomers' \
-                    '%2CtrailingReceiptsfromCustomers&merge=false&corsDomain=finance.yahoo.com '
-
-# add that to the url
-FUNDAMENTAL_FORMATTER = '&period1={period1}&period2={period2}&symbol={symbol}'
+    raise AttributeError(f'module {__name__} has no attribute {name}')
@@ -0,0 +1,188 @@
+"""
+Request priorities, interactive requests go before normal ones, normal before bulk,
+and fair queuing between flows (jobs, tenants) of the same priority
+"""
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from collections import deque
+from typing import AnyStr, Deque, Dict, Hashable, Optional, Tuple
+
+PRIORITIES = ('interactive', 'normal', 'bulk')  # index is priority, lower goes first
+INTERACTIVE, NORMAL, BULK = range(len(PRIORITIES))
+
+_priority: ContextVar[int] = ContextVar('priority', default=NORMAL)
+_flow: ContextVar[Tuple[Hashable, float]] = ContextVar('flow', default=(None, 1.))  # (flow, weight)
+
+
+@contextmanager
+def request_priority(name: AnyStr):
+    """
+    requests made inside the block, and in tasks started there, have this priority
+    :param name: any of PRIORITIES
+    """
+    if name not in PRIORITIES:
+        raise ValueError(f'unknown priority {name}, use any of {PRIORITIES}')
+
+    token = _priority.set(PRIORITIES.index(name))
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> int:
+    return _priority.get()
+
+
+@contextmanager
+def request_flow(flow: Hashable, weight: float = 1.):
+    """
+    requests made inside the block belong to flow, waiting flows of the same priority
+    get free slots and rate in turns proportional to their weights
+    :param flow: name of job or tenant
+    :param weight: share of turns, relative to other flows
+    """
+    if weight <= 0:
+        raise ValueError('weight must be positive')
+
+    token = _flow.set((flow, weight))
+    try:
+        yield
+    finally:
+        _flow.reset(token)
+
+
+def current_flow() -> Optional[Hashable]:
+    return _flow.get()[0]
+
+
+class FairQueue:
+    """
+    waiters of one priority, flows are served by deficit round robin,
+    flow with weight 2 gets twice the turns of flow with weight 1, inside a flow waiters keep their order
+    """
+    def __init__(self):
+        self._flows: Dict[Hashable, Deque[asyncio.Future]] = {}
+        self._weights: Dict[Hashable, float] = {}
+        self._deficits: Dict[Hashable, float] = {}
+        self._active: Deque[Hashable] = deque()  # flows with waiters in round robin order
+
+    def push(self, flow: Hashable, weight: float, future: asyncio.Future):
+        if flow not in self._flows:
+            self._flows[flow] = deque()
+            self._deficits[flow] = 0.
+            self._active.append(flow)
+        self._flows[flow].append(future)
+        self._weights[flow] = weight
+
+    def __bool__(self):
+        """
+        True if there is a waiter that is not cancelled
+        """
+        while self._active:
+            waiters = self._flows[self._active[0]]
+            while waiters and waiters[0].done():
+                waiters.popleft()
+            if waiters:
+                return True
+            self._remove(self._active.popleft())
+        return False
+
+    def pop(self) -> asyncio.Future:
+        """
+        next waiter, queue must not be empty
+        """
+        while True:
+            if not self:
+                raise IndexError('pop from empty queue')
+
+            flow = self._active[0]
+            if self._deficits[flow] < 1:  # new turn of flow
+                self._deficits[flow] += self._weights[flow]
+                if self._deficits[flow] < 1:
+                    self._active.rotate(-1)
+                    continue
+
+            self._deficits[flow] -= 1
+            future = self._flows[flow].popleft()
+            if self._deficits[flow] < 1:  # turn is over
+                self._active.rotate(-1)
+            return future
+
+    def _remove(self, flow: Hashable):
+        del self._flows[flow]
+        del self._weights[flow]
+        del self._deficits[flow]
+
+
+class PriorityWaiters:
+    """
+    futures of waiting requests, the most important ones are woken first,
+    flows of the same priority share wakes fairly
+    """
+    def __init__(self):
+        self._queues = [FairQueue() for _ in PRIORITIES]
+
+    def add(self, priority: int) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        flow, weight = _flow.get()
+        self._queues[priority].push(flow, weight, future)
+        return future
+
+    def peek(self) -> Optional[int]:
+        """
+        :return: priority of the next waiter or None
+        """
+        for priority, queue in enumerate(self._queues):
+            if queue:
+                return priority
+        return None
+
+    def wake(self):
+        self._queues[self.peek()].pop().set_result(None)
+
+
+class PrioritySemaphore:
+    """
+    semaphore that gives free slots to the most important waiter,
+    bulk requests can not take the reserved slots
+    """
+    def __init__(self, value: int, reserved: int = 0):
+        """
+        :param value: slots
+        :param reserved: slots kept for interactive and normal requests, at least one slot stays for bulk
+        """
+        self._value = value
+        self.reserved = max(0, min(reserved, value - 1))
+        self._waiters = PriorityWaiters()
+
+    async def acquire(self, priority: Optional[int] = None):
+        future = self._waiters.add(current_priority() if priority is None else priority)
+        self._wake()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():  # slot was given just before cancel
+                self.release()
+            raise
+
+    def release(self):
+        self._value += 1
+        self._wake()
+
+    def locked(self) -> bool:
+        return self._value == 0
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, *args):
+        self.release()
+
+    def _wake(self):
+        while (priority := self._waiters.peek()) is not None:
+            if self._value <= (self.reserved if priority >= BULK else 0):
+                break
+            self._value -= 1
+            self._waiters.wake()
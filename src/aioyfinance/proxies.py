@@ -0,0 +1,142 @@
+"""
+Proxy pool with health scoring and per proxy limits
+"""
+from __future__ import annotations
+import asyncio
+from random import choices
+from time import monotonic
+from typing import AnyStr, Dict, List, Optional
+
+
+class ProxyState:
+    """
+    health and limits of a single proxy
+    """
+    def __init__(self, url: AnyStr):
+        self.url = url
+        self.requests = 0
+        self.errors = 0
+        self.active = 0
+        self.latency: Optional[float] = None  # moving average of successful requests
+        self.error_rate = 0.  # moving average of failures
+        self.failures = 0  # failures in a row
+        self.ejections = 0  # ejections in a row, backoff grows with them
+        self.ejected_until = 0.
+        self.next_allowed = 0.  # time of the next request allowed by rate limit
+
+    def weight(self, default_latency: float) -> float:
+        latency = self.latency if self.latency is not None else default_latency
+        return max(1 - self.error_rate, 0.01) / max(latency, 0.001)
+
+    def as_dict(self) -> Dict:
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'error_rate': self.error_rate,
+            'latency': self.latency,
+            'active': self.active,
+            'ejected': self.ejected_until > monotonic(),
+        }
+
+
+class ProxyPool:
+    """
+    picks proxies weighted by latency and error rate,
+    proxies failing several times in a row are ejected for a growing time
+    """
+    smoothing = 0.2
+    max_backoff = 600
+    poll_delay = 0.05
+
+    def __init__(self, urls: List[AnyStr], max_active: Optional[int] = None, rate: Optional[float] = None,
+                 eject_after: int = 3, eject_backoff: float = 30):
+        """
+        :param urls: proxies urls
+        :param max_active: maximum requests active through one proxy, None for no limit
+        :param rate: maximum requests per second through one proxy, None for no limit
+        :param eject_after: failures in a row before proxy is ejected
+        :param eject_backoff: seconds of the first ejection, doubles with every next one
+        """
+        self._states = {url: ProxyState(url) for url in urls}
+        self.max_active = max_active
+        self.rate = rate
+        self.eject_after = eject_after
+        self.eject_backoff = eject_backoff
+
+    def __len__(self):
+        return len(self._states)
+
+    def stats(self) -> Dict[AnyStr, Dict]:
+        """
+        :return: dict proxy -> its statistics
+        """
+        return {url: state.as_dict() for url, state in self._states.items()}
+
+    def pick(self, exclude: Optional[AnyStr] = None) -> AnyStr:
+        """
+        picks proxy by health without waiting for limits
+        """
+        candidates = self._candidates(monotonic(), exclude, limits=False)
+        return self._choose(candidates).url
+
+    async def acquire(self, exclude: Optional[AnyStr] = None) -> AnyStr:
+        """
+        waits for proxy with free slot and rate, it has to be released after request
+        :param exclude: proxy to avoid if there are others available
+        """
+        while True:
+            now = monotonic()
+            candidates = self._candidates(now, exclude, limits=True)
+            if candidates:
+                state = self._choose(candidates)
+                state.active += 1
+                if self.rate:
+                    state.next_allowed = max(now, state.next_allowed) + 1 / self.rate
+                return state.url
+
+            waits = [state.next_allowed - now for state in self._states.values() if state.next_allowed > now]
+            await asyncio.sleep(min(waits + [self.poll_delay]))
+
+    def release(self, url: AnyStr, latency: Optional[float] = None, failed: bool = False):
+        """
+        frees slot of proxy and scores it
+        :param latency: seconds of successful request
+        :param failed: request failed because of network or timeout
+        None latency and failed False only frees slot, e.g. when request was cancelled
+        """
+        state = self._states[url]
+        state.active -= 1
+        if failed:
+            state.requests += 1
+            state.errors += 1
+            state.failures += 1
+            state.error_rate += self.smoothing * (1 - state.error_rate)
+            if state.failures >= self.eject_after:
+                state.ejected_until = monotonic() + min(self.eject_backoff * 2 ** state.ejections, self.max_backoff)
+                state.ejections += 1
+                state.failures = 0
+        elif latency is not None:
+            state.requests += 1
+            state.failures = 0
+            state.ejections = 0
+            state.error_rate -= self.smoothing * state.error_rate
+            if state.latency is None:
+                state.latency = latency
+            else:
+                state.latency += self.smoothing * (latency - state.latency)
+
+    def _candidates(self, now: float, exclude: Optional[AnyStr], limits: bool) -> List[ProxyState]:
+        states = list(self._states.values())
+        healthy = [state for state in states if state.ejected_until <= now]
+        candidates = healthy or states  # every proxy is ejected, probe them anyway instead of stalling
+        if limits:
+            candidates = [state for state in candidates if state.next_allowed <= now and
+                          (self.max_active is None or state.active < self.max_active)]
+        others = [state for state in candidates if state.url != exclude]
+        return others or candidates
+
+    def _choose(self, candidates: List[ProxyState]) -> ProxyState:
+        known = [state.latency for state in self._states.values() if state.latency is not None]
+        default_latency = sum(known) / len(known) if known else 1.
+        weights = [state.weight(default_latency) for state in candidates]
+        return choices(candidates, weights)[0]
@@ -0,0 +1,27 @@
+"""
+Instrument types of symbols, data that only equities have is not requested for the other types
+"""
+from sys import intern
+from typing import AnyStr, Dict, Optional
+
+EQUITY = 'EQUITY'
+
+# symbol -> instrument type (EQUITY, ETF, MUTUALFUND, INDEX, CURRENCY, CRYPTOCURRENCY, FUTURE...)
+# learned from chart meta and quote summary of any request, shared by every Ticker
+ASSET_TYPES: Dict[AnyStr, AnyStr] = {}
+
+
+def remember_type(symbol: AnyStr, asset_type: Optional[AnyStr]):
+    if asset_type:
+        ASSET_TYPES[symbol] = intern(asset_type.upper())
+
+
+def known_type(symbol: AnyStr) -> Optional[AnyStr]:
+    return ASSET_TYPES.get(symbol)
+
+
+def is_equity(asset_type: Optional[AnyStr]) -> bool:
+    """
+    unknown types are treated as equities, they are requested
+    """
+    return asset_type is None or asset_type == EQUITY
@@ -0,0 +1,169 @@
+"""
+Periodic refresh of watchlists
+"""
+import asyncio
+import inspect
+import json
+import logging
+from typing import AnyStr, Callable, Dict, Iterable, List, Optional, Tuple
+from .bulk import KINDS
+from .tickers import Ticker, normalize_symbol
+
+# Tickers methods of bulk KINDS are named as Ticker methods except profile
+TICKER_METHODS = {'get_profiles': 'get_profile'}
+# watchlists refresh recent bars instead of a year of daily ones
+DEFAULTS = {'timeseries': {'interval': '1m', 'range_': '1d'}}
+
+
+def kind_method(kind: AnyStr) -> Tuple[AnyStr, Dict]:
+    """
+    :return: Ticker method of kind and its default keywords
+    """
+    method, defaults = KINDS[kind]
+    return TICKER_METHODS.get(method, method), DEFAULTS.get(kind, defaults)
+
+
+class Refresh:
+    """
+    symbols of one kind refreshed every given seconds
+    """
+    def __init__(self, symbols: List[AnyStr], kind: AnyStr, every: float, fresh: float, kwargs: Dict):
+        self.symbols = symbols
+        self.kind = kind
+        self.every = every
+        self.fresh = fresh
+        self.kwargs = kwargs
+        # same kind with same keywords shares cache between refreshes
+        self.key = (kind, json.dumps(kwargs, sort_keys=True, default=str))
+
+
+class Scheduler:
+    """
+    refreshes every added (symbols, kind) on its own period, requests are spread evenly
+    over the period, values still fresh in cache are not requested again,
+    new values are published to subscribers
+    """
+    def __init__(self):
+        self._refreshes: List[Refresh] = []
+        self._subscribers: List[Tuple[Callable, Optional[set], Optional[set]]] = []
+        self._cache: Dict[Tuple, Tuple[float, object]] = {}  # (kind, keywords, symbol) -> (time, value)
+        self._in_flight = set()
+        self._tasks: List[asyncio.Task] = []
+        self._requests = set()  # running refreshes of single symbols
+
+    def add(self, symbols: Iterable[AnyStr], kind: AnyStr, every: float, fresh: Optional[float] = None,
+            **kwargs) -> Refresh:
+        """
+        :param symbols: watchlist
+        :param kind: any of KINDS
+        :param every: seconds between refreshes of every symbol
+        :param fresh: values younger than that many seconds are not requested, every / 2 if None
+        :param kwargs: keywords of Ticker method, e.g. interval and range_ for timeseries
+        """
+        if kind not in KINDS:
+            raise ValueError(f'unknown kind {kind}, use any of {tuple(KINDS)}')
+
+        refresh = Refresh(list(dict.fromkeys(normalize_symbol(symbol) for symbol in symbols)), kind, every,
+                          every / 2 if fresh is None else fresh, {**kind_method(kind)[1], **kwargs})
+        self._refreshes.append(refresh)
+        if self._tasks:  # already running
+            self._tasks.append(asyncio.ensure_future(self._run_refresh(refresh)))
+        return refresh
+
+    def subscribe(self, callback: Callable, kinds: Optional[Iterable[AnyStr]] = None,
+                  symbols: Optional[Iterable[AnyStr]] = None):
+        """
+        :param callback: called with (kind, symbol, value), value is exception if refresh failed,
+            coroutine functions are awaited
+        :param kinds: kinds to receive, every kind if None
+        :param symbols: symbols to receive, every symbol if None
+        """
+        self._subscribers.append((callback, None if kinds is None else set(kinds),
+                                  None if symbols is None else {normalize_symbol(symbol) for symbol in symbols}))
+
+    def unsubscribe(self, callback: Callable):
+        self._subscribers = [subscriber for subscriber in self._subscribers if subscriber[0] is not callback]
+
+    def latest(self, kind: AnyStr, symbol: AnyStr, **kwargs):
+        """
+        :return: last value of kind requested with keywords or None
+        """
+        keywords = json.dumps({**kind_method(kind)[1], **kwargs}, sort_keys=True, default=str)
+        key = (kind, keywords, normalize_symbol(symbol))
+        cached = self._cache.get(key)
+        return None if cached is None else cached[1]
+
+    def start(self):
+        """
+        starts refreshing in background on the running loop
+        """
+        self._tasks = [asyncio.ensure_future(self._run_refresh(refresh)) for refresh in self._refreshes]
+
+    async def run(self):
+        """
+        refreshes until stop is called, cancelling run stops refreshes and raises CancelledError
+        """
+        self.start()
+        tasks = self._tasks
+        try:
+            await asyncio.gather(*tasks)
+        except asyncio.CancelledError:
+            stopped = self._tasks is not tasks  # stop made new list
+            self.stop()
+            if not stopped:
+                raise
+
+    def stop(self):
+        for task in self._tasks + list(self._requests):
+            task.cancel()
+        self._tasks = []
+
+    async def _run_refresh(self, refresh: Refresh):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            step = refresh.every / max(len(refresh.symbols), 1)
+            for i, symbol in enumerate(refresh.symbols):
+                delay = start + i * step - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                # slow requests do not shift the schedule of the others
+                request = asyncio.ensure_future(self._refresh(refresh, symbol))
+                self._requests.add(request)
+                request.add_done_callback(self._requests.discard)
+
+            delay = start + refresh.every - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    async def _refresh(self, refresh: Refresh, symbol: AnyStr):
+        key = (*refresh.key, symbol)
+        loop = asyncio.get_running_loop()
+        cached = self._cache.get(key)
+        if key in self._in_flight or cached is not None and loop.time() - cached[0] < refresh.fresh:
+            return
+
+        self._in_flight.add(key)
+        try:
+            method, _ = kind_method(refresh.kind)
+            value = await getattr(Ticker(symbol), method)(**refresh.kwargs)
+        except Exception as e:  # pylint: disable=broad-except
+            logging.error(f'{refresh.kind} {symbol} refresh failed {e!r}')
+            value = e
+        else:
+            self._cache[key] = (loop.time(), value)
+        finally:
+            self._in_flight.discard(key)
+
+        await self._publish(refresh.kind, symbol, value)
+
+    async def _publish(self, kind: AnyStr, symbol: AnyStr, value):
+        for callback, kinds, symbols in list(self._subscribers):
+            if kinds is not None and kind not in kinds or symbols is not None and symbol not in symbols:
+                continue
+            try:
+                result = callback(kind, symbol, value)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:  # pylint: disable=broad-except
+                logging.exception(f'subscriber of {kind} {symbol} failed')
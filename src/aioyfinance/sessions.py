@@ -0,0 +1,83 @@
+"""
+Persistent sessions, connections are reused between calls on long lived loops
+"""
+import asyncio
+import logging
+from typing import AnyStr, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+from weakref import WeakKeyDictionary
+import aiohttp
+from .urldict import ENDPOINTS
+
+# loop -> its session, without one every request makes a session of its own
+_sessions: 'WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]' = WeakKeyDictionary()
+
+
+async def open_session(limit: int = 100, keepalive_timeout: float = 30,
+                       dns_ttl: Optional[float] = 300) -> aiohttp.ClientSession:
+    """
+    makes session of the running loop, requests of this loop share its connections until close_session
+    :param limit: maximum connections of the session
+    :param keepalive_timeout: seconds idle connection is kept open
+    :param dns_ttl: seconds resolved hosts are cached, None to cache forever
+    :return: session of the running loop, existing one if it is open
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(limit=limit, keepalive_timeout=keepalive_timeout, ttl_dns_cache=dns_ttl)
+        session = _sessions[loop] = aiohttp.ClientSession(connector=connector)
+    return session
+
+
+def shared_session() -> Optional[aiohttp.ClientSession]:
+    """
+    :return: open session of the running loop or None
+    """
+    session = _sessions.get(asyncio.get_running_loop())
+    return None if session is None or session.closed else session
+
+
+async def close_session():
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
+def _origins(urls: Iterable[AnyStr]) -> List[AnyStr]:
+    return list(dict.fromkeys(f'{part.scheme}://{part.netloc}/' for part in map(urlsplit, urls)))
+
+
+async def warmup(connections: int = 2, hosts: Optional[Iterable[AnyStr]] = None,
+                 proxies: Optional[Iterable[Optional[AnyStr]]] = None) -> Dict[AnyStr, int]:
+    """
+    resolves hosts and opens keep-alive connections in the session of the running loop,
+    so the first requests of a sweep do not wait for DNS and TLS handshakes.
+    If the loop has no session, persistent one is opened by open_session and stays open after warmup,
+    every later request of the loop shares it until close_session is awaited (SyncClient closes its own)
+    :param connections: connections opened to every host through every proxy
+    :param hosts: urls of hosts, every yahoo endpoint if None
+    :param proxies: proxies to connect through, None for proxies of global config or direct connection
+    :return: dict host -> connections opened, failures are logged
+    """
+    from .base_requests import Config  # pylint: disable=import-outside-toplevel
+    config = Config.get()
+    session = shared_session() or await open_session()
+    if proxies is None:
+        proxies = config.proxy_url if isinstance(config.proxy_url, list) else [config.proxy_url]
+
+    async def connect(origin: AnyStr, proxy: Optional[AnyStr]) -> bool:
+        try:
+            async with session.head(origin, proxy=proxy, timeout=config.timeout, allow_redirects=False):
+                return True
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.warning(f'warmup of {origin} through {proxy} failed {e!r}')
+            return False
+
+    origins = _origins(ENDPOINTS if hosts is None else hosts)
+    proxies = list(proxies)
+    # requests at the same time take separate connections, they stay open in the pool afterwards
+    opened = await asyncio.gather(*[connect(origin, proxy) for origin in origins for proxy in proxies
+                                    for _ in range(connections)])
+    per_host = len(proxies) * connections
+    return {origin: sum(opened[i * per_host:(i + 1) * per_host]) for i, origin in enumerate(origins)}
@@ -0,0 +1,136 @@
+"""
+Local append only store of OHLCV bars, one memory mapped file per symbol and interval
+
+needs numpy
+"""
+import asyncio
+import os
+from datetime import datetime, timedelta
+from typing import AnyStr, Dict, Iterable, List, Optional, Union
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError('numpy is needed for the bar store, pip install numpy') from e
+from .tickers import Ticker, normalize_symbol
+
+BAR = np.dtype([
+    ('timestamp', '<i8'),
+    ('open', '<f8'),
+    ('high', '<f8'),
+    ('low', '<f8'),
+    ('close', '<f8'),
+    ('adjclose', '<f8'),
+    ('volume', '<f8'),
+])
+
+EMPTY = np.zeros(0, dtype=BAR)
+
+
+def to_bars(timeseries: Dict) -> np.ndarray:
+    """
+    converts result of Ticker.get_timeseries to bars, missing values are nan
+    adjclose is close if it is not returned (intraday intervals)
+    """
+    bars = np.zeros(len(timeseries['timestamp']), dtype=BAR)
+    bars['timestamp'] = timeseries['timestamp']
+    for name in BAR.names[1:]:
+        values = timeseries.get(name, timeseries['close'] if name == 'adjclose' else None)
+        if values is None:
+            bars[name] = np.nan
+        else:
+            bars[name] = np.array(values, dtype=float)  # None becomes nan
+    return bars
+
+
+class BarStore:
+    """
+    bars of every (symbol, interval) are kept in root/interval/SYMBOL.bars sorted by timestamp,
+    reads are memory mapped and do not copy
+    """
+    suffix = '.bars'
+
+    def __init__(self, root: AnyStr):
+        self.root = root
+
+    def path(self, symbol: AnyStr, interval: AnyStr) -> AnyStr:
+        return os.path.join(self.root, interval, normalize_symbol(symbol) + self.suffix)
+
+    def symbols(self, interval: AnyStr) -> List[AnyStr]:
+        directory = os.path.join(self.root, interval)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(name[:-len(self.suffix)] for name in os.listdir(directory) if name.endswith(self.suffix))
+
+    def read(self, symbol: AnyStr, interval: AnyStr, start: Union[None, int, datetime] = None,
+             end: Union[None, int, datetime] = None) -> np.ndarray:
+        """
+        :param start: first timestamp included, datetime or unix seconds
+        :param end: last timestamp excluded
+        :return: read only view of bars in [start, end), binary searched
+        """
+        path = self.path(symbol, interval)
+        if not os.path.exists(path) or not os.path.getsize(path):
+            return EMPTY
+
+        bars = np.memmap(path, dtype=BAR, mode='r')
+        timestamps = bars['timestamp']
+        first = 0 if start is None else int(np.searchsorted(timestamps, _stamp(start), 'left'))
+        last = len(bars) if end is None else int(np.searchsorted(timestamps, _stamp(end), 'left'))
+        return bars[first:last]
+
+    def last_timestamp(self, symbol: AnyStr, interval: AnyStr) -> Optional[int]:
+        bars = self.read(symbol, interval)
+        return int(bars['timestamp'][-1]) if len(bars) else None
+
+    def append(self, symbol: AnyStr, interval: AnyStr, bars: np.ndarray) -> int:
+        """
+        appends bars newer than the stored ones, bar with the same timestamp as the last stored
+        replaces it, e.g. when it was still forming
+        :return: amount of new bars
+        """
+        bars = np.sort(bars, order='timestamp')
+        path = self.path(symbol, interval)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        last = self.last_timestamp(symbol, interval)
+        if last is not None:
+            if len(bars) and bars['timestamp'][0] <= last:
+                same = bars[bars['timestamp'] == last]
+                if len(same):
+                    stored = np.memmap(path, dtype=BAR, mode='r+')
+                    stored[-1] = same[-1]
+                    stored.flush()
+                    del stored
+            bars = bars[bars['timestamp'] > last]
+
+        if len(bars):
+            with open(path, 'ab') as file:
+                file.write(bars.tobytes())
+        return len(bars)
+
+    async def update(self, symbol: AnyStr, interval: AnyStr, range_: Union[str, timedelta] = '1y') -> int:
+        """
+        requests bars since the last stored one, or for range_ if there are none, and appends them
+        :return: amount of new bars
+        """
+        last = self.last_timestamp(symbol, interval)
+        if last is not None:
+            range_ = datetime.now() - datetime.fromtimestamp(last) + timedelta(minutes=1)
+
+        timeseries = await Ticker(normalize_symbol(symbol)).get_timeseries(interval, range_)
+        return self.append(symbol, interval, to_bars(timeseries))
+
+    async def update_many(self, symbols: Iterable[AnyStr], interval: AnyStr,
+                          range_: Union[str, timedelta] = '1y') -> Dict[AnyStr, Union[int, Exception]]:
+        """
+        updates symbols concurrently, limits of Config apply
+        :return: dict symbol -> amount of new bars or exception
+        """
+        symbols = list(dict.fromkeys(symbols))
+        completed = await asyncio.gather(*[self.update(symbol, interval, range_) for symbol in symbols],
+                                         return_exceptions=True)
+        return dict(zip(symbols, completed))
+
+
+def _stamp(value: Union[int, datetime]) -> int:
+    return int(value.timestamp()) if isinstance(value, datetime) else int(value)
@@ -0,0 +1,156 @@
+"""
+Size bounded and incremental reading of response bodies
+
+streamed json is parsed chunk by chunk as it arrives, raw body is never kept whole,
+columns of chart are appended straight into lists, padded series of fundamentals
+are dropped as they arrive, other responses are built whole, needs ijson
+"""
+from typing import AnyStr, Dict, Optional
+import aiohttp
+from .urldict import QUERY, FUNDAMENTALS_URL
+
+CHUNK = 64 * 1024
+
+
+class BodyTooLarge(ValueError):
+    """
+    response body is bigger than max_body_size of Config
+    """
+
+
+class LimitedStream:
+    """
+    async file like reader of response body, raises BodyTooLarge after max_size bytes
+    """
+    def __init__(self, resp: aiohttp.ClientResponse, max_size: Optional[int]):
+        if max_size is not None and resp.content_length is not None and resp.content_length > max_size:
+            raise BodyTooLarge(f'{resp.url} body has {resp.content_length} bytes, limit is {max_size}')
+        self.max_size = max_size
+        self.size = 0
+        self._content = resp.content
+        self._url = resp.url
+
+    async def read(self, size: int = -1) -> bytes:
+        """
+        :param size: at most that many bytes, one chunk if negative
+        """
+        chunk = await self._content.read(CHUNK if size < 0 else size)
+        self.size += len(chunk)
+        if self.max_size is not None and self.size > self.max_size:
+            raise BodyTooLarge(f'{self._url} body is over the limit of {self.max_size} bytes')
+        return chunk
+
+
+async def read_body(stream: LimitedStream) -> bytes:
+    parts = []
+    while chunk := await stream.read(CHUNK):
+        parts.append(chunk)
+    return b''.join(parts)
+
+
+def check_ijson():
+    try:
+        import ijson  # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError as e:
+        raise ImportError('ijson is needed for streamed json, pip install ijson') from e
+
+
+async def parse_stream(url: AnyStr, stream: LimitedStream) -> Dict:
+    """
+    chart responses are parsed into columns, fundamentals series by series, the rest into whole objects
+    """
+    import ijson  # pylint: disable=import-outside-toplevel
+
+    if url.startswith(QUERY):
+        return await parse_chart(stream)
+    if url.startswith(FUNDAMENTALS_URL):
+        return await parse_fundamentals(stream)
+    async for value in ijson.items_async(stream, '', use_float=True):
+        return value
+    raise ValueError('empty json body')
+
+
+# parts of chart result that are built as objects, columns are appended directly
+_CHART_OBJECTS = ('chart.result.item.meta', 'chart.result.item.events', 'chart.error')
+_QUOTE = 'chart.result.item.indicators.quote.item.'
+_ADJCLOSE = 'chart.result.item.indicators.adjclose.item.adjclose.item'
+_TIMESTAMP = 'chart.result.item.timestamp.item'
+
+
+async def parse_chart(stream: LimitedStream) -> Dict:
+    """
+    :return: chart json of the same shape as whole parse gives, only the first result is kept
+    """
+    import ijson  # pylint: disable=import-outside-toplevel
+
+    builders = {}
+    timestamps = []
+    quote = {}
+    adjclose = None
+    has_result = False
+    async for prefix, event, value in ijson.parse_async(stream, use_float=True):
+        if prefix == _TIMESTAMP:
+            timestamps.append(value)
+        elif prefix.startswith(_QUOTE):
+            if prefix.endswith('.item'):
+                quote[prefix[len(_QUOTE):-len('.item')]].append(value)
+            elif event == 'start_array':
+                quote[prefix[len(_QUOTE):]] = []
+        elif prefix == _ADJCLOSE:
+            adjclose.append(value)
+        elif prefix == _ADJCLOSE[:-len('.item')] and event == 'start_array':
+            adjclose = []
+        elif prefix == 'chart.result.item' and event == 'start_map':
+            has_result = True
+        else:
+            for part in _CHART_OBJECTS:
+                if prefix == part or prefix.startswith(part + '.'):
+                    if part not in builders:
+                        builders[part] = ijson.ObjectBuilder()
+                    builders[part].event(event, value)
+                    break
+
+    def built(part):
+        return builders[part].value if part in builders else None
+
+    if not has_result:
+        return {'chart': {'result': None, 'error': built('chart.error')}}
+
+    indicators = {'quote': [quote]}
+    if adjclose is not None:
+        indicators['adjclose'] = [{'adjclose': adjclose}]
+    result = {'meta': built('chart.result.item.meta'), 'timestamp': timestamps, 'indicators': indicators}
+    if 'chart.result.item.events' in builders:
+        result['events'] = built('chart.result.item.events')
+    return {'chart': {'result': [result], 'error': built('chart.error')}}
+
+
+_SERIES = 'timeseries.result.item'
+
+
+async def parse_fundamentals(stream: LimitedStream) -> Dict:
+    """
+    :return: fundamentals json of the same shape as whole parse gives, without series that have no timestamp,
+        every requested type comes back even without data and strip_old_json drops those anyway
+    """
+    import ijson  # pylint: disable=import-outside-toplevel
+
+    results = None
+    series = None  # builder of the series being parsed
+    error = ijson.ObjectBuilder()
+    async for prefix, event, value in ijson.parse_async(stream, use_float=True):
+        if series is not None:
+            series.event(event, value)
+            if prefix == _SERIES and event == 'end_map':
+                if 'timestamp' in series.value:
+                    results.append(series.value)
+                series = None
+        elif prefix == _SERIES and event == 'start_map':
+            series = ijson.ObjectBuilder()
+            series.event(event, value)
+        elif prefix == 'timeseries.result' and event == 'start_array':
+            results = []
+        elif prefix == 'timeseries.error' or prefix.startswith('timeseries.error.'):
+            error.event(event, value)
+
+    return {'timeseries': {'result': results, 'error': getattr(error, 'value', None)}}
@@ -0,0 +1,150 @@
+"""
+Quote summary modules, one json request returns any of them
+
+statistics and profile are mapped onto keys of the scraped html pages
+"""
+from typing import AnyStr, Dict, Iterable
+from .urldict import SUMMARY_URL, QUERY_OPTIONAL
+
+STATISTICS_MODULES = ('defaultKeyStatistics', 'summaryDetail', 'financialData')
+PROFILE_MODULES = ('assetProfile', 'quoteType')
+ANALYSIS_MODULES = ('recommendationTrend', 'earningsTrend', 'earningsHistory', 'upgradeDowngradeHistory')
+HOLDERS_MODULES = ('majorHoldersBreakdown', 'institutionOwnership', 'fundOwnership', 'insiderHolders',
+                   'insiderTransactions')
+MODULES = STATISTICS_MODULES + PROFILE_MODULES + ANALYSIS_MODULES + HOLDERS_MODULES
+
+# key of statistics page -> (module, field, scale), yahoo keeps some ratios in percents
+STATISTICS_KEYS = {
+    # valuation measures
+    'MarketCap(intraday)': ('summaryDetail', 'marketCap', 1),
+    'EnterpriseValue': ('defaultKeyStatistics', 'enterpriseValue', 1),
+    'TrailingP/E': ('summaryDetail', 'trailingPE', 1),
+    'ForwardP/E': ('summaryDetail', 'forwardPE', 1),
+    'PEGRatio(5yrexpected)': ('defaultKeyStatistics', 'pegRatio', 1),
+    'Price/Sales(ttm)': ('summaryDetail', 'priceToSalesTrailing12Months', 1),
+    'Price/Book(mrq)': ('defaultKeyStatistics', 'priceToBook', 1),
+    'EnterpriseValue/Revenue': ('defaultKeyStatistics', 'enterpriseToRevenue', 1),
+    'EnterpriseValue/EBITDA': ('defaultKeyStatistics', 'enterpriseToEbitda', 1),
+    # stock price history
+    'Beta(5YMonthly)': ('summaryDetail', 'beta', 1),
+    '52-WeekChange': ('defaultKeyStatistics', '52WeekChange', 1),
+    'S&P50052-WeekChange': ('defaultKeyStatistics', 'SandP52WeekChange', 1),
+    '52WeekHigh': ('summaryDetail', 'fiftyTwoWeekHigh', 1),
+    '52WeekLow': ('summaryDetail', 'fiftyTwoWeekLow', 1),
+    '50-DayMovingAverage': ('summaryDetail', 'fiftyDayAverage', 1),
+    '200-DayMovingAverage': ('summaryDetail', 'twoHundredDayAverage', 1),
+    # share statistics
+    'AvgVol(3month)': ('summaryDetail', 'averageVolume', 1),
+    'AvgVol(10day)': ('summaryDetail', 'averageVolume10days', 1),
+    'SharesOutstanding': ('defaultKeyStatistics', 'sharesOutstanding', 1),
+    'ImpliedSharesOutstanding': ('defaultKeyStatistics', 'impliedSharesOutstanding', 1),
+    'Float': ('defaultKeyStatistics', 'floatShares', 1),
+    '%HeldbyInsiders': ('defaultKeyStatistics', 'heldPercentInsiders', 1),
+    '%HeldbyInstitutions': ('defaultKeyStatistics', 'heldPercentInstitutions', 1),
+    'SharesShort': ('defaultKeyStatistics', 'sharesShort', 1),
+    'SharesShort(priormonth)': ('defaultKeyStatistics', 'sharesShortPriorMonth', 1),
+    'ShortRatio': ('defaultKeyStatistics', 'shortRatio', 1),
+    'Short%ofFloat': ('defaultKeyStatistics', 'shortPercentOfFloat', 1),
+    'Short%ofSharesOutstanding': ('defaultKeyStatistics', 'sharesPercentSharesOut', 1),
+    # dividends and splits
+    'ForwardAnnualDividendRate': ('summaryDetail', 'dividendRate', 1),
+    'ForwardAnnualDividendYield': ('summaryDetail', 'dividendYield', 1),
+    'TrailingAnnualDividendRate': ('summaryDetail', 'trailingAnnualDividendRate', 1),
+    'TrailingAnnualDividendYield': ('summaryDetail', 'trailingAnnualDividendYield', 1),
+    '5YearAverageDividendYield': ('summaryDetail', 'fiveYearAvgDividendYield', 1),
+    'PayoutRatio': ('summaryDetail', 'payoutRatio', 1),
+    'Ex-DividendDate': ('summaryDetail', 'exDividendDate', 1),
+    'LastSplitFactor': ('defaultKeyStatistics', 'lastSplitFactor', 1),
+    'LastSplitDate': ('defaultKeyStatistics', 'lastSplitDate', 1),
+    # fiscal year
+    'FiscalYearEnds': ('defaultKeyStatistics', 'lastFiscalYearEnd', 1),
+    'MostRecentQuarter(mrq)': ('defaultKeyStatistics', 'mostRecentQuarter', 1),
+    # profitability and management effectiveness
+    'ProfitMargin': ('financialData', 'profitMargins', 1),
+    'OperatingMargin(ttm)': ('financialData', 'operatingMargins', 1),
+    'ReturnonAssets(ttm)': ('financialData', 'returnOnAssets', 1),
+    'ReturnonEquity(ttm)': ('financialData', 'returnOnEquity', 1),
+    # income statement
+    'Revenue(ttm)': ('financialData', 'totalRevenue', 1),
+    'RevenuePerShare(ttm)': ('financialData', 'revenuePerShare', 1),
+    'QuarterlyRevenueGrowth(yoy)': ('financialData', 'revenueGrowth', 1),
+    'GrossProfit(ttm)': ('financialData', 'grossProfits', 1),
+    'EBITDA': ('financialData', 'ebitda', 1),
+    'NetIncomeAvitoCommon(ttm)': ('defaultKeyStatistics', 'netIncomeToCommon', 1),
+    'DilutedEPS(ttm)': ('defaultKeyStatistics', 'trailingEps', 1),
+    'QuarterlyEarningsGrowth(yoy)': ('defaultKeyStatistics', 'earningsQuarterlyGrowth', 1),
+    # balance sheet
+    'TotalCash(mrq)': ('financialData', 'totalCash', 1),
+    'TotalCashPerShare(mrq)': ('financialData', 'totalCashPerShare', 1),
+    'TotalDebt(mrq)': ('financialData', 'totalDebt', 1),
+    'TotalDebt/Equity(mrq)': ('financialData', 'debtToEquity', 0.01),
+    'CurrentRatio(mrq)': ('financialData', 'currentRatio', 1),
+    'BookValuePerShare(mrq)': ('defaultKeyStatistics', 'bookValue', 1),
+    # cash flow statement
+    'OperatingCashFlow(ttm)': ('financialData', 'operatingCashflow', 1),
+    'LeveredFreeCashFlow(ttm)': ('financialData', 'freeCashflow', 1),
+}
+
+
+def summary_url(symbol: AnyStr, modules: Iterable[AnyStr]) -> AnyStr:
+    return f'{SUMMARY_URL}{symbol}?modules={",".join(modules)}&{QUERY_OPTIONAL}'
+
+
+def unwrap(value):
+    """
+    numbers come as {'raw': 1.0, 'fmt': '1.00'}, raw ones are kept, empty ones become None
+    maxAge of every module is dropped
+    """
+    if isinstance(value, dict):
+        if 'raw' in value:
+            return value['raw']
+        if not value:
+            return None
+        return {key: unwrap(inner) for key, inner in value.items() if key != 'maxAge'}
+    if isinstance(value, list):
+        return [unwrap(inner) for inner in value]
+    return value
+
+
+def parse_summary(summary_json: Dict, symbol: AnyStr) -> Dict[AnyStr, Dict]:
+    """
+    :param summary_json: response of quote summary
+    :return: dict module -> unwrapped module
+    raises NameError if symbol is not found, LookupError if there is another error
+    """
+    summary = summary_json.get('quoteSummary') or {}
+    results = summary.get('result')
+    if results:
+        return unwrap(results[0])
+
+    error = summary.get('error') or summary_json.get('finance', {}).get('error') or {}
+    if error.get('code') == 'Not Found':
+        raise NameError(symbol)
+    raise LookupError(f'{symbol} quote summary error {error.get("code")}: {error.get("description")}')
+
+
+def map_statistics(modules: Dict[AnyStr, Dict]) -> Dict:
+    """
+    statistics in the shape of the key-statistics page
+    """
+    statistics = {}
+    for key, (module, field, scale) in STATISTICS_KEYS.items():
+        value = (modules.get(module) or {}).get(field)
+        if isinstance(value, (int, float)) and scale != 1:
+            value = value * scale
+        statistics[key] = value
+    return statistics
+
+
+def map_profile(modules: Dict[AnyStr, Dict]) -> Dict:
+    """
+    profile in the shape of the profile page
+    """
+    profile = modules.get('assetProfile') or {}
+    quote_type = modules.get('quoteType') or {}
+    return {
+        'Sector': profile.get('sector'),
+        'Industry': profile.get('industry'),
+        'Name': quote_type.get('longName') or quote_type.get('shortName')
+    }
+
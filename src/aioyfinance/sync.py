@@ -0,0 +1,111 @@
+"""
+Synchronous facade, one event loop runs in a background thread for the whole life of the client
+"""
+import asyncio
+import threading
+from concurrent.futures import Future
+from inspect import iscoroutinefunction
+from typing import AnyStr, Coroutine, Dict, List, Optional
+from .sessions import open_session, close_session, warmup
+from .tickers import Ticker, Tickers
+
+
+class SyncClient:
+    """
+    getters can be called from any thread, they overlap on the background loop
+    and share its persistent session, so connections are reused between calls
+
+    with SyncClient() as client:
+        stats = client.ticker('aapl').get_statistics()  # blocks
+        future = client.tickers(symbols).get_timeseries_future('1d', '1y')  # concurrent.futures.Future
+    """
+    def __init__(self, keep_sessions: bool = True, connections: int = 100):
+        """
+        :param keep_sessions: reuse connections between calls, otherwise every request connects again
+        :param connections: maximum connections of persistent session
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='aioyfinance', daemon=True)
+        self._thread.start()
+        if keep_sessions:
+            self.run(open_session(connections))
+
+    def submit(self, coroutine: Coroutine) -> Future:
+        """
+        runs coroutine on the background loop
+        """
+        if self._loop.is_closed():
+            coroutine.close()
+            raise RuntimeError('client is closed')
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def run(self, coroutine: Coroutine, timeout: Optional[float] = None):
+        """
+        runs coroutine on the background loop and waits for its result
+        """
+        return self.submit(coroutine).result(timeout)
+
+    def warmup(self, connections: int = 2, **kwargs) -> Dict[AnyStr, int]:
+        """
+        opens keep-alive connections before a sweep, see sessions.warmup
+        """
+        return self.run(warmup(connections, **kwargs))
+
+    def ticker(self, symbol: AnyStr) -> 'SyncFacade':
+        return SyncFacade(self, Ticker(symbol))
+
+    def tickers(self, symbols: List[AnyStr], **kwargs) -> 'SyncFacade':
+        """
+        :param kwargs: keywords of Tickers
+        """
+        return SyncFacade(self, Tickers(symbols, **kwargs))
+
+    def close(self):
+        """
+        closes session, stops loop and its thread
+        """
+        if self._loop.is_closed():
+            return
+
+        self.run(close_session())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class SyncFacade:
+    """
+    Ticker or Tickers with blocking getters, get_x_future variants return concurrent.futures.Future
+    other attributes are the ones of the wrapped object
+    """
+    def __init__(self, client: SyncClient, wrapped):
+        self._client = client
+        self.wrapped = wrapped
+
+    def __getattr__(self, name: AnyStr):
+        submit = name.endswith('_future')
+        attribute = getattr(self.wrapped, name[:-len('_future')] if submit else name)
+        if not iscoroutinefunction(attribute):
+            if submit:
+                raise AttributeError(f'{name[:-len("_future")]} is not a getter')
+            return attribute
+
+        def call(*args, **kwargs):
+            future = self._client.submit(attribute(*args, **kwargs))
+            return future if submit else future.result()
+
+        call.__name__ = name
+        call.__doc__ = attribute.__doc__
+        return call
+
+    def __getitem__(self, symbol: AnyStr) -> 'SyncFacade':
+        """
+        ticker of Tickers collection
+        """
+        return SyncFacade(self._client, self.wrapped[symbol])
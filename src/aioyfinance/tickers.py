@@ -8,13 +8,20 @@ from datetime import datetime, timedelta
 from functools import wraps
 import re
 from collections import defaultdict
-from typing import List, Dict, Union, AnyStr, Tuple, Coroutine, Optional
+from typing import List, Dict, Union, AnyStr, Tuple, Coroutine, Optional, Iterable
 from enum import Enum
-from bs4 import BeautifulSoup
-from .urldict import BASE, FUNCS, QUERY, QUERY_OPTIONAL, OFFSETS
-from .old_urls import FUNDAMENTAL_FORMATTER, FUNDAMETALS_URL, INCOME_STATEMENT_ANNUAL, INCOME_STATEMENT_QUARTER,\
-                        BALANCE_ANNUAL, BALANCE_QUARTER, CASH_FLOW_QUARTER, CASH_FLOW_ANNUAL
+from sys import intern
+from types import MappingProxyType
+from .urldict import BASE, FUNCS, QUERY, QUERY_OPTIONAL, OFFSETS, FUNDAMENTALS_URL, FUNDAMENTAL_FORMATTER
+from .fundamentals import STATEMENTS, FREQUENCIES, statement_pairs, select_fields, project, plan_urls,\
+    split_results
+from .summary import STATISTICS_MODULES, PROFILE_MODULES, ANALYSIS_MODULES, HOLDERS_MODULES, MODULES,\
+    summary_url, parse_summary, map_statistics, map_profile
 from .base_requests import BaseRequest, Config
+from .breaker import CircuitOpenError
+from .errors import ErrorLog
+from .routing import remember_type, known_type, is_equity
+from .priority import request_flow, current_flow
 
 
 class Stats(Enum):
@@ -30,6 +37,33 @@ class Stats(Enum):
     BALANCE_Q = 7
     INCOME = 8
     INCOME_Q = 9
+    SUMMARY = 10  # modules are saved under (SUMMARY, module)
+
+
+FUND_KEYS = {
+    ('income', 'annual'): Stats.INCOME,
+    ('income', 'quarterly'): Stats.INCOME_Q,
+    ('balance', 'annual'): Stats.BALANCE,
+    ('balance', 'quarterly'): Stats.BALANCE_Q,
+    ('cashflow', 'annual'): Stats.CASHFLOW,
+    ('cashflow', 'quarterly'): Stats.CASHFLOW_Q,
+}
+
+
+# kinds of Ticker.get_many
+_SCRAPERS = {Stats.STATISTICS: '_get_statistics', Stats.PROFILE: '_get_profile'}  # kind -> html fallback
+_FUND_PAIRS = {key: pair for pair, key in FUND_KEYS.items()}
+_SUMMARY_MODULES = {Stats.STATISTICS: STATISTICS_MODULES, Stats.PROFILE: PROFILE_MODULES}  # kind -> its modules
+
+# shared read only placeholder of Ticker.__data until something is saved
+_NO_DATA = MappingProxyType({})
+
+
+def normalize_symbol(symbol: AnyStr) -> AnyStr:
+    """
+    symbols are case insensitive, so 'nvda' and ' NVDA' are the same symbol
+    """
+    return symbol.strip().upper()
 
 
 def _merge_dicts(dict_args):
@@ -43,6 +77,15 @@ def _merge_dicts(dict_args):
     return result
 
 
+async def _gather_all(coroutines: List[Coroutine]):
+    """
+    waits for every coroutine, then raises the first exception, nothing is left running
+    """
+    for result in await asyncio.gather(*coroutines, return_exceptions=True):
+        if isinstance(result, BaseException):
+            raise result
+
+
 def symbol_check(func):
     """
     does request and checkes if symbol is correct, if it is not raises NameError
@@ -61,6 +104,7 @@ def symbol_check(func):
             if html is None:
                 raise NameError(self.ticker)
 
+            from bs4 import BeautifulSoup  # only needed for html pages, imported on first parse
             souped = BeautifulSoup(html)
 
             if souped.h2 is None:
@@ -115,9 +159,20 @@ def strip_old_json(fund_json):
 
 
 class Ticker:
+    # no __dict__ per instance, big universes of idle tickers are cheap
+    __slots__ = ('__ticker', '__data')
+
     def __init__(self, ticker: AnyStr):
         self.__ticker = ticker
-        self.__data = dict()
+        self.__data = _NO_DATA  # allocated on first save
+
+    def _save(self, key, value):
+        """
+        saves value to internal dictionary, creating it if needed
+        """
+        if self.__data is _NO_DATA:
+            self.__data = dict()
+        self.__data[key] = value
 
     @property
     def ticker(self):
@@ -129,17 +184,107 @@ class Ticker:
         :param key_arr: list of keys to clear, if None clean everything
         """
         if key_arr:
-            for key in key_arr:
-                if key in self.__data:
+            # statistics and profile are mapped from summary modules, they are requested again too
+            cleared = {(Stats.SUMMARY, module) for key in key_arr for module in _SUMMARY_MODULES.get(key, ())}
+            for key in list(self.__data):
+                # subsets of fundamentals are saved under (Stats, fields)
+                if key in key_arr or key in cleared or isinstance(key, tuple) and key[0] in key_arr:
                     del self.__data[key]
         else:
-            self.__data = dict()
+            self.__data = _NO_DATA
+
+    async def get_statistics(self, source='json'):
+        """
+        :param source: 'json' for quote summary, falls back to html page if it fails, 'html' to scrape the page
+        """
+        data = await self.get_many((Stats.STATISTICS,), source)
+        return data[Stats.STATISTICS]
 
-    async def get_statistics(self):
-        if Stats.STATISTICS not in self.__data:
-            await self._get_statistics()
+    async def get_many(self, kinds: Iterable[Stats], source='json') -> Dict[Stats, Dict]:
+        """
+        request planner for composite getters, kinds that are not saved yet are requested concurrently,
+        kinds that share a request (quote summary, fundamentals) are loaded by one
+        :param kinds: Stats.STATISTICS, Stats.PROFILE or statements of FUND_KEYS
+        :param source: source of statistics and profile, see get_statistics
+        :return: dict kind -> data
+        """
+        kinds = list(dict.fromkeys(kinds))
+        missing = [kind for kind in kinds if kind not in self.__data]
+        unknown = [kind for kind in missing if kind not in _SCRAPERS and kind not in _FUND_PAIRS]
+        if unknown:
+            raise ValueError(f'no planner for {unknown}')
+        self._check_known_invalid(missing)
+
+        loads = []
+        scraped = [kind for kind in missing if kind in _SCRAPERS]
+        if scraped:
+            loads.append(self._load_pages(scraped, source))
+        pairs = [_FUND_PAIRS[kind] for kind in missing if kind in _FUND_PAIRS]
+        if pairs:
+            loads.append(self._get_merged_fundamentals(pairs, select_fields([statement for statement, _ in pairs], None)))
+        await _gather_all(loads)
+
+        return {kind: self.__data[kind] for kind in kinds}
+
+    async def _load_pages(self, kinds: List[Stats], source):
+        """
+        statistics and profile from one quote summary request or from their html pages concurrently
+        """
+        try:
+            if known_type(self.__ticker) is not None:
+                await self._check_route(kinds)  # known types fail without request
+            if not await self._load_from_summary(kinds, source):
+                await self._check_route(kinds)  # pages exist only for equities
+                await _gather_all([getattr(self, _SCRAPERS[kind])() for kind in kinds])
+        except NameError as e:
+            self._remember_invalid(kinds, e)
+            raise
+
+    async def get_asset_type(self) -> Optional[AnyStr]:
+        """
+        instrument type, e.g. EQUITY, ETF, MUTUALFUND, INDEX, CURRENCY, CRYPTOCURRENCY
+        known from earlier chart or quote summary requests of any Ticker, otherwise one day chart is requested
+        :return: type or None if yahoo does not tell it
+        """
+        if known_type(self.__ticker) is None:
+            url = f'{QUERY}/{self.__ticker}?range=1d&interval=1d&{QUERY_OPTIONAL}'
+            chart = (await self._base_request(url, is_json=True))['chart']
+            if not chart['result']:
+                raise NameError((chart.get('error') or {}).get('code') or self.__ticker)
+            remember_type(self.__ticker, (chart['result'][0].get('meta') or {}).get('instrumentType'))
 
-        return self.__data[Stats.STATISTICS]
+        return known_type(self.__ticker)
+
+    async def _check_route(self, kinds: Iterable[Stats]):
+        """
+        kinds exist only for equities, raises NameError without request if symbol is known to be another type
+        unknown type is looked up first if Config.route_types is set
+        """
+        asset_type = known_type(self.__ticker)
+        if asset_type is None and Config.get().route_types:
+            asset_type = await self.get_asset_type()
+        if not is_equity(asset_type):
+            names = ', '.join(kind.name.lower() for kind in kinds)
+            raise NameError(f'{self.__ticker} is {asset_type}, {names} only for equities')
+
+    def _check_known_invalid(self, kinds: Iterable[Stats]):
+        """
+        raises NameError without request if symbol is in negative cache for any of kinds
+        """
+        cache = Config.get().negative_cache
+        if cache is None:
+            return
+        for kind in kinds:
+            if (reason := cache.get(self.__ticker, kind.name.lower())) is not None:
+                raise NameError(f'{reason} (known to fail)')
+
+    def _remember_invalid(self, kinds: Iterable[Stats], error: NameError):
+        """
+        adds symbol to negative cache for kinds
+        """
+        cache = Config.get().negative_cache
+        if cache is not None:
+            cache.add(self.__ticker, [kind.name.lower() for kind in kinds], str(error) or self.__ticker)
 
     @symbol_check(FUNCS['statistics'])
     async def _get_statistics(self, souped):
@@ -151,67 +296,112 @@ class Ticker:
         fye = Fiscal Year Ending
         """
         tables = souped.find_all('section')[1].find_all('tbody')
-        self.__data[Stats.STATISTICS] = _merge_dicts([self._parse_table(tb) for tb in tables])
+        self._save(Stats.STATISTICS, _merge_dicts([self._parse_table(tb) for tb in tables]))
 
-    async def get_cashflow(self, annual=True):
+    async def get_cashflow(self, annual=True, fields=None):
         """
         gets cash  flow or quarterly income
         :param annual: True if Annual, False if Quraterly
+        :param fields: series names to request, e.g. ['FreeCashFlow'], None for every series
         :return: stripped dictionary
         """
-        if annual:
-            key = Stats.CASHFLOW
-            main = CASH_FLOW_ANNUAL
-        else:
-            key = Stats.CASHFLOW_Q
-            main = CASH_FLOW_QUARTER
-
-        return await self._get_fund(key, main, annual)
+        return await self._get_fund('cashflow', annual, fields)
 
-    async def get_balance(self, annual=True):
+    async def get_balance(self, annual=True, fields=None):
         """
         gets balance or quarterly income
         :param annual: True if Annual, False if Quraterly
+        :param fields: series names to request, e.g. ['TotalDebt'], None for every series
         :return: stripped dictionary
         """
-        if annual:
-            key = Stats.BALANCE
-            main = BALANCE_ANNUAL
-        else:
-            key = Stats.BALANCE_Q
-            main = BALANCE_QUARTER
-
-        return await self._get_fund(key, main, annual)
+        return await self._get_fund('balance', annual, fields)
 
-    async def get_income(self, annual=True):
+    async def get_income(self, annual=True, fields=None):
         """
         gets income or quarterly income
         :param annual: True if Annual, False if Quraterly
+        :param fields: series names to request, e.g. ['NetIncome', 'TotalRevenue'], None for every series
         :return: stripped dictionary
         """
-        if annual:
-            key = Stats.INCOME
-            main = INCOME_STATEMENT_ANNUAL
-        else:
-            key = Stats.INCOME_Q
-            main = INCOME_STATEMENT_QUARTER
+        return await self._get_fund('income', annual, fields)
 
-        return await self._get_fund(key, main, annual)
+    async def _get_fund(self, statement, annual, fields=None):
+        """
+            Middle man method for single statement getters
+        """
+        frequency = 'annual' if annual else 'quarterly'
+        data = await self.get_fundamentals((statement,), (frequency,), fields)
+        return data[statement][frequency]
 
-    async def _get_fund(self, key, main, annual):
+    async def get_fundamentals(self, statements=STATEMENTS, frequencies=FREQUENCIES, fields=None) -> Dict:
         """
-            Middle man method cheking is data was already requested
-            if it is not gets requests and does preprocessing
+        gets several statements at once, type lists of all statements not requested yet
+        are merged into as few requests as possible
+        :param statements: any of 'income', 'balance', 'cashflow'
+        :param frequencies: any of 'annual', 'quarterly'
+        :param fields: series names to request, None for every series. Statements
+            that have none of the fields are left out
+        :return: dict statement -> frequency -> stripped dictionary
         """
-        if key in self.__data:
-            return self.__data[key]
+        pairs = statement_pairs(statements, frequencies)
+        selected = select_fields([statement for statement, _ in pairs], fields)
+        pairs = [pair for pair in pairs if pair[0] in selected]
+
+        result = defaultdict(dict)
+        missing = []
+        for statement, frequency in pairs:
+            names = selected[statement]
+            key = FUND_KEYS[(statement, frequency)]
+            if key in self.__data:  # whole statement is already here
+                data = self.__data[key]
+                result[statement][frequency] = data if names is None else project(data, names)
+            elif (key, names) in self.__data:
+                result[statement][frequency] = self.__data[(key, names)]
+            else:
+                missing.append((statement, frequency))
 
-        data = await self._get_fundamentals(main, annual=annual)
-        self.__data[key] = strip_old_json(data)
-        return self.__data[key]
+        if missing:
+            self._check_known_invalid(FUND_KEYS[pair] for pair in missing)
+            await self._get_merged_fundamentals(missing, selected)
+            for statement, frequency in missing:
+                result[statement][frequency] = self.__data[self._fund_key(statement, frequency, selected)]
+        return dict(result)
+
+    @staticmethod
+    def _fund_key(statement, frequency, selected):
+        """
+        subsets of statements are saved under (Stats, fields) key
+        """
+        key = FUND_KEYS[(statement, frequency)]
+        names = selected[statement]
+        return key if names is None else (key, names)
+
+    async def _get_merged_fundamentals(self, pairs, selected):
+        """
+        requests pairs of (statement, frequency) together and saves each stripped statement
+        raises NameError if any of statements is empty
+        """
+        await self._check_route([FUND_KEYS[pair] for pair in pairs])
+        now = datetime.now()
+        urls = plan_urls(self.__ticker, pairs, now, selected)
+        fund_jsons = await asyncio.gather(*[self._base_request(url, is_json=True) for url in urls])
+
+        empty = []
+        for (statement, frequency), fund_json in split_results(fund_jsons, pairs, now, selected).items():
+            try:
+                self._save(self._fund_key(statement, frequency, selected), strip_old_json(fund_json))
+            except NameError:
+                empty.append((statement, frequency))
+
+        if empty:
+            error = NameError(f'{self.__ticker} has no data for {", ".join(" ".join(pair) for pair in empty)}')
+            if all(selected[statement] is None for statement, _ in empty):
+                # subsets of series may be empty when the whole statement is not
+                self._remember_invalid([FUND_KEYS[pair] for pair in empty], error)
+            raise error
 
     async def _get_fundamentals(self, main_part, annual=True) -> Dict:
-        url = FUNDAMETALS_URL + self.__ticker + main_part
+        url = FUNDAMENTALS_URL + self.__ticker + main_part
         now = datetime.now()
 
         if annual:
@@ -236,7 +426,14 @@ class Ticker:
         :return:
         """
         if Stats.TIME_SERIES not in self.__data:
-            await self._get_timeseries(interval, range_)
+            self._check_known_invalid((Stats.TIME_SERIES,))
+            try:
+                await self._get_timeseries(interval, range_)
+            except NameError as e:
+                # other chart errors come from interval or range, the same symbol may work with others
+                if str(e) == 'Not Found':
+                    self._remember_invalid((Stats.TIME_SERIES,), e)
+                raise
 
         return self.__data[Stats.TIME_SERIES]
 
@@ -254,6 +451,7 @@ class Ticker:
 
         reform_ts = {}
         base_ts = ts_json['chart']['result'][0]
+        remember_type(self.__ticker, (base_ts.get('meta') or {}).get('instrumentType'))
         reform_ts['timestamp'] = base_ts['timestamp']
         if 'events' in base_ts:
             events = base_ts['events']
@@ -262,8 +460,9 @@ class Ticker:
             if 'splits' in events:
                 reform_ts['splits'] = events['splits']
         data_ts = base_ts['indicators']
-        reform_ts = _merge_dicts([reform_ts, data_ts['quote'][0], data_ts['adjclose'][0]])
-        self.__data[Stats.TIME_SERIES] = reform_ts
+        # intraday intervals have no adjclose
+        reform_ts = _merge_dicts([reform_ts, data_ts['quote'][0], *data_ts.get('adjclose', [{}])[:1]])
+        self._save(Stats.TIME_SERIES, reform_ts)
 
     async def _request_timeseries(self, interval='1wk', range_: Union[str, timedelta] = '1y') -> Dict:
         # TODO support for second QUERY type: param1 & param2 date segment
@@ -281,12 +480,12 @@ class Ticker:
         logging.debug(url)
         return ts_json
 
-    async def get_profile(self) -> Dict:
-
-        if Stats.PROFILE not in self.__data:
-            await self._get_profile()
-
-        return self.__data[Stats.PROFILE]
+    async def get_profile(self, source='json') -> Dict:
+        """
+        :param source: 'json' for quote summary, falls back to html page if it fails, 'html' to scrape the page
+        """
+        data = await self.get_many((Stats.PROFILE,), source)
+        return data[Stats.PROFILE]
 
     @symbol_check(FUNCS['profile'])
     async def _get_profile(self, *, souped):
@@ -294,16 +493,73 @@ class Ticker:
         section = souped.find_all('section')[1]
         data = section.find_all('p')[1].find_all('span')
         name = section.h3.text
-        self.__data[Stats.PROFILE] = {
+        self._save(Stats.PROFILE, {
             'Sector': data[1].text,
             'Industry': data[3].text,
             'Name': name
-        }
+        })
+
+    async def get_statistics_with_profile(self, source='json'):
+        data = await self.get_many((Stats.PROFILE, Stats.STATISTICS), source)
+        return _merge_dicts([data[Stats.PROFILE], data[Stats.STATISTICS]])
+
+    async def get_summary(self, modules=MODULES) -> Dict[AnyStr, Dict]:
+        """
+        quote summary modules, the ones that are not saved yet are requested together
+        :param modules: names of modules, see summary.MODULES
+        :return: dict module -> dict, modules without data are empty
+        """
+        missing = [module for module in dict.fromkeys(modules) if (Stats.SUMMARY, module) not in self.__data]
+        if missing:
+            self._check_known_invalid((Stats.SUMMARY,))
+            summary_json = await self._base_request(summary_url(self.__ticker, missing), is_json=True)
+            try:
+                parsed = parse_summary(summary_json, self.__ticker)
+            except NameError as e:
+                self._remember_invalid((Stats.SUMMARY,), e)
+                raise
+            remember_type(self.__ticker, (parsed.get('quoteType') or {}).get('quoteType'))
+            for module in missing:
+                self._save((Stats.SUMMARY, module), parsed.get(module) or {})
+
+        return {module: self.__data[(Stats.SUMMARY, module)] for module in modules}
+
+    async def get_analysis(self) -> Dict[AnyStr, Dict]:
+        """
+        recommendations, earnings estimates and history, upgrades and downgrades
+        """
+        return await self.get_summary(ANALYSIS_MODULES)
 
-    async def get_statistics_with_profile(self):
-        profile = await self.get_profile()
-        stats = await self.get_statistics()
-        return _merge_dicts([profile, stats])
+    async def get_holders(self) -> Dict[AnyStr, Dict]:
+        """
+        major holders breakdown, institutions, funds and insiders
+        """
+        return await self.get_summary(HOLDERS_MODULES)
+
+    async def _load_from_summary(self, kinds: List[Stats], source) -> bool:
+        """
+        saves statistics and profile from one quote summary request
+        raises NameError like the html pages do if quote type of summary is not equity
+        :return: False if html page has to be scraped instead
+        """
+        if source == 'html':
+            return False
+        if source != 'json':
+            raise ValueError(f'unknown source {source}, use json or html')
+
+        try:
+            modules = await self.get_summary(STATISTICS_MODULES + PROFILE_MODULES)
+        except NameError:
+            raise
+        except Exception as e:  # pylint: disable=broad-except
+            # also when summary endpoints are broken and their breaker is open
+            logging.debug(f'{self.__ticker} quote summary failed {e!r}, scraping html')
+            return False
+
+        await self._check_route(kinds)  # type unknown before is known from quoteType module now
+        self._save(Stats.STATISTICS, map_statistics(modules))
+        self._save(Stats.PROFILE, map_profile(modules))
+        return True
 
     async def _make_request(self, func) -> AnyStr:
         url = f'{BASE}/{self.__ticker}/{func}'
@@ -395,18 +651,28 @@ class Ticker:
 
 class Tickers:
 
-    def __init__(self, tickers: List[str]):
-        self._tickers_names = tickers
-        self.order_hash = {
-            x: i for i, x in enumerate(self._tickers_names)
-        }
-        self._tickers: List[Ticker] = [Ticker(ticker) for ticker in tickers]
-        self.excepted_tickers: List[Tuple[AnyStr, AnyStr, BaseException]] = [] # (ticker name, function name, Exception)
+    def __init__(self, tickers: List[str], intern_symbols: bool = False):
+        """
+        :param tickers: symbols, repeated and differently cased spellings share one Ticker
+        :param intern_symbols: intern symbols strings, saves memory when several Tickers
+            are made from the same big universe
+        """
+        self._tickers_names: List[AnyStr] = list(dict.fromkeys(tickers))  # requested spellings without repeats
+        self.aliases: Dict[AnyStr, AnyStr] = {
+            name: intern(normalize_symbol(name)) if intern_symbols else normalize_symbol(name)
+            for name in self._tickers_names
+        }  # requested spelling -> symbol
+        self._tickers: Dict[AnyStr, Ticker] = {
+            symbol: Ticker(symbol) for symbol in self.aliases.values()
+        }  # one ticker for all spellings of symbol
+        config = Config.get()
+        # records of every failure (symbol, operation, error class, status, attempts...), latest ones are kept
+        self.excepted_tickers = ErrorLog(config.error_history, config.debug)
+        self.timed_out: List[AnyStr] = []  # names that did not finish in time during the last call
 
     def __getitem__(self, ticker: AnyStr):
         try:
-            index = self.order_hash[ticker]
-            return self._tickers[index]
+            return self._tickers[normalize_symbol(ticker)]
         except KeyError as e:
             raise KeyError(f'no such {ticker}') from e
 
@@ -415,68 +681,125 @@ class Tickers:
         clearing data dictionary inside every __ticker
         :param key_arr: array of keys to clean, if None clean every key
         """
-        for tick in self._tickers:
+        for tick in self._tickers.values():
             tick.clear(key_arr)
 
-    async def get_profiles(self):
-        return await self._base_get('get_profile')
+    async def get_profiles(self, source='json', timeout=None):
+        return await self._base_get('get_profile', source, timeout=timeout)
+
+    async def get_statistics(self, source='json', timeout=None):
+        return await self._base_get('get_statistics', source, timeout=timeout)
+
+    async def get_summary(self, modules=MODULES, timeout=None):
+        return await self._base_get('get_summary', modules, timeout=timeout)
+
+    async def get_analysis(self, timeout=None):
+        return await self._base_get('get_analysis', timeout=timeout)
 
-    async def get_statistics(self):
-        return await self._base_get('get_statistics')
+    async def get_holders(self, timeout=None):
+        return await self._base_get('get_holders', timeout=timeout)
 
-    async def get_timeseries(self, interval, range_):
-        return await self._base_get('get_timeseries', interval, range_)
+    async def get_timeseries(self, interval, range_, timeout=None):
+        return await self._base_get('get_timeseries', interval, range_, timeout=timeout)
 
-    async def get_cashflow(self, annual=True):
-        return await self._base_get('get_cashflow', annual)
+    # fields are checked once before tasks are made, wrong ones are an error of the call, not of every symbol
+    async def get_cashflow(self, annual=True, fields=None, timeout=None):
+        select_fields(('cashflow',), fields)
+        return await self._base_get('get_cashflow', annual, fields, timeout=timeout)
 
-    async def get_balance(self, annual=True):
-        return await self._base_get('get_balance', annual)
+    async def get_balance(self, annual=True, fields=None, timeout=None):
+        select_fields(('balance',), fields)
+        return await self._base_get('get_balance', annual, fields, timeout=timeout)
 
-    async def get_income(self, annual=True):
-        return await self._base_get('get_income', annual)
+    async def get_income(self, annual=True, fields=None, timeout=None):
+        select_fields(('income',), fields)
+        return await self._base_get('get_income', annual, fields, timeout=timeout)
 
-    async def get_statistics_with_profile(self):
-        return await self._base_get('get_statistics_with_profile')
+    async def get_fundamentals(self, statements=STATEMENTS, frequencies=FREQUENCIES, fields=None, timeout=None):
+        select_fields([statement for statement, _ in statement_pairs(statements, frequencies)], fields)
+        return await self._base_get('get_fundamentals', statements, frequencies, fields, timeout=timeout)
 
-    async def _base_get(self, func: AnyStr, *args, **kwargs):
+    async def get_asset_types(self, timeout=None):
+        return await self._base_get('get_asset_type', timeout=timeout)
+
+    async def get_many(self, kinds, source='json', timeout=None):
+        return await self._base_get('get_many', kinds, source, timeout=timeout)
+
+    async def get_statistics_with_profile(self, source='json', timeout=None):
+        return await self._base_get('get_statistics_with_profile', source, timeout=timeout)
+
+    async def _base_get(self, func: AnyStr, *args, timeout: Optional[float] = None, **kwargs):
         """
         call method without reusing code for each one
         :param func: method name
+        :param timeout: seconds for the whole call, unfinished symbols are cancelled
         """
-        coro_arr = [getattr(tick, func)(*args, **kwargs) for tick in self._tickers]
-        return await self._get_tasks(coro_arr, func)
+        coro_arr = [getattr(tick, func)(*args, **kwargs) for tick in self._tickers.values()]
+        if current_flow() is not None:
+            return await self._get_tasks(coro_arr, func, timeout)
 
-    async def _get_tasks(self, coroutine_array: List[Coroutine], func: AnyStr) -> Union[Tuple[Dict, List[AnyStr]],
-                                                                          Dict]:
+        # collection is its own flow, concurrent collections share slots fairly
+        with request_flow(self):
+            return await self._get_tasks(coro_arr, func, timeout)
+
+    async def _get_tasks(self, coroutine_array: List[Coroutine], func: AnyStr,
+                         timeout: Optional[float] = None) -> Union[Tuple[Dict, List[AnyStr]], Dict]:
         """
         hopefully universal function. For it to work
         every async function in Task must raise NameError if anything goes wrong
-        :param coroutine_array:
+        :param coroutine_array: one coroutine for every symbol in order of self._tickers
         :param func: name of the function to process
+        :param timeout: seconds to wait, then unfinished tasks are cancelled and get asyncio.TimeoutError.
+            Their names are saved to self.timed_out and tickers are kept for the next call,
+            so are tickers that failed with CircuitOpenError
         :return: dict (ticker -> value) of completed data and dict (ticker -> repr(exception)
          or dict (ticker -> value) of data and exceptions mixed. See HANDLE_EXCEPTIONS variable
+         every requested spelling of symbol gets the same value
         """
-        completed = await asyncio.gather(*coroutine_array, return_exceptions=True)
-        if Config.internal.handle_exceptions:
-            wrong_indexes = []
+        tasks = [asyncio.ensure_future(coro) for coro in coroutine_array]
+        pending = set()
+        if timeout is not None and tasks:
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()  # cancelled requests release their slots on the way out
+
+        completed = await asyncio.gather(*tasks, return_exceptions=True)
+        by_symbol = {}
+        timed_out = set()
+        transient = set()  # symbols that are kept for the next call
+        for symbol, task, value in zip(self._tickers, tasks, completed):
+            if task in pending:
+                timed_out.add(symbol)
+                value = asyncio.TimeoutError(f'{symbol} {func} timed out after {timeout}s')
+            if isinstance(value, (asyncio.TimeoutError, CircuitOpenError)):
+                transient.add(symbol)
+            if isinstance(value, Exception):
+                self.excepted_tickers.add(symbol, func, value)
+            by_symbol[symbol] = value
+
+        self.timed_out = [name for name in self._tickers_names if self.aliases[name] in timed_out]
+
+        if Config.get().handle_exceptions:
             excepted_tickers = dict()
             result = dict()
-            for i, value in enumerate(completed):
+            for symbol, value in by_symbol.items():
+                if isinstance(value, Exception) and symbol not in transient:
+                    del self._tickers[symbol]
+
+            for name in list(self._tickers_names):
+                symbol = self.aliases[name]
+                value = by_symbol[symbol]
                 if isinstance(value, Exception):
-                    wrong_indexes.append(i)
-                    excepted_tickers[self._tickers_names[i]] = repr(value) # making exceptions json serializable by
+                    excepted_tickers[name] = repr(value) # making exceptions json serializable by
                     #converting them to string
-                    self.excepted_tickers.append((self._tickers_names[i], func, value))
+                    if symbol not in transient:
+                        self._tickers_names.remove(name)
+                        del self.aliases[name]
                 else:
-                    result[self._tickers_names[i]] = value
+                    result[name] = value
 
-            for ind in sorted(wrong_indexes, reverse=True):
-                del self._tickers_names[ind]
-                del self._tickers[ind]
-                #del completed[ind]
             return result, excepted_tickers
         result = {
-            self._tickers_names[i]: val for i, val in enumerate(completed)
+            name: by_symbol[self.aliases[name]] for name in self._tickers_names
         }
         return result
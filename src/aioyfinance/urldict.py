@@ -6,6 +6,19 @@ from datetime import timedelta
 BASE = 'https://finance.yahoo.com/quote'
 QUERY = 'https://query1.finance.yahoo.com/v8/finance/chart'
 QUERY_OPTIONAL = 'region=US&lang=en-US'
+FUNDAMENTALS_URL = 'https://query1.finance.yahoo.com/ws/fundamentals-timeseries/v1/finance/timeseries/'
+# period1 and period2 and symbol
+FUNDAMENTAL_FORMATTER = '&period1={period1}&period2={period2}&symbol={symbol}'
+# symbol follows, then ?modules=
+SUMMARY_URL = 'https://query2.finance.yahoo.com/v10/finance/quoteSummary/'
+# families of endpoints for circuit breakers, url prefix -> family
+ENDPOINTS = {
+    BASE: 'quote',
+    QUERY: 'chart',
+    FUNDAMENTALS_URL: 'fundamentals',
+    SUMMARY_URL: 'summary'
+}
+
 FUNCS = {
     'statistics': 'key-statistics',
     'financials': 'financials',
@@ -0,0 +1,245 @@
+"""
+Incremental writers of downloaded results with resumable progress
+"""
+import json
+import os
+from typing import AnyStr, Dict, List, Set, Tuple
+
+
+def _dumps(value) -> AnyStr:
+    return json.dumps(value, default=str)
+
+
+class NdjsonWriter:
+    """
+    appends one json line {"symbol", "kind", "data"} per result,
+    the file itself is the progress of the run
+    """
+    def __init__(self, path: AnyStr, flush_every: int = 200):
+        self.path = path
+        self.flush_every = flush_every
+        self._buffer: List[AnyStr] = []
+
+    def done(self) -> Set[Tuple[AnyStr, AnyStr]]:
+        """
+        :return: set of (kind, symbol) already written
+        """
+        done = set()
+        if not os.path.exists(self.path):
+            return done
+
+        with open(self.path, 'rb+') as file:
+            for line in file:
+                try:
+                    row = json.loads(line)
+                except ValueError:  # line torn by crash
+                    continue
+                done.add((row['kind'], row['symbol']))
+
+            file.seek(0, os.SEEK_END)
+            if file.tell():
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b'\n':  # next line should not be glued to the torn one
+                    file.write(b'\n')
+        return done
+
+    def clear(self):
+        """
+        truncates output of previous run
+        """
+        with open(self.path, 'w', encoding='utf-8'):
+            pass
+        self._buffer = []
+
+    def write(self, kind: AnyStr, symbol: AnyStr, value):
+        self._buffer.append(_dumps({'symbol': symbol, 'kind': kind, 'data': value}))
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+
+        with open(self.path, 'a', encoding='utf-8') as file:
+            file.write('\n'.join(self._buffer) + '\n')
+        self._buffer = []
+
+    def close(self):
+        self.flush()
+
+
+# columns of timeseries bars, dividends and splits are kept only in ndjson output
+BAR_COLUMNS = ('open', 'high', 'low', 'close', 'adjclose', 'volume')
+STATEMENT_COLUMNS = ('statement', 'period', 'series', 'value')
+STATEMENTS = ('income', 'balance', 'cashflow')
+
+
+def bar_columns(rows: List[Tuple[AnyStr, Dict]]) -> Dict[AnyStr, List]:
+    """
+    :param rows: (symbol, value of get_timeseries)
+    :return: columns symbol, date (timestamps) and BAR_COLUMNS, one row per bar
+    """
+    columns = {name: [] for name in ('symbol', 'date') + BAR_COLUMNS}
+    for symbol, value in rows:
+        timestamps = value.get('timestamp') or []
+        columns['symbol'] += [symbol] * len(timestamps)
+        columns['date'] += timestamps
+        for name in BAR_COLUMNS:
+            columns[name] += value.get(name) or [None] * len(timestamps)
+    return columns
+
+
+def statement_columns(rows: List[Tuple[AnyStr, AnyStr, Dict]]) -> Dict[AnyStr, List]:
+    """
+    :param rows: (symbol, statement, stripped dictionary of the statement)
+    :return: columns symbol, date (timestamps) and STATEMENT_COLUMNS, one row per value of series,
+        period is annual, quarterly or trailing
+    """
+    columns = {name: [] for name in ('symbol', 'date') + STATEMENT_COLUMNS}
+    seen = set()  # trailing series come with both frequencies of fundamentals
+    for symbol, statement, stripped in rows:
+        for period, series in stripped.items():
+            for name, values in series.items():
+                for stamp, value in zip(values['timestamp'], values['data']):
+                    key = (symbol, statement, period, name, stamp)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    row = {'symbol': symbol, 'date': stamp, 'statement': statement,
+                           'period': period, 'series': name, 'value': value}
+                    for column, item in row.items():
+                        columns[column].append(item)
+    return columns
+
+
+def make_table(kind: AnyStr, rows: List[Tuple[AnyStr, object]]):
+    """
+    typed columns of timeseries and statements, other kinds are symbol and data (json string) columns
+    :param rows: (symbol, value) of one kind
+    :return: pyarrow table
+    """
+    import pyarrow as pa  # pylint: disable=import-outside-toplevel
+    date = pa.timestamp('s', tz='UTC')
+    if kind == 'timeseries':
+        schema = pa.schema([('symbol', pa.string()), ('date', date)] +
+                           [(name, pa.int64() if name == 'volume' else pa.float64()) for name in BAR_COLUMNS])
+        return pa.Table.from_pydict(bar_columns(rows), schema=schema)
+
+    if kind in STATEMENTS or kind == 'fundamentals':
+        if kind == 'fundamentals':  # statement -> frequency -> stripped dictionary
+            rows = [(symbol, statement, stripped) for symbol, value in rows
+                    for statement, frequencies in value.items() for stripped in frequencies.values()]
+        else:
+            rows = [(symbol, kind, stripped) for symbol, stripped in rows]
+        schema = pa.schema([('symbol', pa.string()), ('date', date), ('statement', pa.string()),
+                            ('period', pa.string()), ('series', pa.string()), ('value', pa.float64())])
+        return pa.Table.from_pydict(statement_columns(rows), schema=schema)
+
+    return pa.table({'symbol': [symbol for symbol, _ in rows], 'data': [_dumps(value) for _, value in rows]})
+
+
+class ArrowWriter:
+    """
+    writes parts of every kind into its own subdirectory, timeseries and statements as typed columns,
+    see make_table. Every flush makes a new Parquet or Arrow IPC file per kind,
+    then its rows are added to progress file
+    needs pyarrow
+    """
+    PROGRESS = 'progress.ndjson'
+
+    def __init__(self, path: AnyStr, file_format: AnyStr = 'parquet', flush_every: int = 200):
+        try:
+            import pyarrow  # pylint: disable=import-outside-toplevel,unused-import
+        except ImportError as e:
+            raise ImportError('pyarrow is needed for parquet and arrow output, pip install pyarrow') from e
+
+        if file_format not in ('parquet', 'arrow'):
+            raise ValueError(f'unknown format {file_format}')
+        self.path = path
+        self.file_format = file_format
+        self.flush_every = flush_every
+        self._rows: Dict[AnyStr, List[Tuple[AnyStr, object]]] = {}  # kind -> (symbol, value)
+        self._size = 0
+        os.makedirs(path, exist_ok=True)
+        self._part = 0
+        for directory, _, names in os.walk(path):
+            for name in names:
+                if not name.startswith('part-'):
+                    continue
+                if name.endswith('.tmp'):  # torn by crash, its rows are not in progress
+                    os.remove(os.path.join(directory, name))
+                else:
+                    self._part += 1
+
+    def done(self) -> Set[Tuple[AnyStr, AnyStr]]:
+        done = set()
+        progress = os.path.join(self.path, self.PROGRESS)
+        if not os.path.exists(progress):
+            return done
+
+        with open(progress, encoding='utf-8') as file:
+            for line in file:
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    continue
+                done.add((row['kind'], row['symbol']))
+        return done
+
+    def clear(self):
+        """
+        removes parts and progress of previous run
+        """
+        for directory, _, names in os.walk(self.path):
+            for name in names:
+                if name.startswith('part-') or name == self.PROGRESS:
+                    os.remove(os.path.join(directory, name))
+        self._part = 0
+        self._rows = {}
+        self._size = 0
+
+    def write(self, kind: AnyStr, symbol: AnyStr, value):
+        self._rows.setdefault(kind, []).append((symbol, value))
+        self._size += 1
+        if self._size >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if not self._size:
+            return
+
+        for kind, rows in self._rows.items():
+            self._write_part(kind, make_table(kind, rows))
+
+        with open(os.path.join(self.path, self.PROGRESS), 'a', encoding='utf-8') as file:
+            file.write(''.join(_dumps({'kind': kind, 'symbol': symbol}) + '\n'
+                               for kind, rows in self._rows.items() for symbol, _ in rows))
+        self._rows = {}
+        self._size = 0
+
+    def _write_part(self, kind: AnyStr, table):
+        import pyarrow as pa  # pylint: disable=import-outside-toplevel
+        directory = os.path.join(self.path, kind)
+        os.makedirs(directory, exist_ok=True)
+        name = os.path.join(directory, f'part-{self._part:05d}.{self.file_format}')
+        temporary = name + '.tmp'
+        if self.file_format == 'parquet':
+            import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+            pq.write_table(table, temporary)
+        else:
+            with pa.OSFile(temporary, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(temporary, name)  # part is either complete or missing
+        self._part += 1
+
+    def close(self):
+        self.flush()
+
+
+def make_writer(path: AnyStr, file_format: AnyStr, flush_every: int = 200):
+    """
+    :param file_format: ndjson, parquet or arrow
+    """
+    if file_format == 'ndjson':
+        return NdjsonWriter(path, flush_every)
+    return ArrowWriter(path, file_format, flush_every)
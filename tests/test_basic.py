@@ -3,8 +3,30 @@ import aioyfinance as yf
 import asyncio as asy
 from aioyfinance.old_urls import *
 from aioyfinance.tickers import strip_old_json
+from aioyfinance.fundamentals import plan_urls, statement_pairs, statement_types, select_fields, MAX_URL_LENGTH
+from datetime import datetime
+from aioyfinance.proxies import ProxyPool
+from aioyfinance.jobs import Journal
+from aioyfinance.priority import PrioritySemaphore, FairQueue, INTERACTIVE, NORMAL, BULK
+from aioyfinance.errors import ErrorLog
+from aioyfinance.negative import NegativeCache
+from aioyfinance.breaker import CircuitBreaker, CircuitOpenError
+from aioyfinance.urldict import QUERY
+from aioyfinance.summary import parse_summary, map_statistics, map_profile
 from collections import defaultdict
+from contextlib import asynccontextmanager
 from pprint import pprint
+import tracemalloc
+import importlib.util
+import json
+from unittest import mock
+import tempfile
+import glob
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+import subprocess
+import sys
 
 loop = asy.get_event_loop()
 
@@ -87,6 +109,38 @@ class MyTestCase(unittest.TestCase):
 
         self.assertIsNotNone(strip)
 
+    def test_fund_plan(self):
+        pairs = statement_pairs(('income', 'balance', 'cashflow'), ('annual', 'quarterly'))
+        urls = plan_urls('nvda', pairs, datetime.now())
+
+        self.assertEqual(len(urls), 4)  # instead of 6 single statement requests
+        self.assertEqual(len(plan_urls('nvda', statement_pairs('income', ('annual', 'quarterly')), datetime.now())), 1)
+        for url in urls:
+            self.assertLessEqual(len(url), MAX_URL_LENGTH)
+        for pair in pairs:
+            for type_ in statement_types(*pair):
+                self.assertTrue(any(f'={type_}%2C' in url or f'%2C{type_}%2C' in url or f'%2C{type_}&' in url
+                                    for url in urls))
+
+    def test_fund_fields(self):
+        selected = select_fields(('income', 'balance', 'cashflow'), ['NetIncome', 'TotalRevenue', 'FreeCashFlow'])
+        self.assertEqual(selected, {'income': ('NetIncome', 'TotalRevenue'), 'cashflow': ('FreeCashFlow',)})
+
+        urls = plan_urls('nvda', [('income', 'annual')], datetime.now(), selected)
+        self.assertEqual(len(urls), 1)
+        self.assertIn('type=annualNetIncome%2CtrailingNetIncome%2CannualTotalRevenue%2CtrailingTotalRevenue&', urls[0])
+
+        with self.assertRaises(ValueError):
+            select_fields(('income',), ['FreeCashFlow'])
+
+        tickers = yf.Tickers(['aapl', 'msft'])
+        with self.assertRaises(ValueError):
+            loop.run_until_complete(tickers.get_income(fields=['FreeCashFlow']))
+        with self.assertRaises(ValueError):
+            loop.run_until_complete(tickers.get_fundamentals(statements=('income',), fields=['FreeCashFlow']))
+        self.assertEqual(len(tickers.aliases), 2)
+        self.assertEqual(len(tickers.excepted_tickers), 0)
+
     def test_income(self):
         #TODO probably better tests needed, these are shallow
         ticker = yf.Ticker('nvda')
@@ -107,6 +161,827 @@ class MyTestCase(unittest.TestCase):
         self.assertIsNotNone(data)
         self.assertIsNotNone(data_)
 
+    def test_aliases(self):
+        tickers = yf.Tickers(['nvda', 'NVDA', ' nvda', 'aapl', 'nvda'])
+
+        self.assertIs(tickers['nvda'], tickers['NVDA'])
+        self.assertIs(tickers[' nvda'], tickers['Nvda'])
+        self.assertEqual(len(tickers.aliases), 4)
+        self.assertEqual(set(tickers.aliases.values()), {'NVDA', 'AAPL'})
+
+    def test_memory(self):
+        names = [f'sym{i}' for i in range(50000)]
+
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        tickers = yf.Tickers(names)
+        per_symbol = (tracemalloc.get_traced_memory()[0] - before) / len(names)
+        tracemalloc.stop()
+
+        # symbol string, Ticker and index entries of an idle symbol
+        self.assertLess(per_symbol, 256)
+        self.assertFalse(hasattr(tickers['sym0'], '__dict__'))
+
+    def test_import_time(self):
+        def imported(statement):
+            out = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                                 capture_output=True, text=True, check=True).stderr
+            # import time: self [us] | cumulative | imported package
+            return {line.split('|')[-1].strip(): int(line.split('|')[1]) for line in out.splitlines()[1:]}
+
+        modules = imported('import aioyfinance')
+        self.assertNotIn('aiohttp', modules)
+        self.assertNotIn('bs4', modules)
+        self.assertNotIn('aioyfinance.old_urls', modules)
+        self.assertLess(modules['aioyfinance'], 100000)
+
+        modules = imported('import aioyfinance; aioyfinance.Tickers')
+        self.assertNotIn('bs4', modules)
+        self.assertNotIn('aiohttp.web', modules)
+
+        # optional extras are not needed for star import
+        subprocess.run([sys.executable, '-c', 'import sys; sys.modules["numpy"] = None; from aioyfinance import *'],
+                       check=True)
+
+    def test_proxy_pool(self):
+        pool = ProxyPool(['a', 'b'], max_active=1, eject_after=2)
+
+        async def run():
+            first = await pool.acquire()
+            second = await pool.acquire()
+            self.assertNotEqual(first, second)  # one active request per proxy
+            pool.release(first, failed=True)
+            pool.release(second, latency=0.1)
+            pool.release(await pool.acquire(exclude=second), failed=True)
+
+        loop.run_until_complete(run())
+        stats = pool.stats()
+        bad = 'a' if stats['a']['errors'] else 'b'
+        self.assertTrue(stats[bad]['ejected'])
+        self.assertNotEqual(pool.pick(), bad)
+
+    def test_breaker(self):
+        now = [0.]
+        with mock.patch('aioyfinance.breaker.monotonic', lambda: now[0]):
+            breaker = CircuitBreaker('chart', threshold=2, reset_timeout=10)
+            for _ in range(2):
+                breaker.check()
+                breaker.failure()
+            self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+            self.assertTrue(breaker.is_open())
+            with self.assertRaises(CircuitOpenError):  # fast fail
+                breaker.check()
+
+            now[0] = 11.
+            breaker.check()  # single probe
+            self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+            with self.assertRaises(CircuitOpenError):
+                breaker.check()
+            breaker.abort()  # cancelled probe, the next request probes again
+            self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+            breaker.check()
+            breaker.failure()
+            with self.assertRaises(CircuitOpenError):
+                breaker.check()
+
+            now[0] = 22.
+            breaker.check()
+            breaker.success()
+            self.assertEqual(breaker.as_dict(), {'state': CircuitBreaker.CLOSED, 'failures': 0})
+
+    def test_retry(self):
+        from aioyfinance.base_requests import BaseRequest
+        url = QUERY + '/AAPL'
+        statuses = []
+
+        def error(status):
+            info = aiohttp.RequestInfo(URL(url), 'GET', CIMultiDictProxy(CIMultiDict()))
+            return aiohttp.ClientResponseError(info, (), status=status)
+
+        class Response:
+            def __init__(self, status):
+                self.status = status
+
+            def raise_for_status(self):
+                raise error(self.status)
+
+            async def json(self):
+                return {'ok': True}
+
+        class Session:
+            @asynccontextmanager
+            async def get(self, url, **kwargs):
+                yield Response(statuses.pop(0))
+
+        async def proxied(*args, **kwargs):
+            return await original(args[0], Session(), *args[2:], **kwargs)
+
+        original = BaseRequest._proxied
+        yf.Config.create(max_retries=4, retry_delay=0, min_rand_delay=0, max_rand_delay=0, breaker_threshold=3)
+        try:
+            with mock.patch.object(BaseRequest, '_proxied', staticmethod(proxied)):
+                # throttling and server errors are retried
+                statuses.extend([429, 503, 200])
+                self.assertEqual(loop.run_until_complete(BaseRequest.get(url, is_json=True)), {'ok': True})
+
+                # failures in a row open the breaker, the fourth attempt is not made
+                statuses.extend([500, 500, 500, 500])
+                with self.assertRaises(CircuitOpenError):
+                    loop.run_until_complete(BaseRequest.get(url, is_json=True))
+                self.assertEqual(statuses, [500])
+                self.assertEqual(yf.Config.get().breaker_states(), {'chart': {'state': 'open', 'failures': 3}})
+                with self.assertRaises(CircuitOpenError):  # fails fast
+                    loop.run_until_complete(BaseRequest.get(url, is_json=True))
+                self.assertEqual(statuses, [500])
+        finally:
+            yf.Config.create()
+
+    def test_deadline(self):
+        from aioyfinance.base_requests import BaseRequest
+
+        async def retry(config, url, is_json):
+            if '/SLOW?' in url:
+                await asy.sleep(10)
+            return {'chart': {'result': [{'meta': {}, 'timestamp': [1], 'indicators': {'quote': [{'close': [1.]}]}}]}}
+
+        config = yf.Config.create(parallel=False, max_batch=1)
+        try:
+            with mock.patch.object(BaseRequest, '_retry', staticmethod(retry)):
+                tickers = yf.Tickers(['fast', 'slow', 'waiting'])
+                result, excepted = loop.run_until_complete(tickers.get_timeseries('1d', '1y', timeout=0.2))
+
+            self.assertEqual(list(result), ['fast'])
+            self.assertEqual(result['fast']['close'], [1.])
+            self.assertEqual(tickers.timed_out, ['slow', 'waiting'])  # waiting never got the slot
+            self.assertEqual(set(excepted), {'slow', 'waiting'})
+            self.assertFalse(config.lock.locked())
+            self.assertEqual(config.semaphore_batch._value, 1)
+            self.assertEqual(len(tickers.aliases), 3)  # timed out symbols are kept for the next call
+        finally:
+            yf.Config.create()
+
+    def test_hedge(self):
+        from aioyfinance.base_requests import BaseRequest
+        excluded = []
+        cancelled = []
+
+        async def proxied(config, session, url, is_json, exclude=None, used=None):
+            proxy = 'b' if exclude == 'a' else 'a'  # pool avoids proxy of the primary
+            if used is not None:
+                used.append(proxy)
+            excluded.append(exclude)
+            try:
+                if proxy == 'a':
+                    await asy.sleep(0.3)
+            except asy.CancelledError:
+                cancelled.append(proxy)
+                raise
+            return proxy
+
+        config = yf.Config.create(min_rand_delay=0, max_rand_delay=0, hedge_percentile=0.95, hedge_fraction=0.1)
+        for _ in range(config.latency.min_samples):
+            config.latency.add(0.05)
+        config.latency.requests = 10
+        try:
+            with mock.patch.object(BaseRequest, '_proxied', staticmethod(proxied)):
+                # primary is slower than the percentile, duplicate through another proxy wins
+                self.assertEqual(loop.run_until_complete(BaseRequest.get(QUERY + '/AAPL', is_json=True)), 'b')
+                self.assertEqual(excluded, [None, 'a'])
+                self.assertEqual(cancelled, ['a'])
+                self.assertEqual(config.latency.hedged, 1)
+
+                # 2 hedges would be over 10% of 12 requests, primary is awaited
+                self.assertEqual(loop.run_until_complete(BaseRequest.get(QUERY + '/AAPL', is_json=True)), 'a')
+                self.assertEqual(excluded, [None, 'a', None])
+                self.assertEqual(config.latency.hedged, 1)
+        finally:
+            yf.Config.create()
+
+    def test_download_universe(self):
+        from aioyfinance import bulk
+        from concurrent.futures import ThreadPoolExecutor
+        batches = []
+
+        def run_shard(symbols, kinds, settings):
+            batches.append(settings['max_batch'])
+            if 'DEAD' in symbols:
+                raise RuntimeError('worker died')
+            results = {kind: {symbol: f'{kind} {symbol}' for symbol in symbols if symbol != 'BAD'} for kind in kinds}
+            errors = {kind: {symbol: f"NameError('{kind}')" for symbol in symbols if symbol == 'BAD'}
+                      for kind in kinds}
+            return results, errors
+
+        symbols = ['A', 'B', 'BAD', 'C', 'DEAD', 'D', 'E']
+        config = yf.Config(max_batch=8)
+        with mock.patch.object(bulk, '_run_shard', run_shard), \
+                mock.patch.object(bulk, 'ProcessPoolExecutor', ThreadPoolExecutor):
+            results, errors = bulk.download_universe(symbols, ['timeseries', 'statistics'], workers=2,
+                                                     chunk_size=2, config=config)
+
+            # shards of 2 symbols, each worker gets half of max_batch
+            self.assertEqual(batches, [4] * 4)
+            for kind in ('timeseries', 'statistics'):
+                self.assertEqual(results[kind], {symbol: f'{kind} {symbol}' for symbol in ['A', 'B', 'C', 'E']})
+                # error of symbol is kept by kind, failed shard reports its error for all of its symbols
+                self.assertEqual(errors[kind], {'BAD': f"NameError('{kind}')", 'DEAD': "RuntimeError('worker died')",
+                                                'D': "RuntimeError('worker died')"})
+
+            written = []
+            results, errors = bulk.download_universe(symbols, ['timeseries'], workers=2, chunk_size=2, config=config,
+                                                     sink=lambda *row: written.append(row))
+            self.assertEqual(results, {'timeseries': {}})
+            self.assertEqual(sorted(written), [('timeseries', symbol, f'timeseries {symbol}')
+                                               for symbol in ['A', 'B', 'C', 'E']])
+            self.assertEqual(set(errors['timeseries']), {'BAD', 'DEAD', 'D'})
+
+    def test_shard_session(self):
+        from aioyfinance import bulk
+        from aioyfinance.sessions import shared_session
+        sessions = []
+
+        async def download(symbols, kinds):
+            sessions.append(shared_session())
+            return {'income': {}}, {'income': {}}
+
+        with mock.patch.object(bulk, 'download', download):
+            bulk._run_shard(['AAPL'], {'income': {}}, yf.Config.get().as_kwargs())
+        yf.Config.create()
+
+        # requests of the shard share one session, it is closed with the loop
+        self.assertIsNotNone(sessions[0])
+        self.assertTrue(sessions[0].closed)
+
+    def test_warmup(self):
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+        from aioyfinance import sessions
+        opened = []
+
+        class Connector(aiohttp.TCPConnector):
+            async def _create_connection(self, req, *args, **kwargs):
+                opened.append(str(req.url.origin()))
+                return await super()._create_connection(req, *args, **kwargs)
+
+        async def head(request):
+            await asy.sleep(0.05)  # requests of warmup overlap and take a connection each
+            return web.Response(text='ok')  # content length of HEAD keeps connection alive
+
+        async def run():
+            app = web.Application()
+            app.router.add_get('/', head)
+            servers = [TestServer(app, host='127.0.0.1') for _ in range(2)]
+            for server in servers:
+                await server.start_server()
+            origins = [str(server.make_url('/')) for server in servers]
+            try:
+                result = await sessions.warmup(connections=3, hosts=[origins[0] + 'chart?x=1', origins[1]],
+                                               proxies=[None])
+                self.assertEqual(result, {origins[0]: 3, origins[1]: 3})
+                self.assertEqual(sorted(opened), sorted([origin.rstrip('/') for origin in origins] * 3))
+
+                # warmed connections stay open in the persistent session of the loop
+                session = sessions.shared_session()
+                self.assertIsInstance(session.connector, Connector)
+                await session.head(origins[0])
+                self.assertEqual(len(opened), 6)
+            finally:
+                await sessions.close_session()
+                for server in servers:
+                    await server.close()
+            self.assertTrue(session.closed)
+            self.assertIsNone(sessions.shared_session())
+
+        with mock.patch.object(sessions.aiohttp, 'TCPConnector', Connector):
+            loop.run_until_complete(run())
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'needs pyarrow')
+    def test_arrow_columns(self):
+        from aioyfinance.writers import make_table
+        bars = make_table('timeseries', [('AAA', {'timestamp': [1, 2], 'close': [1., None], 'volume': [10, 20]})])
+        self.assertEqual(bars.column_names, ['symbol', 'date', 'open', 'high', 'low', 'close', 'adjclose', 'volume'])
+        self.assertEqual(str(bars.schema.field('date').type), 'timestamp[s, tz=UTC]')
+        self.assertEqual(bars.column('close').to_pylist(), [1., None])
+        self.assertEqual(bars.column('open').to_pylist(), [None, None])
+
+        stripped = {'annual': {'NetIncome': {'timestamp': [1, 2], 'data': [5, None], 'info': []}},
+                    'trailing': {'NetIncome': {'timestamp': [3], 'data': [7.5], 'info': []}}}
+        income = make_table('income', [('AAA', stripped)])
+        self.assertEqual(income.column_names, ['symbol', 'date', 'statement', 'period', 'series', 'value'])
+        self.assertEqual(income.column('value').to_pylist(), [5., None, 7.5])
+
+        # trailing series of both frequencies are written once
+        quarterly = {'quarterly': {}, 'trailing': stripped['trailing']}
+        fundamentals = make_table('fundamentals', [('AAA', {'income': {'annual': stripped, 'quarterly': quarterly}})])
+        self.assertEqual(fundamentals.column('period').to_pylist(), ['annual', 'annual', 'trailing'])
+        self.assertEqual(set(fundamentals.column('statement').to_pylist()), {'income'})
+
+        statistics = make_table('statistics', [('AAA', {'beta': 1.})])
+        self.assertEqual(json.loads(statistics.column('data')[0].as_py()), {'beta': 1.})
+
+    def test_cli_resume(self):
+        from aioyfinance.cli import main
+        from aioyfinance.tickers import Ticker
+        requested = []
+
+        async def fake(url, is_json=False):
+            requested.append(url.split('?')[0].rsplit('/', 1)[-1])
+            return {'chart': {'result': [{'meta': {}, 'timestamp': [1], 'indicators': {'quote': [{'close': [1.]}]}}]}}
+
+        def rows(output, file_format):
+            if file_format == 'ndjson':
+                with open(output, encoding='utf-8') as file:
+                    lines = file.read().splitlines()
+                return [json.loads(line)['symbol'] for line in lines if line.endswith('}')]
+            import pyarrow.parquet as pq
+            parts = sorted(glob.glob(f'{output}/timeseries/part-*'))
+            tables = [pq.read_table(part) for part in parts]
+            self.assertTrue(all(str(table.schema.field('close').type) == 'double' for table in tables))
+            return [symbol for table in tables for symbol in table.column('symbol').to_pylist()]
+
+        formats = ['ndjson', 'parquet'] if importlib.util.find_spec('pyarrow') else ['ndjson']
+        with tempfile.TemporaryDirectory() as root, mock.patch.object(Ticker, '_base_request', staticmethod(fake)):
+            for file_format in formats:
+                symbols = f'{root}/symbols.txt'
+                output = f'{root}/out.{file_format}'
+                with open(symbols, 'w') as file:
+                    file.write('AAA BBB')
+                requested.clear()
+                self.assertEqual(main([symbols, '-o', output, '-f', file_format]), 0)
+
+                if file_format == 'ndjson':  # crash in the middle of a line
+                    with open(output, 'a', encoding='utf-8') as file:
+                        file.write('{"symbol": "CCC", "ki')
+                else:  # crash before the part was renamed
+                    with open(f'{output}/timeseries/part-00001.parquet.tmp', 'wb') as file:
+                        file.write(b'torn')
+                with open(symbols, 'w') as file:
+                    file.write('AAA BBB CCC')
+                self.assertEqual(main([symbols, '-o', output, '-f', file_format]), 0)
+
+                self.assertEqual(requested, ['AAA', 'BBB', 'CCC'])  # second run only requests CCC
+                self.assertEqual(sorted(rows(output, file_format)), ['AAA', 'BBB', 'CCC'])
+
+                # start over, rows of previous runs are not kept twice
+                requested.clear()
+                self.assertEqual(main([symbols, '-o', output, '-f', file_format, '--no-resume']), 0)
+                self.assertEqual(requested, ['AAA', 'BBB', 'CCC'])
+                self.assertEqual(sorted(rows(output, file_format)), ['AAA', 'BBB', 'CCC'])
+        yf.Config.create()
+
+    def test_cli_negative(self):
+        from aioyfinance.cli import main
+        from aioyfinance.tickers import Ticker
+        requested = []
+
+        async def fake(url, is_json=False):
+            requested.append(url.split('?')[0].rsplit('/', 1)[-1])
+            if 'WRONG' in url:
+                return {'chart': {'result': None, 'error': {'code': 'Not Found'}}}
+            return {'chart': {'result': [{'meta': {}, 'timestamp': [1], 'indicators': {'quote': [{'close': [1.]}]}}]}}
+
+        with tempfile.TemporaryDirectory() as root, mock.patch.object(Ticker, '_base_request', staticmethod(fake)):
+            symbols = f'{root}/symbols.txt'
+            with open(symbols, 'w') as file:
+                file.write('AAA WRONG')
+            argv = [symbols, '-o', f'{root}/out.ndjson', '--negative-ttl', '60', '--negative-path', f'{root}/failed.db']
+            try:
+                self.assertEqual(main(argv), 1)
+                self.assertEqual(requested, ['AAA', 'WRONG'])
+                self.assertEqual(yf.Config.get().negative_ttl, 60)
+
+                # WRONG is not written, it is known to fail from the file of the first run
+                requested.clear()
+                self.assertEqual(main(argv), 1)
+                self.assertEqual(requested, [])
+            finally:
+                yf.Config.get().negative_cache.close()
+                yf.Config.create()
+
+        with self.assertRaises(SystemExit), mock.patch('sys.stderr'):
+            main(['symbols.txt', '-o', 'out.ndjson', '--negative-path', 'failed.db'])
+
+    def test_scheduler(self):
+        from aioyfinance import scheduler
+        calls = []
+
+        class FakeTicker:
+            def __init__(self, symbol):
+                self.symbol = symbol
+
+            async def get_timeseries(self, interval, range_):
+                calls.append((self.symbol, loop.time()))
+                await asy.sleep(0.05)
+                return {'close': [1.]}
+
+        async def run():
+            schedule = scheduler.Scheduler()
+            refresh = schedule.add(['a', 'b', 'c', 'd'], 'timeseries', every=0.4, fresh=10)
+            published = {'all': [], 'statistics': [], 'a': []}
+            schedule.subscribe(lambda kind, symbol, value: published['all'].append(symbol))
+            schedule.subscribe(lambda kind, symbol, value: published['statistics'].append(symbol), kinds=['statistics'])
+
+            async def only_a(kind, symbol, value):
+                published['a'].append(symbol)
+            schedule.subscribe(only_a, symbols=['A'])
+
+            start = loop.time()
+            schedule.start()
+            await asy.sleep(0.5)  # second period starts, every value is still fresh
+            schedule.stop()
+
+            # one request per symbol, spread evenly over the period
+            self.assertEqual([symbol for symbol, _ in calls], ['A', 'B', 'C', 'D'])
+            for i, (_, time) in enumerate(calls):
+                self.assertAlmostEqual(time - start, i * 0.1, delta=0.05)
+            self.assertEqual(sorted(published['all']), ['A', 'B', 'C', 'D'])
+            self.assertEqual(published['statistics'], [])
+            self.assertEqual(published['a'], ['A'])
+            self.assertEqual(schedule.latest('timeseries', 'a'), {'close': [1.]})
+
+            # refresh of a symbol that is still in flight is not requested twice
+            calls.clear()
+            await asy.gather(*[schedule._refresh(refresh, 'E') for _ in range(2)])
+            self.assertEqual([symbol for symbol, _ in calls], ['E'])
+
+        with mock.patch.object(scheduler, 'Ticker', FakeTicker):
+            loop.run_until_complete(run())
+
+        cancelled = []
+
+        class SlowTicker(FakeTicker):
+            async def get_timeseries(self, interval, range_):
+                try:
+                    await asy.sleep(10)
+                except asy.CancelledError:
+                    cancelled.append(self.symbol)
+                    raise
+
+        async def cancel():
+            schedule = scheduler.Scheduler()
+            schedule.add(['a'], 'timeseries', every=60)
+            running = asy.ensure_future(schedule.run())
+            await asy.sleep(0.05)
+            schedule.stop()
+            self.assertIsNone(await running)  # stop ends run quietly
+
+            # cancelled run stops requests in flight and is cancelled itself
+            running = asy.ensure_future(schedule.run())
+            await asy.sleep(0.05)
+            running.cancel()
+            with self.assertRaises(asy.CancelledError):
+                await running
+            await asy.sleep(0)
+            self.assertEqual(cancelled, ['A', 'A'])
+
+        with mock.patch.object(scheduler, 'Ticker', SlowTicker):
+            loop.run_until_complete(cancel())
+
+        # kinds of bulk, refreshed by Ticker methods
+        from aioyfinance import bulk
+        self.assertIs(scheduler.KINDS, bulk.KINDS)
+        self.assertEqual(scheduler.kind_method('profile'), ('get_profile', {}))
+        self.assertEqual(scheduler.kind_method('timeseries'), ('get_timeseries', {'interval': '1m', 'range_': '1d'}))
+        self.assertEqual(scheduler.kind_method('income'), ('get_income', {}))
+
+    def test_journal(self):
+        journal = Journal(':memory:')
+        journal.add('income', ['aapl', 'nvda', 'wrong'])
+        journal.save('income', {'aapl': {'annual': {}}}, {'wrong': 'NameError()'})
+
+        self.assertEqual(journal.queued('income', max_attempts=3), ['nvda', 'wrong'])
+        self.assertEqual(journal.queued('income', max_attempts=1), ['nvda'])
+        self.assertEqual(journal.results('income'), {'aapl': {'annual': {}}})
+        self.assertEqual(journal.failures('income'), {'wrong': ('NameError()', 1)})
+
+    def test_job_resume(self):
+        from aioyfinance import jobs
+        requested = []
+        stop = []
+
+        async def download(symbols, kinds):
+            requested.append(symbols)  # journal queues symbols in order of names
+            if stop and len(requested) == 2:
+                await asy.sleep(10)  # job is stopped during the second chunk
+            results = {symbol: {'close': [1.]} for symbol in symbols if symbol != 'BAD'}
+            errors = {symbol: 'NameError()' for symbol in symbols if symbol == 'BAD'}
+            return {'timeseries': results}, {'timeseries': errors}
+
+        async def stopped(job):
+            task = asy.ensure_future(job.run())
+            await asy.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asy.CancelledError):
+                await task
+
+        with tempfile.TemporaryDirectory() as root, mock.patch.object(jobs, 'download', download):
+            symbols = ['A', 'BAD', 'C', 'D', 'E']
+            job = jobs.Job(f'{root}/job.db', symbols, ['timeseries'], chunk_size=2)
+            stop.append(True)
+            loop.run_until_complete(stopped(job))
+            job.close()
+            self.assertEqual(requested, [['A', 'BAD'], ['C', 'D']])
+
+            # new process, finished symbols are skipped, unfinished and failed ones are requested
+            requested.clear()
+            stop.clear()
+            job = jobs.Job(f'{root}/job.db', symbols, ['timeseries'], chunk_size=2)
+            self.assertEqual(job.status(), {'timeseries': {'done': 1, 'failed': 1, 'pending': 3}})
+            results, errors = loop.run_until_complete(job.run())
+            job.close()
+
+            self.assertEqual(sorted(symbol for chunk in requested for symbol in chunk), ['BAD', 'C', 'D', 'E'])
+            self.assertEqual(sorted(results['timeseries']), ['A', 'C', 'D', 'E'])
+            self.assertEqual(errors, {'timeseries': {'BAD': 'NameError()'}})
+
+    def test_summary(self):
+        summary_json = {'quoteSummary': {'result': [{
+            'summaryDetail': {'maxAge': 1, 'marketCap': {'raw': 5e12, 'fmt': '5T'}, 'beta': {}},
+            'financialData': {'debtToEquity': {'raw': 50.0, 'fmt': '50.00%'}},
+            'assetProfile': {'sector': 'Technology', 'industry': 'Semiconductors'},
+        }], 'error': None}}
+        modules = parse_summary(summary_json, 'NVDA')
+        statistics = map_statistics(modules)
+        self.assertEqual(statistics['MarketCap(intraday)'], 5e12)
+        self.assertEqual(statistics['TotalDebt/Equity(mrq)'], 0.5)
+        self.assertIsNone(statistics['Beta(5YMonthly)'])
+        self.assertEqual(map_profile(modules), {'Sector': 'Technology', 'Industry': 'Semiconductors', 'Name': None})
+
+        with self.assertRaises(NameError):
+            parse_summary({'quoteSummary': {'result': None, 'error': {'code': 'Not Found'}}}, 'WRONG')
+
+    def test_summary_etf(self):
+        from aioyfinance.tickers import Ticker
+
+        async def fake(url, is_json=False):
+            quote_type = 'ETF' if '/FUNDZ?' in url else 'EQUITY'
+            return {'quoteSummary': {'result': [{'quoteType': {'quoteType': quote_type, 'longName': 'Name'},
+                                                 'summaryDetail': {'beta': {'raw': 1.2}}}], 'error': None}}
+
+        with mock.patch.object(Ticker, '_base_request', staticmethod(fake)):
+            # statistics and profile are only for equities, as on the html pages
+            with self.assertRaises(NameError):
+                loop.run_until_complete(Ticker('FUNDZ').get_statistics())
+            statistics = loop.run_until_complete(Ticker('STOCKZ').get_statistics())
+            self.assertEqual(statistics['Beta(5YMonthly)'], 1.2)
+
+    def test_priority(self):
+        async def run():
+            semaphore = PrioritySemaphore(2, reserved=1)
+            await semaphore.acquire(NORMAL)
+            order = []
+
+            async def one(name, priority):
+                await semaphore.acquire(priority)
+                order.append(name)
+
+            waiting = [asy.ensure_future(one(name, priority)) for name, priority in
+                       (('bulk', BULK), ('normal', NORMAL), ('cancelled', INTERACTIVE), ('interactive', INTERACTIVE))]
+            await asy.sleep(0)
+            waiting[2].cancel()
+            self.assertEqual(order, ['normal'])  # bulk can not take the reserved slot
+            semaphore.release()
+            await asy.sleep(0)
+            self.assertEqual(order, ['normal', 'interactive'])
+            semaphore.release()
+            semaphore.release()
+            await asy.gather(*waiting, return_exceptions=True)
+            self.assertEqual(order, ['normal', 'interactive', 'bulk'])
+
+        loop.run_until_complete(run())
+
+    def test_fair_queue(self):
+        async def run():
+            queue = FairQueue()
+            futures = {}
+            for flow, weight in (('a', 1), ('b', 2)):
+                for i in range(4):
+                    futures[loop.create_future()] = flow
+                    queue.push(flow, weight, list(futures)[-1])
+            return [futures[queue.pop()] for _ in range(6)]
+
+        self.assertEqual(loop.run_until_complete(run()), ['a', 'b', 'b', 'a', 'b', 'b'])
+
+    def test_sync_client(self):
+        with yf.SyncClient() as client:
+            future = client.submit(asy.sleep(0, 'done'))
+            self.assertEqual(future.result(5), 'done')
+            tickers = client.tickers(['aapl', 'AAPL'])
+            self.assertEqual(tickers.aliases, {'aapl': 'AAPL', 'AAPL': 'AAPL'})
+            self.assertEqual(tickers['aapl'].ticker, 'AAPL')
+
+    @unittest.skipUnless(importlib.util.find_spec('ijson'), 'needs ijson')
+    def test_stream_chart(self):
+        from aioyfinance.streaming import parse_chart
+        chart = {'chart': {'result': [{
+            'meta': {'currency': 'USD'}, 'timestamp': [1, 2],
+            'indicators': {'quote': [{'close': [None, 1.5], 'volume': [10, 20]}], 'adjclose': [{'adjclose': [1.0, 1.5]}]}
+        }], 'error': None}}
+        body = json.dumps(chart).encode()
+
+        class Stream:
+            position = 0
+
+            async def read(self, size=-1):
+                # tiny chunks split numbers and keys
+                chunk = body[self.position:self.position + (7 if size < 0 else min(size, 7))]
+                self.position += len(chunk)
+                return chunk
+
+        self.assertEqual(loop.run_until_complete(parse_chart(Stream())), chart)
+
+        from aioyfinance.streaming import parse_fundamentals
+        series = {'meta': {'type': ['annualNetIncome']}, 'timestamp': [1],
+                  'annualNetIncome': [{'reportedValue': {'raw': 2.5}}]}
+        padded = [{'meta': {'type': [f'annualEmpty{i}']}} for i in range(3)]
+        body = json.dumps({'timeseries': {'result': [padded[0], series, *padded[1:]], 'error': None}}).encode()
+        parsed = loop.run_until_complete(parse_fundamentals(Stream()))
+        self.assertEqual(parsed, {'timeseries': {'result': [series], 'error': None}})
+        self.assertEqual(strip_old_json(parsed)['annual']['NetIncome']['data'], [2.5])
+
+    def test_error_log(self):
+        log = ErrorLog(size=2)
+        for symbol in ('A', 'B', 'C'):
+            error = NameError(symbol)
+            error.attempts = 3
+            log.add(symbol, 'get_income', error)
+
+        self.assertEqual([record.symbol for record in log], ['B', 'C'])
+        last = list(log)[-1]
+        self.assertEqual(last.attempts, 3)
+        self.assertIsNone(last.exception)
+        self.assertEqual(log.summary(), {'total': 3, 'errors': {'NameError': 3}, 'operations': {'get_income': 3}})
+
+    def test_negative_cache(self):
+        with tempfile.TemporaryDirectory() as root:
+            path = root + '/negative.db'
+            cache = NegativeCache(ttl=60, path=path)
+            cache.add('ZZZZ', ['statistics', 'profile'], 'ZZZZ is ETF probably')
+            cache.close()
+
+            cache = NegativeCache(ttl=60, path=path)
+            self.assertEqual(cache.get('ZZZZ', 'statistics'), 'ZZZZ is ETF probably')
+            self.assertIsNone(cache.get('ZZZZ', 'time_series'))
+            cache.discard('ZZZZ', 'statistics')
+            self.assertEqual(len(cache), 1)
+            cache.close()
+
+        expired = NegativeCache(ttl=-1)
+        expired.add('ZZZZ', ['time_series'], 'Not Found')
+        self.assertIsNone(expired.get('ZZZZ', 'time_series'))
+
+    def test_planner(self):
+        from aioyfinance.tickers import Ticker, Stats
+        from aioyfinance import routing
+        from urllib.parse import urlparse, parse_qs
+        from time import time
+        requested = {'summary': [], 'fundamentals': []}
+
+        async def fake(url, is_json=False):
+            if 'quoteSummary' in url:
+                requested['summary'].append(url)
+                return {'quoteSummary': {'result': [{'quoteType': {'quoteType': 'EQUITY'},
+                                                     'summaryDetail': {'beta': {'raw': 1.}},
+                                                     'assetProfile': {'sector': 'Technology'}}]}}
+            requested['fundamentals'].append(url)
+            types = parse_qs(urlparse(url).query)['type'][0].split(',')
+            return {'timeseries': {'result': [{'meta': {'type': [type_]}, 'timestamp': [int(time()) - 100],
+                                               type_: [{'reportedValue': {'raw': 1.}}]} for type_ in types]}}
+
+        try:
+            with mock.patch.object(Ticker, '_base_request', staticmethod(fake)):
+                ticker = Ticker('PLANZ')
+                kinds = [Stats.STATISTICS, Stats.PROFILE, Stats.INCOME, Stats.INCOME_Q]
+                data = loop.run_until_complete(ticker.get_many(kinds))
+                self.assertEqual(list(data), kinds)
+                self.assertEqual(data[Stats.STATISTICS]['Beta(5YMonthly)'], 1.)
+                self.assertEqual(data[Stats.PROFILE]['Sector'], 'Technology')
+                self.assertEqual(data[Stats.INCOME_Q]['quarterly']['NetIncome']['data'], [1.])
+
+                # statistics and profile by one quote summary, both frequencies of income by one fetch
+                self.assertEqual(len(requested['summary']), 1)
+                self.assertIn('summaryDetail', requested['summary'][0])
+                self.assertIn('assetProfile', requested['summary'][0])
+                self.assertEqual(len(requested['fundamentals']), 1)
+                self.assertIn('annualNetIncome', requested['fundamentals'][0])
+                self.assertIn('quarterlyNetIncome', requested['fundamentals'][0])
+
+                # saved kinds send no request, only the new statement is fetched
+                loop.run_until_complete(ticker.get_many(kinds + [Stats.CASHFLOW]))
+                loop.run_until_complete(ticker.get_statistics_with_profile())
+                self.assertEqual(len(requested['summary']), 1)
+                self.assertEqual(len(requested['fundamentals']), 2)
+                self.assertIn('annualFreeCashFlow', requested['fundamentals'][1])
+                self.assertNotIn('annualNetIncome%2C', requested['fundamentals'][1])
+        finally:
+            routing.ASSET_TYPES.pop('PLANZ', None)
+
+    def test_clear_summary(self):
+        from aioyfinance.tickers import Ticker, Stats
+        requested = []
+
+        async def fake(url, is_json=False):
+            requested.append(url)
+            return {'quoteSummary': {'result': [{'quoteType': {'quoteType': 'EQUITY'},
+                                                 'summaryDetail': {'beta': {'raw': len(requested)}}}]}}
+
+        with mock.patch.object(Ticker, '_base_request', staticmethod(fake)):
+            ticker = Ticker('CLEARZ')
+            self.assertEqual(loop.run_until_complete(ticker.get_statistics())['Beta(5YMonthly)'], 1)
+            loop.run_until_complete(ticker.get_profile())
+            self.assertEqual(len(requested), 1)
+
+            # cleared statistics are requested again, profile modules stay
+            ticker.clear([Stats.STATISTICS])
+            self.assertEqual(loop.run_until_complete(ticker.get_statistics())['Beta(5YMonthly)'], 2)
+            self.assertEqual(len(requested), 2)
+            self.assertNotIn('assetProfile', requested[1])
+
+    def test_routing(self):
+        from aioyfinance.tickers import Ticker
+        from aioyfinance import routing
+        requested = []
+        types = {'ETFZ': 'ETF', 'IDXZ': 'INDEX'}
+
+        async def fake(url, is_json=False):
+            requested.append(url)
+            if not url.startswith(QUERY):
+                raise AssertionError(f'{url} requested for a non-equity')
+            symbol = url[len(QUERY) + 1:].split('?')[0]
+            return {'chart': {'result': [{'meta': {'instrumentType': types[symbol]}, 'timestamp': [1],
+                                          'indicators': {'quote': [{'close': [1.]}]}}]}}
+
+        def fails(coroutine):
+            with self.assertRaises(NameError):
+                loop.run_until_complete(coroutine)
+
+        yf.Config.create(route_types=True)
+        try:
+            with mock.patch.object(Ticker, '_base_request', staticmethod(fake)):
+                # unknown type is looked up by one chart request, then it is known to every Ticker
+                fails(Ticker('ETFZ').get_income())
+                self.assertEqual(len(requested), 1)
+                fails(Ticker('ETFZ').get_balance(annual=False))
+                fails(Ticker('ETFZ').get_statistics())
+                fails(Ticker('ETFZ').get_profile(source='html'))
+                self.assertEqual(loop.run_until_complete(Ticker('ETFZ').get_asset_type()), 'ETF')
+                self.assertEqual(len(requested), 1)
+
+                # charts work for every type, their meta tells the type without lookup
+                yf.Config.create()
+                for symbol in types:
+                    data = loop.run_until_complete(Ticker(symbol).get_timeseries('1d', '1y'))
+                    self.assertEqual(data['close'], [1.])
+                fails(Ticker('IDXZ').get_fundamentals())
+                self.assertEqual(len(requested), 3)
+        finally:
+            yf.Config.create()
+            for symbol in types:
+                routing.ASSET_TYPES.pop(symbol, None)
+
+    def test_negative_timeseries(self):
+        from aioyfinance.tickers import Ticker
+        requested = []
+
+        async def fake(url, is_json=False):
+            requested.append(url)
+            if 'interval=1m' in url:
+                return {'chart': {'result': None, 'error': {'code': 'Unprocessable Entity'}}}
+            if 'WRONG' in url:
+                return {'chart': {'result': None, 'error': {'code': 'Not Found'}}}
+            return {'chart': {'result': [{'meta': {}, 'timestamp': [1], 'indicators': {'quote': [{'close': [1.]}]}}]}}
+
+        yf.Config.create(negative_ttl=60)
+        try:
+            with mock.patch.object(Ticker, '_base_request', staticmethod(fake)):
+                with self.assertRaises(NameError):
+                    loop.run_until_complete(Ticker('AAPL').get_timeseries('1m', '1y'))
+                # error of interval and range is not an error of symbol
+                data = loop.run_until_complete(Ticker('AAPL').get_timeseries('1d', '1y'))
+                self.assertEqual(data['close'], [1.])
+
+                for _ in range(2):
+                    with self.assertRaises(NameError):
+                        loop.run_until_complete(Ticker('WRONG').get_timeseries('1d', '1y'))
+                self.assertEqual(len(requested), 3)  # second WRONG is known to fail
+        finally:
+            yf.Config.create()
+
+    def test_bar_store(self):
+        from aioyfinance.store import BarStore, to_bars
+        with tempfile.TemporaryDirectory() as root:
+            store = BarStore(root)
+            bars = to_bars({'timestamp': [60, 120, 180], 'close': [1.0, 2.0, None], 'volume': [1, 2, 3]})
+            self.assertEqual(store.append('aapl', '1m', bars), 3)
+            forming = to_bars({'timestamp': [180, 240], 'close': [3.0, 4.0]})
+            self.assertEqual(store.append('AAPL', '1m', forming), 1)
+
+            stored = store.read('aapl', '1m')
+            self.assertEqual(list(stored['timestamp']), [60, 120, 180, 240])
+            self.assertEqual(list(stored['close'][2:]), [3.0, 4.0])
+            self.assertEqual(list(store.read('aapl', '1m', start=100, end=200)['timestamp']), [120, 180])
+            self.assertEqual(store.symbols('1m'), ['AAPL'])
+            del stored
+
     def test_ETF(self):
         ticker = yf.Ticker('SPY')
         data = loop.run_until_complete(ticker.get_timeseries('1d', '1mo'))